@@ -0,0 +1,62 @@
+#!/usr/bin/env python3
+"""
+Benchmark - sequential TradesAPI vs AsyncTradesAPI against a stub with latency
+
+Runs with the default transport (no client-side rate limit) and again with
+a limiter capped at LIMITED_RATE req/s, to show what a cap below
+concurrency / latency does to the speedup.
+"""
+
+import asyncio
+import os
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from trades import TradesAPI, AsyncTradesAPI
+from stub_server import StubServer
+
+PAGES = 50
+LATENCY = 0.05
+CONCURRENCY = 10
+# Per-host cap for the limited run; 10 workers at 50 ms would need 200 req/s
+LIMITED_RATE = 20
+
+
+def run_sync(config_path: str) -> float:
+    api = TradesAPI(config_path)
+    started = time.perf_counter()
+    for page in range(1, PAGES + 1):
+        api.get_trades(page=page)
+    return time.perf_counter() - started
+
+
+async def run_async(config_path: str) -> float:
+    async with AsyncTradesAPI(config_path, concurrency=CONCURRENCY) as api:
+        started = time.perf_counter()
+        await asyncio.gather(*(api.get_trades(page=page) for page in range(1, PAGES + 1)))
+        return time.perf_counter() - started
+
+
+def run(label: str, stub: StubServer, tmp: str, **api_options):
+    config_path = stub.write_config(os.path.join(tmp, f"{label.split()[0]}.json"), pool_maxsize=CONCURRENCY,
+                                    **api_options)
+    sync_time = run_sync(config_path)
+    async_time = asyncio.run(run_async(config_path))
+    print(f"{label:<24} sequential: {sync_time * 1000:7.1f} ms  async (concurrency {CONCURRENCY}): "
+          f"{async_time * 1000:7.1f} ms  speedup: {sync_time / async_time:5.1f}x")
+
+
+def main():
+    print(f"{PAGES} x /trades pages, {LATENCY * 1000:.0f} ms simulated latency")
+    print("-" * 100)
+
+    with StubServer(latency=LATENCY) as stub, tempfile.TemporaryDirectory() as tmp:
+        run("default transport", stub, tmp)
+        run(f"rate_limit {LIMITED_RATE} req/s", stub, tmp, rate_limit={"rate": LIMITED_RATE, "burst": 1})
+
+
+if __name__ == "__main__":
+    main()
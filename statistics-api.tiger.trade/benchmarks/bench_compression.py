@@ -0,0 +1,68 @@
+#!/usr/bin/env python3
+"""
+Benchmark - /trades pulls over a throttled link, uncompressed vs negotiated encoding
+
+The stub compresses when asked and limits body writes to LINK_BYTES_PER_SECOND,
+roughly a VPN link. Reports wire/decoded bytes from the BandwidthMeter and
+the effective throughput in decoded bytes per second.
+"""
+
+import json
+import os
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from tiger_api import TigerTradeClient
+from stub_server import StubServer
+
+FIXTURE = os.path.join(os.path.dirname(os.path.abspath(__file__)), "fixtures", "trades_page.json")
+CALLS = 10
+# Trades per response, built by repeating the fixture page
+TRADES_PER_PAGE = 1000
+LINK_BYTES_PER_SECOND = 4 * 1024 * 1024
+
+
+def make_page() -> dict:
+    with open(FIXTURE, 'rb') as f:
+        page = json.load(f)
+    template = page['data']
+    trades = []
+    for i in range(TRADES_PER_PAGE):
+        trade = dict(template[i % len(template)])
+        trade['id'] = TRADES_PER_PAGE - i
+        trades.append(trade)
+    return {**page, "data": trades}
+
+
+def run(label: str, stub: StubServer, tmp: str, **api_options) -> None:
+    client = TigerTradeClient(stub.write_config(os.path.join(tmp, f"{label}.json"), http_cache=False, **api_options))
+    client.trades.get_trades(items_per_page=1)
+    client.transport.bandwidth.reset()
+
+    started = time.perf_counter()
+    for _ in range(CALLS):
+        client.trades.get_trades(items_per_page=TRADES_PER_PAGE)
+    elapsed = time.perf_counter() - started
+
+    totals = client.transport.bandwidth.totals()
+    encodings = client.transport.bandwidth.stats()['/trades']['encodings']
+    print(f"{label:<10} {', '.join(encodings):<9} wire: {totals['wire_bytes'] / 1024 / 1024:6.2f} MB  "
+          f"decoded: {totals['decoded_bytes'] / 1024 / 1024:6.2f} MB  time: {elapsed * 1000:7.0f} ms  "
+          f"throughput: {totals['decoded_bytes'] / elapsed / 1024 / 1024:6.2f} MB/s")
+
+
+def main():
+    page = make_page()
+    print(f"{CALLS} x /trades ({TRADES_PER_PAGE} trades), link {LINK_BYTES_PER_SECOND / 1024 / 1024:.0f} MB/s")
+    print("-" * 96)
+    with tempfile.TemporaryDirectory() as tmp, \
+            StubServer({"/trades": page}, compress=True, bandwidth=LINK_BYTES_PER_SECOND) as stub:
+        run("identity", stub, tmp, accept_encoding=False)
+        run("negotiated", stub, tmp)
+
+
+if __name__ == "__main__":
+    main()
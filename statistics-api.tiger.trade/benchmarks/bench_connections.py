@@ -0,0 +1,46 @@
+#!/usr/bin/env python3
+"""
+Benchmark - new TCP connections per 100 calls, bare requests vs pooled Transport
+"""
+
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import requests
+
+from tiger_api import Transport
+from stub_server import StubServer
+
+CALLS = 100
+
+
+def run(label: str, call) -> None:
+    with StubServer() as stub:
+        headers = {'Authorization': f'Bearer {stub.token}'}
+        url = f"{stub.base_url}/trades/categories"
+
+        started = time.perf_counter()
+        for _ in range(CALLS):
+            call(url, headers)
+        elapsed = time.perf_counter() - started
+
+        print(f"{label:<20} connections: {stub.connections:>4}  "
+              f"time: {elapsed * 1000:8.1f} ms")
+
+
+def main():
+    print(f"New connections per {CALLS} calls")
+    print("-" * 50)
+
+    run("requests.get", lambda url, headers: requests.get(url, headers=headers, timeout=10))
+
+    transport = Transport()
+    run("Transport", lambda url, headers: transport.request('GET', url, headers=headers, timeout=10))
+    transport.close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,86 @@
+#!/usr/bin/env python3
+"""
+Benchmark - JSON backends over recorded response payloads
+
+For every installed backend (orjson, msgspec, ujson, stdlib json) times
+loads() and dumps(indent=2) of each fixture, then decode_records() into
+typed records next to a plain loads(). Fixtures are benchmarks/fixtures/*.json;
+pass more files or directories of recorded bodies as arguments.
+"""
+
+import glob
+import os
+import sys
+import timeit
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from tiger_api import serialization
+from tiger_api.records import Summary, Trade, Week, decode_records, msgspec
+
+FIXTURES_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "fixtures")
+# Fixture name -> (record type, many) for the typed-decoding comparison
+RECORDS = {
+    "trades_page": (Trade, True),
+    "week_list": (Week, True),
+    "analyzer_summary": (Summary, False),
+}
+REPEAT = 3
+
+
+def load_fixtures(paths):
+    files = []
+    for path in paths:
+        files.extend(sorted(glob.glob(os.path.join(path, "*.json"))) if os.path.isdir(path) else [path])
+    fixtures = {}
+    for path in files:
+        with open(path, 'rb') as f:
+            fixtures[os.path.splitext(os.path.basename(path))[0]] = f.read()
+    return fixtures
+
+
+def per_call_us(func) -> float:
+    timer = timeit.Timer(func)
+    # autorange picks a loop count that runs for at least 0.2 s
+    number, _ = timer.autorange()
+    return min(timer.repeat(REPEAT, number)) / number * 1e6
+
+
+def main():
+    fixtures = load_fixtures(sys.argv[1:] or [FIXTURES_DIR])
+    backends = serialization.available_backends()
+    width = max(len(name) for name in fixtures)
+
+    print(f"Backends: {', '.join(backends)}  (microseconds per call)")
+    for operation in ("loads", "dumps"):
+        print()
+        print(f"{operation:<{width}}  " + "".join(f"{name:>10}" for name in backends))
+        print("-" * (width + 2 + 10 * len(backends)))
+        for name, body in fixtures.items():
+            document = serialization.loads(body)
+            cells = []
+            for backend_name in backends:
+                backend = serialization.set_backend(backend_name)
+                if operation == "loads":
+                    cells.append(per_call_us(lambda: backend.loads(body)))
+                else:
+                    cells.append(per_call_us(lambda: backend.dumps(document, 2)))
+            print(f"{name:<{width}}  " + "".join(f"{cell:10.1f}" for cell in cells))
+
+    serialization.set_backend()
+    mode = "msgspec Structs" if msgspec is not None else "slotted records from dicts"
+    print()
+    print(f"Typed decoding ({mode}, loads via {serialization.get_backend().name})")
+    print(f"{'':<{width}}  {'loads':>10}{'records':>10}")
+    print("-" * (width + 22))
+    for name, (record, many) in RECORDS.items():
+        if name not in fixtures:
+            continue
+        body = fixtures[name]
+        plain = per_call_us(lambda: serialization.loads(body))
+        typed = per_call_us(lambda: decode_records(body, record, many))
+        print(f"{name:<{width}}  {plain:10.1f}{typed:10.1f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,83 @@
+#!/usr/bin/env python3
+"""
+Benchmark - memory of trades as list of dicts vs TradeTable
+"""
+
+import gc
+import json
+import os
+import random
+import sys
+import time
+import tracemalloc
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from tiger_api import TradeTable
+
+TRADES = 200_000
+SYMBOLS = [f"{base}USDT" for base in ("BTC", "ETH", "SOL", "XRP", "DOGE", "ADA", "BNB", "LTC")]
+
+
+def make_payload(count: int) -> str:
+    rng = random.Random(42)
+    trades = []
+    start = 1_700_000_000
+    for i in range(count):
+        opened = start + i * 60
+        trades.append({
+            "id": count - i,
+            "symbol": rng.choice(SYMBOLS),
+            "side": rng.choice(("BUY", "SELL")),
+            "status": rng.choice(("closed", "closed", "closed", "open")),
+            "pnl": f"{rng.uniform(-50, 50):.8f}",
+            "volume": f"{rng.uniform(0, 10_000):.6f}",
+            "open_time": opened,
+            "close_time": opened + rng.randint(1, 3600),
+        })
+    return json.dumps({"data": trades, "total": count})
+
+
+def measure(build):
+    gc.collect()
+    tracemalloc.start()
+    started = time.perf_counter()
+    result = build()
+    elapsed = time.perf_counter() - started
+    current, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return result, current, elapsed
+
+
+def main():
+    payload = make_payload(TRADES)
+    print(f"{TRADES:,} trades")
+    print("-" * 50)
+
+    trades, dict_bytes, _ = measure(lambda: json.loads(payload)["data"])
+    table, table_bytes, build_time = measure(lambda: TradeTable.from_trades(trades))
+
+    started = time.perf_counter()
+    dict_pnl = sum(float(trade.get('pnl')) for trade in trades)
+    dict_sum_time = time.perf_counter() - started
+
+    print(f"list of dicts: {dict_bytes / 2 ** 20:8.1f} MiB")
+    print(f"TradeTable:    {table_bytes / 2 ** 20:8.1f} MiB  (built in {build_time:.2f} s)")
+    print(f"ratio:         {dict_bytes / table_bytes:8.1f}x")
+    print(f"sum(pnl) dicts: {dict_sum_time * 1000:8.1f} ms")
+
+    try:
+        import numpy  # noqa: F401
+    except ImportError:
+        return
+
+    started = time.perf_counter()
+    columns = table.to_numpy(decode_categoricals=False)
+    table_pnl = columns["pnl"].sum()
+    numpy_sum_time = time.perf_counter() - started
+    assert abs(table_pnl - dict_pnl) < 1e-6 * max(1.0, abs(dict_pnl))
+    print(f"sum(pnl) numpy: {numpy_sum_time * 1000:8.1f} ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,61 @@
+#!/usr/bin/env python3
+"""
+Benchmark - cost of the request hooks and the built-in MetricsCollector
+
+Times the start/end events of one request with no handlers and with the
+collector subscribed, against the round trip of a /trades call to the
+local stub, then prints the collector's JSON summary of those calls.
+"""
+
+import os
+import sys
+import tempfile
+import time
+import timeit
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from tiger_api import Hooks, MetricsCollector, TigerTradeClient
+from tiger_api.http_cache import CachedResponse
+from stub_server import StubServer
+
+CALLS = 500
+EVENTS_REPEAT = 5
+
+
+def events_us(hooks: Hooks) -> float:
+    response = CachedResponse("http://stub/trades/123/orders", 200, {}, b'{"data": []}')
+
+    def request():
+        hooks.end(hooks.start('GET', response.url), response)
+
+    timer = timeit.Timer(request)
+    number, _ = timer.autorange()
+    return min(timer.repeat(EVENTS_REPEAT, number)) / number * 1e6
+
+
+def main():
+    bare = events_us(Hooks())
+    collected = Hooks()
+    collected.subscribe(MetricsCollector())
+    with_collector = events_us(collected)
+
+    with tempfile.TemporaryDirectory() as tmp, StubServer({"/trades": {"status": "success", "data": []}}) as stub:
+        client = TigerTradeClient(stub.write_config(os.path.join(tmp, "config.json"), http_cache=False,
+                                                     rate_limit=False))
+        client.trades.get_trades()
+        client.transport.metrics.reset()
+        started = time.perf_counter()
+        for _ in range(CALLS):
+            client.trades.get_trades()
+        round_trip = (time.perf_counter() - started) / CALLS * 1e6
+
+        print(f"hook events per request (us): no handlers {bare:6.1f}  with collector {with_collector:6.1f}")
+        print(f"/trades round trip to the stub (us): {round_trip:8.1f}  "
+              f"(collector share {(with_collector - bare) / round_trip:.1%})")
+        print()
+        print(client.transport.metrics.to_json())
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,120 @@
+#!/usr/bin/env python3
+"""
+Benchmark - startup cost of a script: import time and wall-clock to the first cached result
+
+Run with --check to exit non-zero when a measurement is over budget.
+"""
+
+import os
+import subprocess
+import sys
+import tempfile
+import time
+
+SCRIPTS_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, SCRIPTS_DIR)
+
+from stub_server import StubServer
+
+RUNS = 5
+# Budgets in milliseconds; generous enough for slow CI machines
+IMPORT_BUDGET_MS = 60
+FIRST_RESULT_BUDGET_MS = 250
+# Modules a plain `import trades` must not load
+HEAVY_MODULES = ("requests", "urllib3", "numpy", "pandas", "pyarrow", "asyncio", "concurrent.futures")
+
+FIRST_RESULT = (
+    "import sys, trades; "
+    "api = trades.TradesAPI(sys.argv[1]); "
+    "result = api.get_trades(page=1, items_per_page=20); "
+    "assert len(result['data']) == 20"
+)
+
+
+def python(*args: str, env=None) -> subprocess.CompletedProcess:
+    return subprocess.run([sys.executable, *args], cwd=SCRIPTS_DIR, env=env,
+                          capture_output=True, text=True, check=True)
+
+
+def import_time_ms() -> float:
+    """Best cumulative `-X importtime` figure for `import trades`."""
+    best = None
+    for _ in range(RUNS):
+        stderr = python("-X", "importtime", "-c", "import trades").stderr
+        for line in stderr.splitlines():
+            fields = [field.strip() for field in line.split('|')]
+            if len(fields) == 3 and fields[2] == "trades":
+                total = int(fields[1]) / 1000
+                best = total if best is None else min(best, total)
+    return best
+
+
+def loaded_heavy_modules() -> list:
+    """Heavy modules actually executed (not just registered lazily) by `import trades`."""
+    code = (
+        "import sys, types, trades\n"
+        f"for name in {HEAVY_MODULES!r}:\n"
+        "    # lazy_import() placeholders turn into plain modules once executed\n"
+        "    if type(sys.modules.get(name)) is types.ModuleType:\n"
+        "        print(name)\n"
+    )
+    return python("-c", code).stdout.split()
+
+
+def wall_clock_ms(*args: str, env=None) -> float:
+    """Best of RUNS wall-clock times for a fresh interpreter running `args`."""
+    best = None
+    for _ in range(RUNS):
+        started = time.perf_counter()
+        python(*args, env=env)
+        elapsed = (time.perf_counter() - started) * 1000
+        best = elapsed if best is None else min(best, elapsed)
+    return best
+
+
+def first_result_ms(env: dict, config_path: str) -> float:
+    return wall_clock_ms("-c", FIRST_RESULT, config_path, env=env)
+
+
+def main():
+    check = "--check" in sys.argv
+    trades = [{"id": i, "symbol": "BTCUSDT", "side": "BUY", "pnl": i} for i in range(20)]
+
+    with tempfile.TemporaryDirectory() as tmp:
+        env = dict(os.environ, XDG_CACHE_HOME=os.path.join(tmp, "cache"))
+        with StubServer({"/trades": {"data": trades, "total": 20}}) as stub:
+            config_path = stub.write_config(
+                os.path.join(tmp, "config.json"),
+                response_cache={"enabled": True, "directory": os.path.join(tmp, "responses")},
+            )
+            # Record once against the stub, then replay offline with the server gone
+            python("-c", FIRST_RESULT, config_path, env=env)
+        offline_env = dict(env, TIGER_API_OFFLINE="1")
+
+        imports = import_time_ms()
+        heavy = loaded_heavy_modules()
+        first = first_result_ms(offline_env, config_path)
+        interpreter = wall_clock_ms("-c", "pass")
+
+    print("Startup of `import trades` and the first cached /trades result")
+    print("-" * 62)
+    print(f"import trades (-X importtime):   {imports:8.1f} ms  (budget {IMPORT_BUDGET_MS} ms)")
+    print(f"heavy modules loaded on import:  {', '.join(heavy) or 'none'}")
+    print(f"bare interpreter start:          {interpreter:8.1f} ms")
+    print(f"first cached result (offline):   {first:8.1f} ms  (budget {FIRST_RESULT_BUDGET_MS} ms)")
+
+    over = []
+    if imports > IMPORT_BUDGET_MS:
+        over.append("import time")
+    if heavy:
+        over.append("heavy imports")
+    if first > FIRST_RESULT_BUDGET_MS:
+        over.append("first result")
+    if over:
+        print(f"Over budget: {', '.join(over)}")
+        if check:
+            sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
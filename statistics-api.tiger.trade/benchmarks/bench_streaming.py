@@ -0,0 +1,91 @@
+#!/usr/bin/env python3
+"""
+Benchmark - large /trades page: buffered get_trades vs streamed stream_trades
+
+Reports time to the first trade, total time and peak Python memory while
+summing pnl over every trade. The stub runs in a child process so its own
+encoding of the payload is not counted.
+"""
+
+import gc
+import multiprocessing
+import os
+import sys
+import tempfile
+import time
+import tracemalloc
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from tiger_api import TigerTradeClient
+from stub_server import StubServer
+
+TRADES = 100_000
+
+
+def serve(config_path: str, ready) -> None:
+    trades = [{"id": TRADES - i, "symbol": "BTCUSDT", "side": "BUY", "status": "closed",
+               "pnl": f"{(i % 100) - 50:.8f}", "volume": "1000.000000",
+               "open_time": 1_700_000_000 + i * 60, "close_time": 1_700_000_100 + i * 60}
+              for i in range(TRADES)]
+    stub = StubServer({"/trades": {"status": "success", "data": trades, "total": TRADES}})
+    stub.write_config(config_path, http_cache=False)
+    stub.start()
+    ready.set()
+    while True:
+        time.sleep(60)
+
+
+def measure(consume):
+    # Timed and traced in separate runs: tracemalloc slows every allocation
+    gc.collect()
+    started = time.perf_counter()
+    first_at, total = consume(started)
+    elapsed = time.perf_counter() - started
+
+    gc.collect()
+    tracemalloc.start()
+    consume(time.perf_counter())
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return first_at, elapsed, peak, total
+
+
+def main():
+    with tempfile.TemporaryDirectory() as tmp:
+        config_path = os.path.join(tmp, "config.json")
+        ready = multiprocessing.Event()
+        server = multiprocessing.Process(target=serve, args=(config_path, ready), daemon=True)
+        server.start()
+        ready.wait()
+
+        try:
+            client = TigerTradeClient(config_path)
+            client.trades.get_trades(items_per_page=1)
+
+            def buffered(started):
+                result = client.trades.get_trades(items_per_page=TRADES)
+                first_at = time.perf_counter() - started
+                return first_at, sum(float(trade['pnl']) for trade in result['data'])
+
+            def streamed(started):
+                first_at = None
+                total = 0.0
+                for trade in client.trades.stream_trades(items_per_page=TRADES):
+                    if first_at is None:
+                        first_at = time.perf_counter() - started
+                    total += float(trade['pnl'])
+                return first_at, total
+
+            print(f"{TRADES:,} trades in one /trades response")
+            print("-" * 66)
+            for label, consume in (("get_trades", buffered), ("stream_trades", streamed)):
+                first_at, elapsed, peak, total = measure(consume)
+                print(f"{label:<14} first: {first_at * 1000:7.1f} ms  total: {elapsed * 1000:7.1f} ms  "
+                      f"peak: {peak / 1024 / 1024:6.1f} MB  pnl: {total:.0f}")
+        finally:
+            server.terminate()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,160 @@
+"""
+Local stub of the Tiger Trade gateway and auth API for benchmarks
+"""
+
+import base64
+import gzip
+import json
+import socket
+import threading
+import time
+import zlib
+from http.server import ThreadingHTTPServer, BaseHTTPRequestHandler
+from typing import Dict, Any, Callable, Optional
+
+
+def make_jwt(expires_in: float = 3600) -> str:
+    def encode(part: Dict[str, Any]) -> str:
+        return base64.urlsafe_b64encode(json.dumps(part).encode()).rstrip(b'=').decode()
+    return f"{encode({'alg': 'none'})}.{encode({'exp': time.time() + expires_in})}.stub"
+
+
+class StubServer:
+    """Threaded HTTP/1.1 server; `routes` maps GET paths to payloads or callables.
+
+    A callable route receives the request handler and returns a payload or a
+    (status, payload) / (status, payload, headers) tuple. With `compress` the
+    body is gzip/deflate-encoded when the request accepts it; `bandwidth`
+    (bytes per second) throttles body writes to emulate a slow link.
+    """
+
+    def __init__(self, routes: Optional[Dict[str, Any]] = None, latency: float = 0.0,
+                 compress: bool = False, bandwidth: Optional[float] = None):
+        self.routes = routes if routes is not None else {}
+        self.latency = latency
+        self.compress = compress
+        self.bandwidth = bandwidth
+        self.token = make_jwt()
+        self.connections = 0
+        self.requests = 0
+        self.auth_calls = 0
+        self._lock = threading.Lock()
+        self._server = ThreadingHTTPServer(("127.0.0.1", 0), self._handler())
+        self._server.daemon_threads = True
+        self._thread = None
+
+    @property
+    def base_url(self) -> str:
+        return f"http://127.0.0.1:{self._server.server_address[1]}"
+
+    def start(self) -> "StubServer":
+        self._thread = threading.Thread(target=self._server.serve_forever, daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self):
+        self._server.shutdown()
+        self._server.server_close()
+
+    def __enter__(self) -> "StubServer":
+        return self.start()
+
+    def __exit__(self, *exc):
+        self.stop()
+
+    def write_config(self, path: str, **api_options) -> str:
+        config = {
+            "api": {
+                "base_url": self.base_url,
+                "auth_url": f"{self.base_url}/login",
+                "refresh_url": f"{self.base_url}/refresh",
+                "timeout": 30,
+                **api_options,
+            },
+            "auth": {
+                "username": "bench",
+                "password": "bench",
+                "access_token": self.token,
+                "refresh_token": "bench",
+                "token_file": f"{path}.tokens",
+            },
+        }
+        with open(path, 'w', encoding='utf-8') as f:
+            json.dump(config, f, indent=4)
+        return path
+
+    def _count(self, field: str):
+        with self._lock:
+            setattr(self, field, getattr(self, field) + 1)
+
+    def _handler(self):
+        stub = self
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = "HTTP/1.1"
+
+            def log_message(self, *args):
+                pass
+
+            def setup(self):
+                stub._count('connections')
+                self.request.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+                super().setup()
+
+            def send_json(self, status: int, payload: Any, headers: Optional[Dict[str, str]] = None):
+                # 304 carries no body
+                body = json.dumps(payload).encode() if status != 304 else b''
+                encoding = self.content_encoding() if body else None
+                if encoding == "gzip":
+                    body = gzip.compress(body, 6)
+                elif encoding == "deflate":
+                    body = zlib.compress(body, 6)
+                self.send_response(status)
+                self.send_header("Content-Type", "application/json")
+                if encoding:
+                    self.send_header("Content-Encoding", encoding)
+                for key, value in (headers or {}).items():
+                    self.send_header(key, value)
+                self.send_header("Content-Length", str(len(body)))
+                self.end_headers()
+                self.write_body(body)
+
+            def content_encoding(self) -> Optional[str]:
+                if not stub.compress:
+                    return None
+                accepted = [part.split(';')[0].strip() for part in self.headers.get("Accept-Encoding", "").split(',')]
+                return next((encoding for encoding in ("gzip", "deflate") if encoding in accepted), None)
+
+            def write_body(self, body: bytes):
+                if not stub.bandwidth:
+                    self.wfile.write(body)
+                    return
+                step = 16 * 1024
+                for offset in range(0, len(body), step):
+                    chunk = body[offset:offset + step]
+                    self.wfile.write(chunk)
+                    time.sleep(len(chunk) / stub.bandwidth)
+
+            def do_POST(self):
+                self.rfile.read(int(self.headers.get("Content-Length", 0)))
+                stub._count('auth_calls')
+                stub.token = make_jwt()
+                self.send_json(200, {"accessToken": stub.token},
+                               {"Set-Cookie": "refreshToken=bench; Path=/"})
+
+            def do_GET(self):
+                stub._count('requests')
+                if stub.latency:
+                    time.sleep(stub.latency)
+                if self.headers.get("Authorization") != f"Bearer {stub.token}":
+                    return self.send_json(401, {"detail": "Unauthorized"})
+
+                path = self.path.split('?', 1)[0]
+                route: Callable = stub.routes.get(path, {"status": "success", "data": []})
+                payload = route(self) if callable(route) else route
+                if isinstance(payload, tuple):
+                    self.send_json(*payload)
+                else:
+                    self.send_json(200, payload)
+
+        return Handler
@@ -0,0 +1,19 @@
+import os
+import sys
+
+import pytest
+
+SCRIPTS_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+BENCHMARKS_DIR = os.path.join(SCRIPTS_DIR, "benchmarks")
+FIXTURES_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "fixtures")
+
+# tiger_api and the stub server are imported the way the scripts and benchmarks do
+sys.path.insert(0, SCRIPTS_DIR)
+sys.path.insert(0, BENCHMARKS_DIR)
+
+
+@pytest.fixture(autouse=True)
+def cache_home(tmp_path, monkeypatch):
+    """Keep on-disk caches and token files out of the user's cache directory."""
+    monkeypatch.setenv("XDG_CACHE_HOME", str(tmp_path / "cache"))
+    return tmp_path
@@ -0,0 +1,65 @@
+import asyncio
+import threading
+import time
+
+from tiger_api import AsyncAPI
+from tiger_api.streaming import ItemStream
+
+
+class FakeClient:
+    def __init__(self):
+        self.threads = []
+        self.closed = False
+
+    def get_value(self, value):
+        time.sleep(0.01)
+        return value
+
+    def iter_values(self, count):
+        for value in range(count):
+            self.threads.append(threading.current_thread())
+            yield value
+
+    def stream_values(self, count):
+        def close():
+            self.closed = True
+        return ItemStream(self.iter_values(count), {"total": count}, on_close=close)
+
+
+def test_generator_methods_iterate_on_the_pool():
+    client = FakeClient()
+
+    async def collect():
+        async with AsyncAPI(client=client) as api:
+            return [value async for value in api.iter_values(3)]
+
+    assert asyncio.run(collect()) == [0, 1, 2]
+    assert client.threads and threading.main_thread() not in client.threads
+
+
+def test_iterator_results_become_async_iterators():
+    client = FakeClient()
+
+    async def collect():
+        async with AsyncAPI(client=client) as api:
+            async with await api.stream_values(5) as values:
+                first = [value async for value in values if value < 2]
+                return first, values.meta
+
+    assert asyncio.run(collect()) == ([0, 1], {"total": 5})
+    assert client.closed
+    assert threading.main_thread() not in client.threads
+
+
+def test_one_api_serves_several_event_loops():
+    api = AsyncAPI(client=FakeClient(), concurrency=1)
+
+    async def gather():
+        # Two calls under concurrency=1: the second waits on the semaphore
+        return await asyncio.gather(api.get_value(1), api.get_value(2))
+
+    try:
+        assert asyncio.run(gather()) == [1, 2]
+        assert asyncio.run(gather()) == [1, 2]
+    finally:
+        api.close()
@@ -0,0 +1,35 @@
+import threading
+
+from stub_server import StubServer, make_jwt
+from tiger_api import TigerTradeClient
+
+CONCURRENT_REQUESTS = 16
+
+
+def test_concurrent_401s_refresh_once(tmp_path):
+    with StubServer({"/trades": {"status": "success", "data": []}}, latency=0.05) as stub:
+        client = TigerTradeClient(stub.write_config(str(tmp_path / "config.json"), http_cache=False))
+        client.trades.get_trades()
+        auth_calls = stub.auth_calls
+
+        # The gateway stops accepting the token every thread is about to send
+        stub.token = make_jwt()
+        barrier = threading.Barrier(CONCURRENT_REQUESTS)
+        results, errors = [], []
+
+        def request():
+            barrier.wait()
+            try:
+                results.append(client.trades.get_trades())
+            except Exception as e:
+                errors.append(e)
+
+        threads = [threading.Thread(target=request) for _ in range(CONCURRENT_REQUESTS)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        assert errors == []
+        assert len(results) == CONCURRENT_REQUESTS
+        assert stub.auth_calls - auth_calls == 1
@@ -0,0 +1,21 @@
+import math
+
+from tiger_api import TradeTable
+
+
+def test_bad_ids_become_sentinels():
+    trades = [
+        {"id": 7, "api_key_id": 101, "pnl": "1.5", "symbol": "BTCUSDT"},
+        {"id": None, "api_key_id": "abc", "pnl": None},
+        {"pnl": "2"},
+        {"id": "x-12", "api_key_id": "102", "pnl": "bad"},
+        {"id": "42", "api_key_id": 103, "pnl": 3},
+    ]
+    table = TradeTable.from_trades(trades)
+
+    assert len(table) == len(trades)
+    assert list(table.numeric["id"]) == [7, -1, -1, -1, 42]
+    assert list(table.numeric["api_key_id"]) == [101, -1, -1, 102, 103]
+    pnl = list(table.numeric["pnl"])
+    assert pnl[0] == 1.5 and math.isnan(pnl[1]) and math.isnan(pnl[3]) and pnl[4] == 3.0
+    assert table.row(0).symbol == "BTCUSDT" and table.row(1).symbol is None
@@ -0,0 +1,58 @@
+import json
+import os
+
+import pytest
+
+from conftest import FIXTURES_DIR
+
+pytest.importorskip("numpy")
+
+from tiger_api import LocalAnalyzer
+
+
+def load_fixture(name):
+    with open(os.path.join(FIXTURES_DIR, name), encoding='utf-8') as f:
+        return json.load(f)
+
+
+# Trades one millisecond either side of the range bounds, several api keys
+# and /analyzer responses for their ranges, summed by hand
+FIXTURE = load_fixture("analyzer_ranges.json")
+
+
+@pytest.fixture(scope="module")
+def analyzer():
+    return LocalAnalyzer.from_trades(FIXTURE["trades"])
+
+
+def assert_matches(metrics, data):
+    assert metrics["count"] == data["count"]
+    assert metrics["win_count"] == data["win_count"]
+    assert metrics["net_profit"] == pytest.approx(float(data["net_profit"]))
+    assert metrics["volume"] == pytest.approx(float(data["volume"]))
+    assert metrics["win_rate"] == pytest.approx(data["win_rate"])
+
+
+@pytest.mark.parametrize("case", FIXTURE["summaries"],
+                         ids=lambda case: f"{case['openBetween']}-keys{case['api_key_ids']}")
+def test_summary_matches_analyzer_response(analyzer, case):
+    assert_matches(analyzer.summary(case["openBetween"], case["api_key_ids"]), case["response"]["data"])
+
+
+def test_summaries_answers_several_ranges_in_one_call(analyzer):
+    cases = [case for case in FIXTURE["summaries"] if case["api_key_ids"] is None]
+    result = analyzer.summaries([case["openBetween"] for case in cases])
+
+    assert list(result) == [case["openBetween"] for case in cases]
+    for case in cases:
+        assert_matches(result[case["openBetween"]][None], case["response"]["data"])
+
+
+def test_summaries_per_key(analyzer):
+    by_key = {case["api_key_ids"][0]: case["response"]["data"]
+              for case in FIXTURE["summaries"] if case["api_key_ids"]}
+    result = analyzer.summaries(["2026-09-01,2026-09-07"], api_key_ids=sorted(by_key))["2026-09-01,2026-09-07"]
+
+    assert sorted(result) == sorted(by_key)
+    for key_id, data in by_key.items():
+        assert_matches(result[key_id], data)
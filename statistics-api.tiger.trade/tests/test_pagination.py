@@ -0,0 +1,68 @@
+import threading
+from urllib.parse import parse_qsl, urlsplit
+
+import pytest
+
+from stub_server import StubServer
+from tiger_api import TigerTradeClient
+
+PAGE_SIZE = 10
+
+
+class GrowingTrades:
+    """/trades route sorted by id descending; `arrivals` new trades land after page 1 is served."""
+
+    def __init__(self, count, arrivals):
+        self.trades = [{"id": trade_id, "status": "closed"} for trade_id in range(count, 0, -1)]
+        self.arrivals = arrivals
+        self.lock = threading.Lock()
+
+    def __call__(self, handler):
+        query = dict(parse_qsl(urlsplit(handler.path).query))
+        page, items_per_page = int(query["page"]), int(query["items_per_page"])
+        with self.lock:
+            offset = (page - 1) * items_per_page
+            payload = {"status": "success", "total": len(self.trades),
+                       "data": self.trades[offset:offset + items_per_page]}
+            if page == 1:
+                newest = self.trades[0]["id"]
+                self.trades[:0] = [{"id": newest + i, "status": "open"} for i in range(self.arrivals, 0, -1)]
+        return payload
+
+
+def test_fetch_all_trades_follows_rows_pushed_past_the_last_page(tmp_path):
+    route = GrowingTrades(25, arrivals=6)
+    with StubServer({"/trades": route}) as stub:
+        client = TigerTradeClient(stub.write_config(str(tmp_path / "config.json"), http_cache=False))
+        result = client.trades.fetch_all_trades(page_size=PAGE_SIZE, workers=3)
+
+    ids = [trade["id"] for trade in result["data"]]
+    assert len(ids) == len(set(ids))
+    # Every trade that existed when the scan started, including the shifted tail
+    assert set(range(1, 26)) <= set(ids)
+
+
+def test_fetch_all_trades_keeps_trades_without_id(tmp_path):
+    page = {"status": "success", "total": 3, "data": [{"id": None, "pnl": "1"}, {"pnl": "2"}, {"id": 7}]}
+    with StubServer({"/trades": page}) as stub:
+        client = TigerTradeClient(stub.write_config(str(tmp_path / "config.json"), http_cache=False))
+        result = client.trades.fetch_all_trades(page_size=PAGE_SIZE)
+
+    assert len(result["data"]) == 3
+
+
+def test_iter_trades_accepts_items_per_page(tmp_path):
+    route = GrowingTrades(25, arrivals=0)
+    with StubServer({"/trades": route}) as stub:
+        client = TigerTradeClient(stub.write_config(str(tmp_path / "config.json"), http_cache=False))
+        ids = [trade["id"] for trade in client.trades.iter_trades(items_per_page=PAGE_SIZE, prefetch=1)]
+        all_ids = [trade["id"] for trade in client.trades.fetch_all_trades({"items_per_page": PAGE_SIZE})["data"]]
+
+    assert ids == all_ids == list(range(25, 0, -1))
+
+
+def test_iter_trades_rejects_page(tmp_path):
+    with StubServer() as stub:
+        client = TigerTradeClient(stub.write_config(str(tmp_path / "config.json"), http_cache=False))
+        with pytest.raises(TypeError, match="page"):
+            next(client.trades.iter_trades(page=2))
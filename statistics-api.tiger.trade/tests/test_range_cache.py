@@ -0,0 +1,55 @@
+from datetime import date
+
+from tiger_api.range_cache import RangeCache
+
+TODAY = date(2026, 10, 17)
+
+
+class Fetcher:
+    def __init__(self, *responses):
+        self.responses = list(responses)
+        self.calls = []
+
+    def __call__(self, open_between):
+        self.calls.append(open_between)
+        return self.responses.pop(0) if self.responses else summary(1)
+
+
+def summary(count):
+    return {"status": "success", "data": {"count": count, "net_profit": str(count)}}
+
+
+def test_closed_day_is_cached_for_good():
+    fetch = Fetcher()
+    cache = RangeCache(today=lambda: TODAY, clock=lambda: 0.0)
+    cache.get("2026-10-16,2026-10-16", fetch)
+    cache.clock = lambda: 1e9
+    cache.get("2026-10-16,2026-10-16", fetch)
+    assert len(fetch.calls) == 1
+
+
+def test_error_payload_is_not_cached():
+    error = {"status": "error", "message": "try again"}
+    fetch = Fetcher(error)
+    cache = RangeCache(today=lambda: TODAY)
+
+    assert cache.get("2026-10-16,2026-10-16", fetch) == error
+    assert cache.get("2026-10-16,2026-10-16", fetch) == summary(1)
+    assert len(fetch.calls) == 2
+
+
+def test_failed_bucket_falls_back_to_a_direct_query():
+    fetch = Fetcher(summary(1), {"status": "error"})
+    cache = RangeCache(today=lambda: TODAY, workers=1)
+
+    assert cache.get("2026-10-14,2026-10-15", fetch) == summary(1)
+    assert fetch.calls[-1] == "2026-10-14,2026-10-15"
+    assert cache.additive
+
+
+def test_cold_range_is_one_query():
+    fetch = Fetcher()
+    cache = RangeCache(bucket="week", today=lambda: TODAY)
+    cache.get("2025-01-01,2025-12-31", fetch)
+    cache.get("2025-01-01,2025-12-31", fetch)
+    assert fetch.calls == ["2025-01-01,2025-12-31"]
@@ -0,0 +1,85 @@
+import pytest
+
+from tiger_api.ratelimit import MIN_RATE, RateLimiter
+
+URL = "https://statistics-api.tiger.trade/trades"
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+        self.sleeps = []
+
+    def __call__(self):
+        return self.now
+
+    def sleep(self, seconds):
+        self.sleeps.append(seconds)
+        self.now += seconds
+
+
+@pytest.fixture
+def clock():
+    return FakeClock()
+
+
+def limiter(clock, **options):
+    return RateLimiter(clock=clock, sleep=clock.sleep, **options)
+
+
+def test_bucket_refills_at_rate(clock):
+    rate_limiter = limiter(clock, rate=10, burst=2)
+    rate_limiter.acquire(URL)
+    rate_limiter.acquire(URL)
+    assert clock.sleeps == []
+
+    rate_limiter.acquire(URL)
+    assert clock.sleeps == [pytest.approx(0.1)]
+
+    clock.now += 0.2
+    rate_limiter.acquire(URL)
+    rate_limiter.acquire(URL)
+    assert len(clock.sleeps) == 1
+
+
+def test_host_override(clock):
+    rate_limiter = limiter(clock, rate=100, burst=1, hosts={"slow.example": {"rate": 1, "burst": 1}})
+    for _ in range(2):
+        rate_limiter.acquire(URL)
+    assert clock.sleeps == [pytest.approx(0.01)]
+
+    rate_limiter.acquire("https://slow.example/trades")
+    rate_limiter.acquire("https://slow.example/trades")
+    assert clock.sleeps[-1] == pytest.approx(1.0)
+
+
+def test_429_halves_once_per_cooldown_and_recovers(clock):
+    rate_limiter = limiter(clock, rate=10, burst=10, cooldown=1.0)
+    rate_limiter.acquire(URL)
+    key = "host:statistics-api.tiger.trade"
+
+    # A burst of concurrent 429s is one overload
+    for _ in range(8):
+        rate_limiter.on_response(URL, 429)
+    assert rate_limiter.rates()[key] == 5.0
+
+    clock.now += 1.0
+    rate_limiter.on_response(URL, 429)
+    assert rate_limiter.rates()[key] == 2.5
+
+    for _ in range(200):
+        rate_limiter.on_response(URL, 200)
+    assert rate_limiter.rates()[key] == 10.0
+
+
+def test_rate_never_drops_below_min_rate(clock):
+    rate_limiter = limiter(clock, rate=1, burst=1, cooldown=0.0)
+    rate_limiter.acquire(URL)
+    for _ in range(20):
+        rate_limiter.on_response(URL, 429)
+    assert rate_limiter.rates()["host:statistics-api.tiger.trade"] == MIN_RATE
+
+
+def test_disabled_without_config():
+    assert RateLimiter.from_config({}) is None
+    assert RateLimiter.from_config({"rate_limit": {"enabled": False, "rate": 5}}) is None
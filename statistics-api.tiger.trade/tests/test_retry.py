@@ -0,0 +1,40 @@
+from tiger_api.retry import RetryPolicy
+
+
+class FakeResponse:
+    def __init__(self, status_code, headers=None):
+        self.status_code = status_code
+        self.headers = headers or {}
+
+    def close(self):
+        pass
+
+
+def policy(sleeps, **options):
+    return RetryPolicy(sleep=sleeps.append, rand=lambda: 1.0, **options)
+
+
+def responses(*items):
+    items = list(items)
+    return lambda: items.pop(0)
+
+
+def test_retry_after_is_honoured_within_max_delay():
+    sleeps = []
+    response = policy(sleeps, max_delay=30).send(
+        "GET", responses(FakeResponse(429, {"Retry-After": "5"}), FakeResponse(200)))
+    assert response.status_code == 200
+    assert sleeps == [5.0]
+
+
+def test_retry_after_beyond_max_delay_returns_the_response():
+    sleeps = []
+    retry_policy = policy(sleeps, max_delay=30)
+    response = retry_policy.send("GET", responses(FakeResponse(429, {"Retry-After": "3600"}), FakeResponse(200)))
+    assert response.status_code == 429
+    assert sleeps == []
+    assert retry_policy.stats() == {"rate_limit_retry_after_exceeded": 1}
+
+
+def test_backoff_caps_retry_after():
+    assert policy([], max_delay=30).backoff(0, retry_after=3600) == 30
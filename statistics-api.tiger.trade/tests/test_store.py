@@ -0,0 +1,37 @@
+from tiger_api import TradeStore
+
+
+class FakeTradesAPI:
+    """iter_trades over an in-memory history, applying the filters the server would."""
+
+    def __init__(self, trades):
+        self.trades = list(trades)
+        self.calls = []
+
+    def iter_trades(self, page_size=None, **filters):
+        self.calls.append(filters)
+        trades = sorted(self.trades, key=lambda trade: trade['id'], reverse=filters.get('sort_order') == 'desc')
+        for trade in trades:
+            if filters.get('date_from') and trade['date'] < filters['date_from']:
+                continue
+            yield trade
+
+
+def trade(trade_id, date, status="closed"):
+    return {"id": trade_id, "date": date, "status": status}
+
+
+def test_sync_picks_up_late_trade_with_earlier_date(tmp_path):
+    api = FakeTradesAPI([trade(1, "2026-01-01"), trade(2, "2026-01-02"), trade(3, "2026-01-05")])
+    with TradeStore(str(tmp_path / "trades.sqlite3")) as store:
+        store.sync(api)
+        assert store.high_watermark() == 3
+
+        # Ingested late: a higher id than anything stored, dated before the last sync
+        api.trades.append(trade(4, "2026-01-03"))
+        stats = store.sync(api)
+
+        assert stats["fetched"] == 1
+        assert store.high_watermark() == 4
+        assert [t["id"] for t in store.iter_trades()] == [4, 3, 2, 1]
+        assert "date_from" not in api.calls[-1]
@@ -0,0 +1,56 @@
+import pytest
+
+pytest.importorskip("opentelemetry.sdk")
+
+from opentelemetry import trace
+from opentelemetry.sdk.trace import TracerProvider
+from opentelemetry.sdk.trace.export import SimpleSpanProcessor
+from opentelemetry.sdk.trace.export.in_memory_span_exporter import InMemorySpanExporter
+
+from stub_server import StubServer
+from tiger_api import TigerTradeClient
+
+# The global provider can only be set once per process
+exporter = InMemorySpanExporter()
+provider = TracerProvider()
+provider.add_span_processor(SimpleSpanProcessor(exporter))
+trace.set_tracer_provider(provider)
+
+
+@pytest.fixture
+def spans():
+    exporter.clear()
+    yield exporter
+    exporter.clear()
+
+
+def test_request_span_matches_request_headers(tmp_path, spans):
+    received = []
+
+    def trades(handler):
+        received.append(dict(handler.headers))
+        return {"status": "success", "data": []}
+
+    with StubServer({"/trades": trades}) as stub:
+        client = TigerTradeClient(stub.write_config(str(tmp_path / "config.json"), http_cache=False))
+        client.trades.get_trades()
+
+    request_span = next(s for s in spans.get_finished_spans() if s.name == "GET /trades")
+    headers = received[-1]
+    assert request_span.kind == trace.SpanKind.CLIENT
+    assert request_span.attributes["http.response.status_code"] == 200
+    assert request_span.attributes["tiger_api.request_id"] == headers["X-Request-Id"]
+    assert headers["Trace-Request-Id"] == headers["X-Request-Id"]
+    assert headers["traceparent"].split("-")[1] == f"{request_span.context.trace_id:032x}"
+
+
+def test_fan_out_requests_share_the_parent_span(tmp_path, spans):
+    with StubServer() as stub:
+        client = TigerTradeClient(stub.write_config(str(tmp_path / "config.json"), http_cache=False))
+        client.trades.get_orders_for_trades([1, 2, 3], workers=3)
+
+    finished = spans.get_finished_spans()
+    parent = next(s for s in finished if s.name == "tiger_api.get_orders_for_trades")
+    children = [s for s in finished if s.name == "GET /trades/{id}/orders"]
+    assert len(children) == 3
+    assert {s.parent.span_id for s in children} == {parent.context.span_id}
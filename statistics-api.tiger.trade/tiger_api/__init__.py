@@ -0,0 +1,126 @@
+"""
+Tiger Trade API - shared client infrastructure
+
+Names are resolved on first access, so `from tiger_api import TradesEndpoints`
+loads only the modules it needs and never requests or numpy up front.
+"""
+
+import importlib
+from typing import Any
+
+from .exceptions import TigerTradeAPIException
+
+# public name -> submodule defining it
+_EXPORTS = {
+    "TokenManager": "auth",
+    "get_token_manager": "auth",
+    "decode_jwt_exp": "claims",
+    "decode_jwt_claims": "claims",
+    "TokenStore": "token_store",
+    "FileTokenStore": "token_store",
+    "MemoryTokenStore": "token_store",
+    "Transport": "transport",
+    "get_transport": "transport",
+    "RetryPolicy": "retry",
+    "parse_retry_after": "retry",
+    "RateLimiter": "ratelimit",
+    "TokenBucket": "ratelimit",
+    "DiskCache": "disk_cache",
+    "HttpCache": "http_cache",
+    "ResponseCache": "response_cache",
+    "BandwidthMeter": "bandwidth",
+    "endpoint_template": "bandwidth",
+    "Hooks": "hooks",
+    "MetricsCollector": "metrics",
+    "LatencyHistogram": "metrics",
+    "ItemStream": "streaming",
+    "Trade": "records",
+    "Week": "records",
+    "Summary": "records",
+    "decode_records": "records",
+    "iter_json_items": "streaming",
+    "AsyncAPI": "aio",
+    "iter_pages": "pagination",
+    "fetch_pages": "pagination",
+    "page_count": "pagination",
+    "TradeStore": "store",
+    "TradeTable": "columns",
+    "TradeRecord": "columns",
+    "Categorical": "columns",
+    "LocalAnalyzer": "local_analyzer",
+    "RangeCache": "range_cache",
+    "merge_summaries": "range_cache",
+    "WeekIndex": "week_index",
+    "Endpoints": "endpoints",
+    "TradesEndpoints": "endpoints",
+    "AnalyzerEndpoints": "endpoints",
+    "DashboardEndpoints": "endpoints",
+    "UsersEndpoints": "endpoints",
+    "ExchangesEndpoints": "endpoints",
+    "TigerTradeClient": "client",
+    "get_client": "client",
+}
+
+__all__ = [
+    "TigerTradeAPIException",
+    "TokenManager",
+    "get_token_manager",
+    "decode_jwt_exp",
+    "decode_jwt_claims",
+    "TokenStore",
+    "FileTokenStore",
+    "MemoryTokenStore",
+    "Transport",
+    "get_transport",
+    "RetryPolicy",
+    "parse_retry_after",
+    "RateLimiter",
+    "TokenBucket",
+    "DiskCache",
+    "HttpCache",
+    "ResponseCache",
+    "BandwidthMeter",
+    "endpoint_template",
+    "Hooks",
+    "MetricsCollector",
+    "LatencyHistogram",
+    "ItemStream",
+    "Trade",
+    "Week",
+    "Summary",
+    "decode_records",
+    "iter_json_items",
+    "AsyncAPI",
+    "iter_pages",
+    "fetch_pages",
+    "page_count",
+    "TradeStore",
+    "TradeTable",
+    "TradeRecord",
+    "Categorical",
+    "LocalAnalyzer",
+    "RangeCache",
+    "merge_summaries",
+    "WeekIndex",
+    "Endpoints",
+    "TradesEndpoints",
+    "AnalyzerEndpoints",
+    "DashboardEndpoints",
+    "UsersEndpoints",
+    "ExchangesEndpoints",
+    "TigerTradeClient",
+    "get_client",
+]
+
+
+def __getattr__(name: str) -> Any:
+    module = _EXPORTS.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(f".{module}", __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(__all__)
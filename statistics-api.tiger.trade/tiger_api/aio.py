@@ -0,0 +1,136 @@
+"""
+Tiger Trade API - Asyncio Clients
+
+AsyncAPI exposes every public method of a synchronous client as a coroutine
+with the same name, arguments and return shape. Calls run on a bounded
+thread pool behind an asyncio.Semaphore (one per event loop), on top of the
+same Transport and TokenManager as the sync clients, so connection pools,
+rate limits, retries and the single-flight token refresh are shared with
+every in-flight coroutine.
+
+Iterators are the exception, since each step may block on a request:
+
+- generator methods (iter_trades) return an async iterator at once:
+  `async for trade in api.iter_trades()`;
+- methods returning an iterator (stream_trades) are awaited as usual and
+  give an async iterator over it, which keeps `.meta` and closes with
+  `async with`: `async with await api.stream_trades() as trades`.
+
+Every step runs on the pool under the same concurrency limit.
+"""
+
+import functools
+import inspect
+import threading
+import weakref
+from typing import Any, Callable, Iterator, Optional
+
+from .tracing import bind
+
+DEFAULT_CONCURRENCY = 10
+
+_DONE = object()
+
+
+class AsyncIterator:
+    """Async view of a blocking iterator; next() and close() run on the API's pool."""
+
+    def __init__(self, api: "AsyncAPI", items: Iterator[Any]):
+        self._api = api
+        self._items = items
+
+    def __aiter__(self) -> "AsyncIterator":
+        return self
+
+    async def __anext__(self) -> Any:
+        # StopIteration cannot cross a Future, so exhaustion comes back as a sentinel
+        item = await self._api.run(next, self._items, _DONE)
+        if item is _DONE:
+            raise StopAsyncIteration
+        return item
+
+    async def aclose(self):
+        close = getattr(self._items, 'close', None)
+        if close is not None:
+            await self._api.run(close)
+
+    async def __aenter__(self) -> "AsyncIterator":
+        return self
+
+    async def __aexit__(self, *exc):
+        await self.aclose()
+
+    def __getattr__(self, name: str) -> Any:
+        # ItemStream.meta and the like
+        return getattr(self._items, name)
+
+
+class AsyncAPI:
+    client_class: Optional[type] = None
+
+    def __init__(self, config_path: Optional[str] = None, concurrency: int = DEFAULT_CONCURRENCY,
+                 client: Any = None):
+        if client is None:
+            if self.client_class is None:
+                raise TypeError(f"{type(self).__name__} needs client_class or a client instance")
+            client = self.client_class(config_path)
+
+        self.client = client
+        self.concurrency = concurrency
+        from concurrent.futures import ThreadPoolExecutor
+        self._executor = ThreadPoolExecutor(max_workers=concurrency, thread_name_prefix="tiger-api")
+        # A semaphore belongs to the loop it is first used on
+        self._semaphores = weakref.WeakKeyDictionary()
+        self._semaphores_lock = threading.Lock()
+
+    def _get_semaphore(self) -> "asyncio.Semaphore":
+        # Imported on first use so plain sync scripts never load asyncio
+        import asyncio
+        loop = asyncio.get_running_loop()
+        with self._semaphores_lock:
+            semaphore = self._semaphores.get(loop)
+            if semaphore is None:
+                semaphore = self._semaphores[loop] = asyncio.Semaphore(self.concurrency)
+            return semaphore
+
+    async def run(self, func: Callable, *args, **kwargs) -> Any:
+        """Run a blocking callable under the concurrency limit."""
+        async with self._get_semaphore():
+            import asyncio
+            loop = asyncio.get_running_loop()
+            # The pool threads do not see the coroutine's trace context unless it is bound
+            return await loop.run_in_executor(self._executor, functools.partial(bind(func), *args, **kwargs))
+
+    def __getattr__(self, name: str) -> Any:
+        if name.startswith('_'):
+            raise AttributeError(name)
+
+        attr = getattr(self.client, name)
+        if not callable(attr):
+            return attr
+
+        if inspect.isgeneratorfunction(attr):
+            # Creating a generator runs none of its body, so this does not block
+            @functools.wraps(attr)
+            def generator(*args, **kwargs):
+                return AsyncIterator(self, attr(*args, **kwargs))
+
+            return generator
+
+        @functools.wraps(attr)
+        async def method(*args, **kwargs):
+            result = await self.run(attr, *args, **kwargs)
+            if isinstance(result, Iterator):
+                return AsyncIterator(self, result)
+            return result
+
+        return method
+
+    def close(self):
+        self._executor.shutdown(wait=True)
+
+    async def __aenter__(self) -> "AsyncAPI":
+        return self
+
+    async def __aexit__(self, *exc):
+        self.close()
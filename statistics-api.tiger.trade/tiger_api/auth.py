@@ -0,0 +1,256 @@
+"""
+Tiger Trade API - Token Manager
+
+One manager per config file is shared by every client in the process, so
+constructing several clients costs at most one token check.
+"""
+
+import json
+import os
+import threading
+import time
+from typing import Dict, Any, Optional
+
+from .claims import decode_jwt_exp
+from .exceptions import TigerTradeAPIException
+from .lazy import lazy_import
+from .serialization import loads
+from .token_store import TokenStore, FileTokenStore
+from .tracing import span
+from .transport import get_transport
+
+requests = lazy_import("requests")
+
+# Refresh this many seconds before the JWT `exp` claim
+REFRESH_AHEAD_SECONDS = 60
+# Callers still holding the token of a failed refresh get the same error for this long
+REFRESH_FAILURE_COOLDOWN = 5
+PROBE_ENDPOINT = "/trades/categories"
+# Default token file, next to config.json
+TOKEN_FILE = ".tokens.json"
+
+
+class TokenManager:
+    def __init__(self, config_path: str, store: Optional[TokenStore] = None,
+                 config: Optional[Dict[str, Any]] = None):
+        self.config_path = config_path
+        # Callers that already parsed config.json pass it in to avoid a second read
+        self.config = config if config is not None else self._load_config()
+
+        api_config = self.config.get('api', {})
+        self.refresh_ahead = api_config.get('token_refresh_ahead', REFRESH_AHEAD_SECONDS)
+        self.probe_url = api_config.get('probe_url') or f"{api_config.get('base_url', '')}{PROBE_ENDPOINT}"
+        self.transport = get_transport(api_config)
+
+        if store is None:
+            token_file = self.config['auth'].get('token_file') or os.path.join(
+                os.path.dirname(config_path), TOKEN_FILE)
+            store = FileTokenStore(token_file)
+        self.store = store
+
+        # Tokens in config.json only seed the store; refreshes never rewrite the config
+        stored = self.store.load()
+        self.access_token = stored.get('access_token') or self.config['auth'].get('access_token') or None
+        self.refresh_token = stored.get('refresh_token') or self.config['auth'].get('refresh_token') or None
+        self.expires_at = decode_jwt_exp(self.access_token) if self.access_token else None
+        # Tokens without a readable `exp` are probed once, then trusted until a 401
+        self._validated = False
+        self._lock = threading.RLock()
+        self._last_failure = None
+
+    def _load_config(self) -> Dict[str, Any]:
+        try:
+            with open(self.config_path, 'rb') as f:
+                return loads(f.read())
+        except FileNotFoundError:
+            raise TigerTradeAPIException(f"Config not found: {self.config_path}")
+        except json.JSONDecodeError as e:
+            raise TigerTradeAPIException(f"Invalid JSON: {e}")
+
+    def _set_token(self, token: str, refresh_token: Optional[str] = None):
+        self.access_token = token
+        if refresh_token:
+            self.refresh_token = refresh_token
+        self.expires_at = decode_jwt_exp(token)
+        self._validated = True
+
+        try:
+            self.store.save({'access_token': self.access_token, 'refresh_token': self.refresh_token})
+        except OSError as e:
+            print(f"Warning: Could not save token: {e}")
+
+    def _adopt_stored_token(self, stale_token: Optional[str]) -> bool:
+        """Take over a token another process stored since `stale_token` was issued."""
+        stored = self.store.load()
+        token = stored.get('access_token')
+        if not token or token == stale_token:
+            return False
+
+        self.access_token = token
+        self.refresh_token = stored.get('refresh_token') or self.refresh_token
+        self.expires_at = decode_jwt_exp(token)
+        self._validated = True
+        return self._is_fresh()
+
+    def _is_fresh(self) -> bool:
+        if not self.access_token:
+            return False
+        if self.expires_at is None:
+            return self._validated
+        return self.expires_at - time.time() > self.refresh_ahead
+
+    def _test_token(self, token: str) -> bool:
+        if not token:
+            return False
+
+        try:
+            headers = {
+                'Authorization': f'Bearer {token}',
+                'Content-Type': 'application/json',
+                'Accept': 'application/json'
+            }
+
+            response = self.transport.request('GET', self.probe_url, headers=headers, timeout=10, cache=False)
+            return response.status_code == 200
+        except Exception:
+            return False
+
+    def _refresh_token(self) -> str:
+        current_token = self.access_token
+        refresh_token = self.refresh_token
+
+        if not current_token or not refresh_token:
+            return self._generate_new_token()
+
+        refresh_url = self.config['api']['refresh_url']
+        refresh_data = {"accessToken": current_token}
+        headers = {
+            'Content-Type': 'application/json',
+            'Accept': 'application/json',
+            'Cookie': f'refreshToken={refresh_token}'
+        }
+
+        try:
+            response = self.transport.request('POST', refresh_url, json=refresh_data, headers=headers, timeout=30)
+        except requests.exceptions.RequestException:
+            return self._generate_new_token()
+
+        if response.status_code == 200:
+            result = response.json()
+            if 'accessToken' in result:
+                token = result['accessToken']
+                self._set_token(token, response.cookies.get('refreshToken'))
+                return token
+
+        return self._generate_new_token()
+
+    def _generate_new_token(self) -> str:
+        username = self.config['auth'].get('username')
+        password = self.config['auth'].get('password')
+
+        if not username or not password:
+            raise TigerTradeAPIException("Username and password required")
+
+        auth_url = self.config['api']['auth_url']
+        auth_data = {"username": username, "password": password}
+        headers = {'Content-Type': 'application/json', 'Accept': 'application/json'}
+
+        try:
+            response = self.transport.request('POST', auth_url, json=auth_data, headers=headers, timeout=30)
+        except requests.exceptions.RequestException as e:
+            raise TigerTradeAPIException(f"Auth request error: {e}")
+
+        if response.status_code == 200:
+            result = response.json()
+            if 'accessToken' in result:
+                token = result['accessToken']
+                self._set_token(token, response.cookies.get('refreshToken'))
+                return token
+            else:
+                raise TigerTradeAPIException(f"No accessToken in response: {result}")
+        elif response.status_code == 400:
+            try:
+                error_response = response.json()
+                error_desc = error_response.get('detail', 'Unknown error')
+            except ValueError:
+                error_desc = response.text
+            raise TigerTradeAPIException(f"Auth API error: {error_desc}")
+        elif response.status_code == 429:
+            raise TigerTradeAPIException("Rate limit exceeded")
+        else:
+            raise TigerTradeAPIException(f"Auth error: {response.status_code} - {response.text}")
+
+    def _renew(self, reason: str) -> str:
+        """_refresh_token(), reported to the transport hooks as a token_refresh event."""
+        started = time.perf_counter()
+        error = None
+        try:
+            with span("tiger_api.token_refresh", {"tiger_api.reason": reason}):
+                return self._refresh_token()
+        except Exception as e:
+            error = e
+            raise
+        finally:
+            self.transport.hooks.emit("token_refresh", reason=reason, error=error,
+                                      elapsed=time.perf_counter() - started)
+
+    def get_token(self) -> str:
+        """Return a usable access token, touching the network only when needed."""
+        with self._lock:
+            if self._is_fresh():
+                return self.access_token
+
+            # Offline replay: responses are keyed by the token subject, expiry is irrelevant
+            if self.transport.offline:
+                return self.access_token or ""
+
+            if self.access_token and self.expires_at is None and self._test_token(self.access_token):
+                self._validated = True
+                return self.access_token
+
+            with self.store.lock():
+                if self._adopt_stored_token(self.access_token):
+                    return self.access_token
+                return self._renew("expired" if self.access_token else "missing")
+
+    def refresh(self, stale_token: Optional[str] = None) -> str:
+        """Refresh after the server rejected `stale_token` with 401.
+
+        Refreshes are single-flight: concurrent callers block on the lock and,
+        once the first refresh has replaced `stale_token`, get the new token
+        without hitting the auth API again. The store lock extends this to
+        other processes sharing the same token file.
+        """
+        with self._lock:
+            if stale_token is not None:
+                if self.access_token and self.access_token != stale_token:
+                    return self.access_token
+                if self._last_failure:
+                    failed_token, error, failed_at = self._last_failure
+                    if failed_token == stale_token and time.time() - failed_at < REFRESH_FAILURE_COOLDOWN:
+                        raise error
+
+            try:
+                with self.store.lock():
+                    if self._adopt_stored_token(stale_token or self.access_token):
+                        return self.access_token
+                    token = self._renew("rejected")
+            except TigerTradeAPIException as e:
+                self._last_failure = (stale_token, e, time.time())
+                raise
+            self._last_failure = None
+            return token
+
+
+_managers: Dict[str, TokenManager] = {}
+_managers_lock = threading.Lock()
+
+
+def get_token_manager(config_path: str, config: Optional[Dict[str, Any]] = None) -> TokenManager:
+    """Return the process-wide token manager for a config file."""
+    key = os.path.abspath(config_path)
+    with _managers_lock:
+        manager = _managers.get(key)
+        if manager is None:
+            manager = _managers[key] = TokenManager(key, config=config)
+        return manager
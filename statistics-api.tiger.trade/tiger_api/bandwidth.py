@@ -0,0 +1,133 @@
+"""
+Tiger Trade API - Compression and Bandwidth Accounting
+
+Every request advertises the content encodings this install can decode:
+gzip and deflate always, br when brotli is installed and zstd when a zstd
+module is (as detected by urllib3, which does the decoding). Servers that
+support none of them answer uncompressed, as before.
+
+BandwidthMeter counts, per endpoint template (`/trades/{id}/orders`, not raw
+URLs), how many body bytes crossed the wire and how many they decoded to.
+Responses served by the HTTP or response cache cross no wire and are not
+counted.
+"""
+
+import re
+import threading
+from collections import Counter
+from typing import Dict, Any, Iterable, Optional, Tuple, Union
+from urllib.parse import urlsplit
+
+# Preference order; only the encodings urllib3 can decode are sent
+PREFERRED_ENCODINGS = ("zstd", "br", "gzip", "deflate")
+IDENTITY = "identity"
+
+# Path segments replaced by {id}: numbers, UUIDs and long hex ids
+_ID_SEGMENT = re.compile(
+    r'^(\d+|[0-9a-fA-F]{8}-[0-9a-fA-F]{4}-[0-9a-fA-F]{4}-[0-9a-fA-F]{4}-[0-9a-fA-F]{12}|[0-9a-fA-F]{16,})$')
+
+
+def supported_encodings() -> tuple:
+    """Content encodings urllib3 can decode in this environment."""
+    from urllib3.util.request import ACCEPT_ENCODING
+    return tuple(encoding.strip() for encoding in ACCEPT_ENCODING.split(','))
+
+
+def accept_encoding(preferred: Union[Iterable[str], bool, None] = None) -> str:
+    """Accept-Encoding value: `preferred` (default PREFERRED_ENCODINGS) filtered to what decodes here.
+
+    False, or nothing decodable, asks for uncompressed bodies.
+    """
+    if preferred is False:
+        return IDENTITY
+    supported = supported_encodings()
+    encodings = [encoding for encoding in (preferred or PREFERRED_ENCODINGS) if encoding in supported]
+    return ", ".join(encodings) or IDENTITY
+
+
+def endpoint_template(url: str, base_path: str = "") -> str:
+    """URL path with ids replaced by {id}, relative to `base_path` when under it."""
+    path = urlsplit(url).path.rstrip('/') or '/'
+    base_path = base_path.rstrip('/')
+    if base_path and (path == base_path or path.startswith(base_path + '/')):
+        path = path[len(base_path):] or '/'
+    return '/'.join('{id}' if _ID_SEGMENT.match(segment) else segment for segment in path.split('/'))
+
+
+def response_bytes(response: Any, decoded_bytes: Optional[int] = None) -> Optional[Tuple[int, int]]:
+    """(wire, decoded) body bytes of a network response; None for cached ones.
+
+    `decoded_bytes` is required once a stream has been iterated.
+    """
+    raw = getattr(response, 'raw', None)
+    if getattr(response, 'from_cache', False) or raw is None:
+        return None
+    if decoded_bytes is None:
+        decoded_bytes = len(response.content or b'')
+    # urllib3 counts the body bytes read from the socket, before decoding
+    wire_bytes = raw.tell() if hasattr(raw, 'tell') else decoded_bytes
+    return wire_bytes, decoded_bytes
+
+
+class BandwidthMeter:
+    def __init__(self, base_url: str = ""):
+        # Templates are reported relative to the API base path
+        self.base_path = urlsplit(base_url).path
+        self._lock = threading.Lock()
+        self._endpoints: Dict[str, Dict[str, Any]] = {}
+
+    @classmethod
+    def from_config(cls, api_config: Dict[str, Any]) -> "BandwidthMeter":
+        return cls(**cls.options_from_config(api_config))
+
+    @staticmethod
+    def options_from_config(api_config: Dict[str, Any]) -> Dict[str, Any]:
+        return {"base_url": api_config.get('base_url', '')}
+
+    def template(self, url: str) -> str:
+        return endpoint_template(url, self.base_path)
+
+    def record(self, url: str, wire_bytes: int, decoded_bytes: int, encoding: Optional[str] = None):
+        template = self.template(url)
+        with self._lock:
+            endpoint = self._endpoints.get(template)
+            if endpoint is None:
+                endpoint = self._endpoints[template] = {
+                    "responses": 0, "wire_bytes": 0, "decoded_bytes": 0, "encodings": Counter()}
+            endpoint["responses"] += 1
+            endpoint["wire_bytes"] += wire_bytes
+            endpoint["decoded_bytes"] += decoded_bytes
+            endpoint["encodings"][encoding or IDENTITY] += 1
+
+    def record_response(self, response: Any, decoded_bytes: Optional[int] = None):
+        """Count a network response; `decoded_bytes` is required once a stream has been iterated."""
+        counted = response_bytes(response, decoded_bytes)
+        if counted is not None:
+            self.record(response.url, *counted, response.headers.get('Content-Encoding'))
+
+    def stats(self) -> Dict[str, Dict[str, Any]]:
+        """Per endpoint template: responses, wire/decoded bytes, their ratio and encodings seen."""
+        with self._lock:
+            stats = {}
+            for template, endpoint in sorted(self._endpoints.items()):
+                wire, decoded = endpoint["wire_bytes"], endpoint["decoded_bytes"]
+                stats[template] = {
+                    "responses": endpoint["responses"],
+                    "wire_bytes": wire,
+                    "decoded_bytes": decoded,
+                    "ratio": round(decoded / wire, 2) if wire else None,
+                    "encodings": dict(endpoint["encodings"]),
+                }
+            return stats
+
+    def totals(self) -> Dict[str, int]:
+        with self._lock:
+            return {
+                "responses": sum(endpoint["responses"] for endpoint in self._endpoints.values()),
+                "wire_bytes": sum(endpoint["wire_bytes"] for endpoint in self._endpoints.values()),
+                "decoded_bytes": sum(endpoint["decoded_bytes"] for endpoint in self._endpoints.values()),
+            }
+
+    def reset(self):
+        with self._lock:
+            self._endpoints.clear()
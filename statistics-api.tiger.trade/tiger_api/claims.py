@@ -0,0 +1,42 @@
+"""
+Tiger Trade API - JWT Claims
+
+Unverified decoding of access-token claims. The client only reads `exp`
+(to refresh ahead of expiry) and the subject (to keep cached responses of
+different accounts apart); the server remains the one validating tokens.
+"""
+
+import base64
+import json
+from typing import Dict, Any, Optional
+
+# Claims that identify the account, first match wins
+SUBJECT_CLAIMS = ("sub", "user_id", "userId", "uid", "id", "email")
+
+
+def decode_jwt_claims(token: str) -> Optional[Dict[str, Any]]:
+    """Return the payload of a JWT without verifying it, or None."""
+    try:
+        payload = token.split('.')[1]
+        payload += '=' * (-len(payload) % 4)
+        claims = json.loads(base64.urlsafe_b64decode(payload))
+    except (AttributeError, IndexError, TypeError, ValueError):
+        return None
+    return claims if isinstance(claims, dict) else None
+
+
+def decode_jwt_exp(token: str) -> Optional[float]:
+    """Return the `exp` claim of a JWT without verifying it, or None."""
+    claims = decode_jwt_claims(token)
+    try:
+        return float(claims['exp'])
+    except (KeyError, TypeError, ValueError):
+        return None
+
+
+def jwt_subject(token: str) -> Optional[str]:
+    claims = decode_jwt_claims(token) or {}
+    for name in SUBJECT_CLAIMS:
+        if claims.get(name) not in (None, ""):
+            return str(claims[name])
+    return None
@@ -0,0 +1,213 @@
+"""
+Tiger Trade API - Core Client
+
+One TigerTradeClient per config file owns the config, the shared Transport,
+the access token and the request headers. Endpoint groups hang off it as
+lightweight namespaces (client.trades, client.analyzer, client.dashboard,
+client.users, client.exchanges) that only add URLs and parameters, so
+building all of them costs one config read and one token check. That check
+is deferred to the first request, so constructing a client never touches
+the network, and repeated before every request: it is a local `exp`
+comparison, so the token is refreshed `api.token_refresh_ahead` seconds
+before it expires rather than after a 401.
+"""
+
+import json
+import os
+import threading
+from contextlib import contextmanager
+from typing import Dict, Any, Optional, Tuple
+
+from .auth import get_token_manager
+from .endpoints import (Endpoints, TradesEndpoints, AnalyzerEndpoints, DashboardEndpoints,
+                        UsersEndpoints, ExchangesEndpoints)
+from .exceptions import TigerTradeAPIException
+from .lazy import lazy_import
+from .serialization import loads
+from .streaming import DEFAULT_CHUNK_SIZE, ItemStream, is_buffered, stream_items
+from .transport import get_transport
+
+requests = lazy_import("requests")
+
+CONFIG_FILE = "config.json"
+DEFAULT_TIMEOUT = 30
+DEFAULT_HEADERS = {
+    'Content-Type': 'application/json',
+    'Accept': 'application/json',
+    'User-Agent': 'Tiger Trade API Client/1.0',
+    'Origin': 'https://statistics-api.tiger.trade',
+    'Referer': 'https://statistics-api.tiger.trade/'
+}
+
+
+def default_config_path() -> str:
+    # config.json lives in the parent of the scripts directory
+    scripts_dir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+    return os.path.join(os.path.dirname(scripts_dir), CONFIG_FILE)
+
+
+class TigerTradeClient:
+    def __init__(self, config_path: Optional[str] = None):
+        self.config_path = config_path or default_config_path()
+        self.config = self._load_config()
+        self.base_url = self.config['api']['base_url']
+        self.timeout = self.config['api'].get('timeout', DEFAULT_TIMEOUT)
+        self.access_token = None
+        self.transport = get_transport(self.config['api'])
+        self.headers = {}
+        self.tokens = get_token_manager(self.config_path, self.config)
+        self._namespaces: Dict[type, Endpoints] = {}
+        self._namespaces_lock = threading.Lock()
+
+    def _load_config(self) -> Dict[str, Any]:
+        try:
+            with open(self.config_path, 'rb') as f:
+                return loads(f.read())
+        except FileNotFoundError:
+            raise TigerTradeAPIException(f"Config not found: {self.config_path}")
+        except json.JSONDecodeError as e:
+            raise TigerTradeAPIException(f"Invalid JSON: {e}")
+
+    def _ensure_valid_token(self):
+        """Ask the manager for a usable token (refreshing ahead of `exp`); swap headers if it changed."""
+        token = self.tokens.get_token()
+        if token != self.access_token:
+            self.access_token = token
+            self._update_headers()
+
+    def _update_headers(self):
+        # Replaced, not mutated, so requests already building their headers are unaffected
+        self.headers = {**self.headers, **DEFAULT_HEADERS, 'Authorization': f'Bearer {self.access_token}'}
+
+    @contextmanager
+    def _request_errors(self, url: str):
+        """Map requests exceptions to TigerTradeAPIException."""
+        try:
+            yield
+        except requests.exceptions.Timeout:
+            raise TigerTradeAPIException(f"Timeout: {url}")
+        except requests.exceptions.ConnectionError:
+            raise TigerTradeAPIException(f"Connection error: {url}")
+        except requests.exceptions.RequestException as e:
+            raise TigerTradeAPIException(f"Request error: {e}")
+
+    def _send_request(self, method: str, endpoint: str, params: Optional[Dict] = None,
+                      data: Optional[Dict] = None, url: Optional[str] = None,
+                      headers: Optional[Dict[str, str]] = None, stream: bool = False) -> "requests.Response":
+        """Send with auth and a single retry after 401; error statuses raise."""
+        url = url or f"{self.base_url}{endpoint}"
+        # Returns at once while the token is fresh; refreshes ahead of expiry otherwise
+        self._ensure_valid_token()
+
+        def send() -> "requests.Response":
+            response = self.transport.request(
+                method=method,
+                url=url,
+                headers={**self.headers, **headers} if headers else self.headers,
+                params=params,
+                json=data,
+                timeout=self.timeout,
+                stream=stream
+            )
+            # Error bodies are read whole, so their accounting ends here
+            if stream and response.status_code >= 400:
+                self.transport.finish_stream(response)
+            return response
+
+        with self._request_errors(url):
+            response = send()
+
+            if response.status_code == 401:
+                sent_token = response.request.headers.get('Authorization', '')[len('Bearer '):]
+                response.close()
+                self.access_token = self.tokens.refresh(sent_token)
+                self._update_headers()
+                response = send()
+
+            if response.status_code == 417:
+                raise TigerTradeAPIException(f"Expectation Failed (417): {endpoint}")
+            elif response.status_code == 429:
+                raise TigerTradeAPIException("Rate limit exceeded (429)")
+            elif response.status_code >= 400:
+                raise TigerTradeAPIException(f"HTTP {response.status_code}: {response.text}")
+            return response
+
+    def _make_request(self, method: str, endpoint: str, params: Optional[Dict] = None,
+                      data: Optional[Dict] = None, url: Optional[str] = None,
+                      headers: Optional[Dict[str, str]] = None) -> Dict[str, Any]:
+        """Call `endpoint` on base_url (or an absolute `url`); `headers` extend the client headers."""
+        response = self._send_request(method, endpoint, params, data, url, headers)
+        try:
+            return loads(response.content)
+        except json.JSONDecodeError:
+            return {'raw_response': response.text}
+
+    def _decode_request(self, method: str, endpoint: str, record: type, many: bool = True,
+                        params: Optional[Dict] = None, url: Optional[str] = None,
+                        headers: Optional[Dict[str, str]] = None) -> Tuple[Any, Dict[str, Any]]:
+        """Like _make_request, but decode `data` into `record` objects: (records, meta)."""
+        from .records import decode_records
+        response = self._send_request(method, endpoint, params, url=url, headers=headers)
+        return decode_records(response.content, record, many)
+
+    def _stream_request(self, method: str, endpoint: str, params: Optional[Dict] = None,
+                        key: str = 'data', url: Optional[str] = None,
+                        headers: Optional[Dict[str, str]] = None) -> ItemStream:
+        """Like _make_request, but yield the items of the `key` array as the body downloads."""
+        response = self._send_request(method, endpoint, params, url=url, headers=headers, stream=True)
+        buffered = is_buffered(response)
+        decoded_bytes = 0
+
+        def chunks():
+            nonlocal decoded_bytes
+            with self._request_errors(response.url):
+                for chunk in response.iter_content(DEFAULT_CHUNK_SIZE):
+                    decoded_bytes += len(chunk)
+                    yield chunk
+
+        def close():
+            response.close()
+            self.transport.finish_stream(response, None if buffered else decoded_bytes)
+
+        return stream_items(response, key, chunks=chunks(), on_close=close)
+
+    def _namespace(self, cls: type) -> Endpoints:
+        with self._namespaces_lock:
+            namespace = self._namespaces.get(cls)
+            if namespace is None:
+                namespace = self._namespaces[cls] = cls(self)
+            return namespace
+
+    @property
+    def trades(self) -> TradesEndpoints:
+        return self._namespace(TradesEndpoints)
+
+    @property
+    def analyzer(self) -> AnalyzerEndpoints:
+        return self._namespace(AnalyzerEndpoints)
+
+    @property
+    def dashboard(self) -> DashboardEndpoints:
+        return self._namespace(DashboardEndpoints)
+
+    @property
+    def users(self) -> UsersEndpoints:
+        return self._namespace(UsersEndpoints)
+
+    @property
+    def exchanges(self) -> ExchangesEndpoints:
+        return self._namespace(ExchangesEndpoints)
+
+
+_clients: Dict[str, TigerTradeClient] = {}
+_clients_lock = threading.Lock()
+
+
+def get_client(config_path: Optional[str] = None) -> TigerTradeClient:
+    """Return the process-wide client for a config file."""
+    key = os.path.abspath(config_path or default_config_path())
+    with _clients_lock:
+        client = _clients.get(key)
+        if client is None:
+            client = _clients[key] = TigerTradeClient(key)
+        return client
@@ -0,0 +1,205 @@
+"""
+Tiger Trade API - Columnar Trade Table
+
+TradeTable stores trades column-wise: numeric fields in typed array.array
+buffers, low-cardinality strings (symbol, side, status) as interned
+categories with int32 codes. A million trades take tens of megabytes
+instead of gigabytes of dicts. Missing or non-integer ids and api_key_ids
+are stored as -1 and missing or non-numeric values as NaN.
+
+Numeric columns convert to NumPy without copying (np.frombuffer over the
+array buffers); categorical codes are handed to pandas/Arrow the same way.
+NumPy, pandas and pyarrow are optional and only imported by the export
+methods. While a zero-copy view is alive the table cannot grow (array
+raises BufferError), so copy the arrays first if you keep appending.
+"""
+
+from array import array
+from datetime import datetime, timezone
+from typing import Dict, Any, Iterable, Iterator, List, Optional
+
+from .exceptions import TigerTradeAPIException
+
+# Trade fields holding the open/close timestamps
+TRADE_OPEN_TIME_FIELD = "open_time"
+TRADE_CLOSE_TIME_FIELD = "close_time"
+
+NAN = float("nan")
+
+
+def _to_float(value: Any) -> float:
+    if value is None or value == "":
+        return NAN
+    try:
+        return float(value)
+    except (TypeError, ValueError):
+        return NAN
+
+
+def _to_int(value: Any) -> int:
+    # id / api_key_id; -1 when the trade carries none or it is not an integer
+    try:
+        return int(value)
+    except (TypeError, ValueError):
+        return -1
+
+
+def to_timestamp(value: Any) -> float:
+    """Epoch seconds from epoch seconds/milliseconds or an ISO-8601 string; NaN if unknown."""
+    if value is None or value == "":
+        return NAN
+    if isinstance(value, (int, float)):
+        return value / 1000.0 if value > 1e11 else float(value)
+    try:
+        return to_timestamp(float(value))
+    except (TypeError, ValueError):
+        pass
+    try:
+        parsed = datetime.fromisoformat(str(value).replace('Z', '+00:00'))
+    except ValueError:
+        return NAN
+    if parsed.tzinfo is None:
+        parsed = parsed.replace(tzinfo=timezone.utc)
+    return parsed.timestamp()
+
+
+# column -> (source field, converter, array typecode, numpy dtype)
+NUMERIC_COLUMNS = {
+    "id": ("id", _to_int, "q", "int64"),
+    "api_key_id": ("api_key_id", _to_int, "q", "int64"),
+    "pnl": ("pnl", _to_float, "d", "float64"),
+    "volume": ("volume", _to_float, "d", "float64"),
+    "open_time": (TRADE_OPEN_TIME_FIELD, to_timestamp, "d", "float64"),
+    "close_time": (TRADE_CLOSE_TIME_FIELD, to_timestamp, "d", "float64"),
+}
+CATEGORICAL_COLUMNS = ("symbol", "side", "status")
+COLUMNS = tuple(NUMERIC_COLUMNS) + CATEGORICAL_COLUMNS
+
+
+class Categorical:
+    """Interned string column: int32 codes into a list of categories (-1 = missing)."""
+
+    __slots__ = ("codes", "categories", "_index")
+
+    def __init__(self):
+        self.codes = array("i")
+        self.categories: List[str] = []
+        self._index: Dict[str, int] = {}
+
+    def append(self, value: Any):
+        if value is None:
+            self.codes.append(-1)
+            return
+        code = self._index.get(value)
+        if code is None:
+            code = self._index[value] = len(self.categories)
+            self.categories.append(value)
+        self.codes.append(code)
+
+    def __getitem__(self, i: int) -> Optional[str]:
+        code = self.codes[i]
+        return None if code < 0 else self.categories[code]
+
+    def __len__(self) -> int:
+        return len(self.codes)
+
+
+class TradeRecord:
+    """Lightweight row view returned by TradeTable iteration."""
+
+    __slots__ = COLUMNS
+
+    def __init__(self, **values):
+        for name in COLUMNS:
+            setattr(self, name, values.get(name))
+
+    def as_dict(self) -> Dict[str, Any]:
+        return {name: getattr(self, name) for name in COLUMNS}
+
+    def __repr__(self) -> str:
+        return f"TradeRecord(id={self.id}, symbol={self.symbol!r}, side={self.side!r}, pnl={self.pnl})"
+
+
+def _require(module: str, extra: str):
+    try:
+        return __import__(module)
+    except ImportError:
+        raise TigerTradeAPIException(f"{module} is required for {extra}: pip install {module}")
+
+
+class TradeTable:
+    def __init__(self):
+        self.numeric: Dict[str, array] = {
+            name: array(typecode) for name, (_, _, typecode, _) in NUMERIC_COLUMNS.items()
+        }
+        self.categorical: Dict[str, Categorical] = {name: Categorical() for name in CATEGORICAL_COLUMNS}
+
+    @classmethod
+    def from_trades(cls, trades: Iterable[Dict[str, Any]]) -> "TradeTable":
+        table = cls()
+        table.extend(trades)
+        return table
+
+    def append(self, trade: Dict[str, Any]):
+        for name, (field, convert, _, _) in NUMERIC_COLUMNS.items():
+            self.numeric[name].append(convert(trade.get(field)))
+        for name, column in self.categorical.items():
+            column.append(trade.get(name))
+
+    def extend(self, trades: Iterable[Dict[str, Any]]):
+        for trade in trades:
+            self.append(trade)
+
+    def __len__(self) -> int:
+        return len(self.numeric["id"])
+
+    def row(self, i: int) -> TradeRecord:
+        values = {name: column[i] for name, column in self.numeric.items()}
+        values.update({name: column[i] for name, column in self.categorical.items()})
+        return TradeRecord(**values)
+
+    def __iter__(self) -> Iterator[TradeRecord]:
+        for i in range(len(self)):
+            yield self.row(i)
+
+    def nbytes(self) -> int:
+        """Approximate size of the column buffers."""
+        size = sum(column.itemsize * len(column) for column in self.numeric.values())
+        size += sum(column.codes.itemsize * len(column) for column in self.categorical.values())
+        return size
+
+    def to_numpy(self, decode_categoricals: bool = True) -> Dict[str, Any]:
+        """Numeric columns as zero-copy ndarrays; categoricals decoded (or raw int32 codes)."""
+        np = _require("numpy", "NumPy export")
+        result = {
+            name: np.frombuffer(self.numeric[name], dtype=dtype)
+            for name, (_, _, _, dtype) in NUMERIC_COLUMNS.items()
+        }
+        for name, column in self.categorical.items():
+            codes = np.frombuffer(column.codes, dtype="int32")
+            if decode_categoricals:
+                categories = np.array(column.categories + [None], dtype=object)
+                result[name] = categories[codes]
+            else:
+                result[name] = codes
+        return result
+
+    def to_arrow(self):
+        """pyarrow.Table; categoricals become dictionary-encoded columns."""
+        pa = _require("pyarrow", "Arrow export")
+        arrays = self.to_numpy(decode_categoricals=False)
+        columns = {name: pa.array(arrays[name]) for name in NUMERIC_COLUMNS}
+        for name, column in self.categorical.items():
+            codes = arrays[name]
+            indices = pa.array(codes, mask=codes < 0) if len(codes) and (codes < 0).any() else pa.array(codes)
+            columns[name] = pa.DictionaryArray.from_arrays(indices, pa.array(column.categories, type=pa.string()))
+        return pa.table(columns)
+
+    def to_pandas(self):
+        """pandas.DataFrame; categoricals become pandas Categorical columns."""
+        pd = _require("pandas", "pandas export")
+        arrays = self.to_numpy(decode_categoricals=False)
+        frame = {name: arrays[name] for name in NUMERIC_COLUMNS}
+        for name, column in self.categorical.items():
+            frame[name] = pd.Categorical.from_codes(arrays[name], categories=column.categories)
+        return pd.DataFrame(frame, copy=False)
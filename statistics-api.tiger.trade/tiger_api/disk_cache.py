@@ -0,0 +1,149 @@
+"""
+Tiger Trade API - Disk Cache
+
+Size-bounded key/value store on disk shared by HttpCache and ResponseCache.
+Each entry is one file holding a JSON metadata line and the body, zlib
+compressed and written atomically (temp file + rename), so several
+processes can share a directory. When the directory grows past
+`max_bytes` the least recently used entries are removed; reads bump the
+file mtime, so recency survives restarts.
+"""
+
+import json
+import os
+import tempfile
+import threading
+import time
+import zlib
+from typing import Dict, Any, Callable, List, Optional, Tuple
+
+DEFAULT_MAX_BYTES = 50 * 1024 * 1024
+COMPRESS_LEVEL = 6
+ENTRY_SUFFIX = ".entry"
+
+
+def default_cache_dir(name: str) -> str:
+    base = os.environ.get('XDG_CACHE_HOME') or os.path.join(os.path.expanduser('~'), '.cache')
+    return os.path.join(base, 'tiger_api', name)
+
+
+class DiskCache:
+    def __init__(self, directory: str, max_bytes: int = DEFAULT_MAX_BYTES,
+                 compress_level: int = COMPRESS_LEVEL, clock: Callable[[], float] = time.time):
+        self.directory = directory
+        self.max_bytes = max_bytes
+        self.compress_level = compress_level
+        self.clock = clock
+
+        self._lock = threading.Lock()
+        self._index: Optional[Dict[str, List[float]]] = None
+        self.evictions = 0
+
+    def _path(self, key: str) -> str:
+        return os.path.join(self.directory, key + ENTRY_SUFFIX)
+
+    def _load_index(self) -> Dict[str, List[float]]:
+        # key -> [size, last used]; built from the directory on first use
+        if self._index is None:
+            index = {}
+            try:
+                names = os.listdir(self.directory)
+            except FileNotFoundError:
+                names = []
+            for name in names:
+                if not name.endswith(ENTRY_SUFFIX):
+                    continue
+                try:
+                    stat = os.stat(os.path.join(self.directory, name))
+                except FileNotFoundError:
+                    continue
+                index[name[:-len(ENTRY_SUFFIX)]] = [stat.st_size, stat.st_mtime]
+            self._index = index
+        return self._index
+
+    def get(self, key: str) -> Optional[Tuple[Dict[str, Any], bytes]]:
+        """(metadata, body) stored under `key`, or None."""
+        try:
+            with open(self._path(key), 'rb') as f:
+                raw = f.read()
+        except FileNotFoundError:
+            with self._lock:
+                self._load_index().pop(key, None)
+            return None
+        try:
+            meta, _, body = zlib.decompress(raw).partition(b'\n')
+            return json.loads(meta), body
+        except (zlib.error, ValueError):
+            self.remove(key)
+            return None
+
+    def set(self, key: str, meta: Dict[str, Any], body: bytes) -> bool:
+        """Store an entry; False when it alone would exceed max_bytes."""
+        data = zlib.compress(json.dumps(meta, separators=(',', ':')).encode() + b'\n' + body,
+                             self.compress_level)
+        if len(data) > self.max_bytes:
+            return False
+        os.makedirs(self.directory, mode=0o700, exist_ok=True)
+        fd, tmp_path = tempfile.mkstemp(prefix='.entry-', suffix='.tmp', dir=self.directory)
+        try:
+            with os.fdopen(fd, 'wb') as f:
+                f.write(data)
+            os.replace(tmp_path, self._path(key))
+        except BaseException:
+            try:
+                os.unlink(tmp_path)
+            except OSError:
+                pass
+            raise
+        with self._lock:
+            self._load_index()[key] = [len(data), self.clock()]
+            self._evict()
+        return True
+
+    def touch(self, key: str):
+        now = self.clock()
+        try:
+            os.utime(self._path(key), (now, now))
+        except OSError:
+            pass
+        with self._lock:
+            entry = self._load_index().get(key)
+            if entry is not None:
+                entry[1] = now
+
+    def remove(self, key: str):
+        try:
+            os.unlink(self._path(key))
+        except FileNotFoundError:
+            pass
+        with self._lock:
+            self._load_index().pop(key, None)
+
+    def _evict(self):
+        index = self._index
+        total = sum(size for size, _ in index.values())
+        for key, (size, _) in sorted(index.items(), key=lambda item: item[1][1]):
+            if total <= self.max_bytes:
+                break
+            try:
+                os.unlink(self._path(key))
+            except FileNotFoundError:
+                pass
+            del index[key]
+            total -= size
+            self.evictions += 1
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            index = self._load_index()
+            return {
+                "entries": len(index),
+                "bytes": sum(size for size, _ in index.values()),
+                "evictions": self.evictions,
+            }
+
+    def clear(self):
+        with self._lock:
+            keys = list(self._load_index())
+        for key in keys:
+            self.remove(key)
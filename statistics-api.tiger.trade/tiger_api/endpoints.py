@@ -0,0 +1,409 @@
+"""
+Tiger Trade API - Endpoint Groups
+
+Namespaces attached to a TigerTradeClient (client.trades, client.analyzer,
+...). They hold no session, token or config of their own; every request
+goes through the owning client. The per-script classes (TradesAPI,
+AnalyzerAPI, ...) subclass these groups, so scripts keep their names and
+methods while sharing one client per config file.
+
+Thread pools, range caching, week indexing and typed records are imported
+where they are used, keeping `import trades` to the modules a plain request
+needs. Fan-out methods run under one span whose context the pool threads
+inherit (see tracing.py).
+"""
+
+import threading
+from typing import TYPE_CHECKING, Dict, Any, Iterable, Iterator, List, Optional, Tuple, Union
+
+from .exceptions import TigerTradeAPIException
+from .pagination import iter_pages, fetch_pages
+from .streaming import ItemStream
+from .tracing import bind, span
+
+if TYPE_CHECKING:
+    from .records import Summary, Trade, Week
+    from .week_index import WeekIndex
+
+# Largest items_per_page accepted by /trades
+TRADES_MAX_ITEMS_PER_PAGE = 100
+# Orders of trades in these statuses never change and are cached
+CLOSED_TRADE_STATUSES = {"closed"}
+DEFAULT_SORT_BY = "id"
+DEFAULT_SORT_ORDER = "desc"
+
+# The analyzer is served by the web gateway and expects browser-like headers
+ANALYZER_URL = "https://trade-web-gtw.tiger.trade/statistics-gtw/protected/api/v1/statistics/proxy/api/v2/analyzer"
+ANALYZER_HEADERS = {
+    'Accept': 'application/json, text/plain, */*',
+    'Accept-Language': 'en-GB,en-US;q=0.9,en;q=0.8,ru;q=0.7',
+    'User-Agent': 'Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/137.0.0.0 Safari/537.36',
+    'Origin': 'https://account.tiger.com',
+    'Referer': 'https://account.tiger.com/',
+    'Sec-Ch-Ua': '"Google Chrome";v="137", "Chromium";v="137", "Not/A)Brand";v="24"',
+    'Sec-Ch-Ua-Mobile': '?0',
+    'Sec-Ch-Ua-Platform': '"macOS"',
+    'Sec-Fetch-Dest': 'empty',
+    'Sec-Fetch-Mode': 'cors',
+    'Sec-Fetch-Site': 'cross-site',
+    'X-Exchange-Type': 'TIGER_X',
+}
+
+
+def _sort_key(value: Any):
+    # Numbers (including numeric strings) before text; missing values sort as lowest
+    if value is None:
+        return (0, 0.0, "")
+    try:
+        return (1, float(value), "")
+    except (TypeError, ValueError):
+        return (2, 0.0, str(value))
+
+
+def _page_size(page_size: Optional[int], filters: Dict[str, Any]) -> int:
+    """Page size for the all-pages helpers; takes items_per_page out of `filters`."""
+    if 'page' in filters:
+        raise TypeError("page cannot be set when iterating over all pages; use get_trades for a single page")
+    items_per_page = filters.pop('items_per_page', None)
+    if page_size is not None and items_per_page is not None and page_size != items_per_page:
+        raise TypeError("page_size and items_per_page disagree; pass one of them")
+    return min(page_size or items_per_page or TRADES_MAX_ITEMS_PER_PAGE, TRADES_MAX_ITEMS_PER_PAGE)
+
+
+class Endpoints:
+    def __init__(self, client: Any):
+        self.client = client
+
+    @property
+    def config_path(self) -> str:
+        return self.client.config_path
+
+    @property
+    def config(self) -> Dict[str, Any]:
+        return self.client.config
+
+    @property
+    def transport(self) -> Any:
+        return self.client.transport
+
+    @property
+    def tokens(self) -> Any:
+        return self.client.tokens
+
+    def _make_request(self, method: str, endpoint: str, params: Optional[Dict] = None,
+                      data: Optional[Dict] = None, **kwargs) -> Dict[str, Any]:
+        return self.client._make_request(method, endpoint, params=params, data=data, **kwargs)
+
+    def _stream_request(self, method: str, endpoint: str, params: Optional[Dict] = None,
+                        key: str = 'data', **kwargs) -> ItemStream:
+        return self.client._stream_request(method, endpoint, params=params, key=key, **kwargs)
+
+    def _decode_request(self, method: str, endpoint: str, record: type, many: bool = True,
+                        params: Optional[Dict] = None, **kwargs) -> Tuple[Any, Dict[str, Any]]:
+        return self.client._decode_request(method, endpoint, record, many, params=params, **kwargs)
+
+
+class TradesEndpoints(Endpoints):
+    default_sort_by = DEFAULT_SORT_BY
+    default_sort_order = DEFAULT_SORT_ORDER
+
+    def __init__(self, client: Any):
+        super().__init__(client)
+        self._closed_orders: Dict[Any, Dict[str, Any]] = {}
+        self._closed_orders_lock = threading.Lock()
+
+    def _trades_params(self, page: int, items_per_page: int, filters: Dict[str, Any]) -> Dict[str, Any]:
+        params = {
+            "page": page,
+            "items_per_page": items_per_page,
+            "sort_by": self.default_sort_by,
+            "sort_order": self.default_sort_order
+        }
+
+        for key, value in filters.items():
+            if value is not None:
+                params[key] = value
+        return params
+
+    def get_trades(self, page: int = 1, items_per_page: int = 20, **filters) -> Dict[str, Any]:
+        return self._make_request("GET", "/trades", params=self._trades_params(page, items_per_page, filters))
+
+    def stream_trades(self, page: int = 1, items_per_page: int = 20, **filters) -> ItemStream:
+        """Trades of one /trades page, decoded one by one as the body arrives; `total` is in .meta."""
+        return self._stream_request("GET", "/trades", params=self._trades_params(page, items_per_page, filters))
+
+    def get_trade_records(self, page: int = 1, items_per_page: int = 20,
+                          **filters) -> Tuple[List["Trade"], Dict[str, Any]]:
+        """One /trades page decoded into Trade records: (trades, {"total": ...})."""
+        from .records import Trade
+        return self._decode_request("GET", "/trades", Trade,
+                                    params=self._trades_params(page, items_per_page, filters))
+
+    def iter_trades(self, page_size: Optional[int] = None, prefetch: int = 2, **filters) -> Iterator[Dict[str, Any]]:
+        """Yield trades across all pages, fetching the next pages in the background.
+
+        page_size (or items_per_page, as get_trades calls it) defaults to and is
+        capped at TRADES_MAX_ITEMS_PER_PAGE.
+        """
+        items_per_page = _page_size(page_size, filters)
+
+        def fetch_page(page: int) -> Dict[str, Any]:
+            return self.get_trades(page=page, items_per_page=items_per_page, **filters)
+
+        for result in iter_pages(fetch_page, items_per_page, prefetch=prefetch):
+            for trade in result.get('data') or []:
+                yield trade
+
+    def fetch_all_trades(self, filters: Optional[Dict[str, Any]] = None, workers: int = 4,
+                         page_size: Optional[int] = None) -> Dict[str, Any]:
+        """Fetch every page of /trades in parallel and return {'data': [...], 'total': N}.
+
+        Pages are requested concurrently (still under the shared rate limiter)
+        once the first page reports `total`. New trades shift pages mid-scan:
+        the pages past the announced last one are followed up, trades seen
+        twice are deduplicated by id (trades without an id are kept as they
+        are) and the result is re-sorted by the requested sort_by/sort_order.
+        """
+        filters = {key: value for key, value in (filters or {}).items() if value is not None}
+        items_per_page = _page_size(page_size, filters)
+        sort_by = filters.get('sort_by', self.default_sort_by)
+        sort_order = filters.get('sort_order', self.default_sort_order)
+
+        def fetch_page(page: int) -> Dict[str, Any]:
+            return self.get_trades(page=page, items_per_page=items_per_page, **filters)
+
+        trades = []
+        seen_ids = set()
+        for result in fetch_pages(fetch_page, items_per_page, workers=workers):
+            for trade in result.get('data') or []:
+                trade_id = trade.get('id')
+                if trade_id is not None:
+                    if trade_id in seen_ids:
+                        continue
+                    seen_ids.add(trade_id)
+                trades.append(trade)
+
+        data = sorted(trades, key=lambda trade: _sort_key(trade.get(sort_by)),
+                      reverse=sort_order == "desc")
+        return {'data': data, 'total': len(data)}
+
+    def get_categories(self) -> Dict[str, Any]:
+        return self._make_request("GET", "/trades/categories")
+
+    def get_trade_orders(self, trade_id: int) -> Dict[str, Any]:
+        return self._make_request("GET", f"/trades/{trade_id}/orders")
+
+    def get_orders_for_trades(self, trades: Iterable[Union[int, Dict[str, Any]]],
+                              workers: int = 4) -> Dict[Any, Dict[str, Any]]:
+        """Fetch /trades/{id}/orders for many trades concurrently, keyed by trade id.
+
+        `trades` may hold ids or trade dicts; orders of trades whose status is
+        closed are cached and served without a request on later calls. A
+        failed id maps to {"error": ...} instead of aborting the batch.
+        """
+        closed_ids = set()
+        # Insertion-ordered set: keeps the first occurrence of each id
+        trade_ids: Dict[Any, None] = {}
+        for trade in trades:
+            if isinstance(trade, dict):
+                trade_id = trade.get('id')
+                if str(trade.get('status', '')).lower() in CLOSED_TRADE_STATUSES:
+                    closed_ids.add(trade_id)
+            else:
+                trade_id = trade
+            trade_ids[trade_id] = None
+
+        results: Dict[Any, Dict[str, Any]] = {}
+        with self._closed_orders_lock:
+            for trade_id in trade_ids:
+                if trade_id in self._closed_orders:
+                    results[trade_id] = self._closed_orders[trade_id]
+
+        def fetch(trade_id: Any) -> Dict[str, Any]:
+            try:
+                return self.get_trade_orders(trade_id)
+            except TigerTradeAPIException as e:
+                return {"error": str(e)}
+
+        missing = [trade_id for trade_id in trade_ids if trade_id not in results]
+        from concurrent.futures import ThreadPoolExecutor
+        with span("tiger_api.get_orders_for_trades", {"tiger_api.trades": len(trade_ids),
+                                                      "tiger_api.requests": len(missing)}):
+            with ThreadPoolExecutor(max_workers=max(1, workers), thread_name_prefix="tiger-api-orders") as executor:
+                for trade_id, result in zip(missing, executor.map(bind(fetch), missing)):
+                    results[trade_id] = result
+                    if trade_id in closed_ids and 'error' not in result:
+                        with self._closed_orders_lock:
+                            self._closed_orders[trade_id] = result
+
+        return {trade_id: results[trade_id] for trade_id in trade_ids}
+
+    def close_trade(self, trade_id: int) -> Dict[str, Any]:
+        return self._make_request("POST", f"/trades/{trade_id}/close")
+
+
+class AnalyzerEndpoints(Endpoints):
+    # Used when a call passes no range / keys; scripts override these
+    default_open_between: Optional[str] = None
+    default_api_key_ids: Optional[List[int]] = None
+
+    def __init__(self, client: Any):
+        super().__init__(client)
+        from .range_cache import RangeCache
+        self.url = self.config['api'].get('analyzer_url', ANALYZER_URL)
+        # Whole ISO weeks plus day edges: a month is about 4 buckets instead of 30
+        self.range_cache = RangeCache(bucket="week")
+        # X-Request-Id / Trace-Request-Id are set per request by the transport
+        self.headers = dict(ANALYZER_HEADERS)
+
+    def _resolve_range(self, open_between: Optional[str],
+                       api_key_ids: Optional[List[int]]) -> Tuple[str, Optional[List[int]]]:
+        open_between = open_between or self.default_open_between
+        api_key_ids = api_key_ids if api_key_ids is not None else self.default_api_key_ids
+        if not open_between:
+            raise TigerTradeAPIException("open_between is required (YYYY-MM-DD,YYYY-MM-DD)")
+        return open_between, api_key_ids
+
+    @staticmethod
+    def _summary_params(open_between: str, api_key_ids: Optional[List[int]]) -> Dict[str, Any]:
+        params = {"openBetween": open_between}
+        if api_key_ids:
+            params['api_key_id'] = api_key_ids
+        return params
+
+    def _fetch_summary(self, open_between: str, api_key_ids: Optional[List[int]]) -> Dict[str, Any]:
+        return self._make_request("GET", "/analyzer", params=self._summary_params(open_between, api_key_ids),
+                                  url=self.url, headers=self.headers)
+
+    def get_trading_summary(self, open_between: Optional[str] = None, api_key_ids: Optional[List[int]] = None,
+                            cached: bool = False) -> Dict[str, Any]:
+        """Pass cached=True to serve the range from per-day buckets (see RangeCache)."""
+        open_between, api_key_ids = self._resolve_range(open_between, api_key_ids)
+
+        if cached:
+            scope = tuple(sorted(api_key_ids)) if api_key_ids else None
+            return self.range_cache.get(
+                open_between, lambda value: self._fetch_summary(value, api_key_ids), scope=scope)
+        return self._fetch_summary(open_between, api_key_ids)
+
+    def get_summary_by_keys(self, api_key_ids: Optional[List[int]] = None, open_between: Optional[str] = None,
+                            workers: int = 4, cached: bool = False) -> Dict[str, Any]:
+        """Per-key summaries plus a combined total: {"keys": {id: result}, "total": result}.
+
+        Keys are queried concurrently. The total is merged from the per-key
+        results when every metric is additive and no key failed; otherwise it
+        costs one extra query with all keys. A failed key maps to {"error": ...}.
+        """
+        api_key_ids = list(api_key_ids or self.default_api_key_ids or [])
+        open_between = open_between or self.default_open_between
+
+        def fetch(key_id: int) -> Dict[str, Any]:
+            try:
+                return self.get_trading_summary(open_between=open_between, api_key_ids=[key_id], cached=cached)
+            except TigerTradeAPIException as e:
+                return {"error": str(e)}
+
+        from concurrent.futures import ThreadPoolExecutor
+        from .range_cache import merge_summaries
+        with span("tiger_api.get_summary_by_keys", {"tiger_api.keys": len(api_key_ids)}):
+            with ThreadPoolExecutor(max_workers=max(1, workers), thread_name_prefix="tiger-api-keys") as executor:
+                per_key = dict(zip(api_key_ids, executor.map(bind(fetch), api_key_ids)))
+
+            total = None
+            if not any('error' in result for result in per_key.values()):
+                total = merge_summaries(list(per_key.values()), open_between)
+            if total is None:
+                try:
+                    total = self.get_trading_summary(open_between=open_between, api_key_ids=api_key_ids,
+                                                     cached=cached)
+                except TigerTradeAPIException as e:
+                    total = {"error": str(e)}
+
+        return {"keys": per_key, "total": total}
+
+    def get_summary_record(self, open_between: Optional[str] = None,
+                           api_key_ids: Optional[List[int]] = None) -> Optional["Summary"]:
+        """The /analyzer summary decoded into a Summary record (not range-cached)."""
+        from .records import Summary
+        open_between, api_key_ids = self._resolve_range(open_between, api_key_ids)
+        summary, _ = self._decode_request("GET", "/analyzer", Summary, many=False,
+                                          params=self._summary_params(open_between, api_key_ids),
+                                          url=self.url, headers=self.headers)
+        return summary
+
+    def get_today_stats(self, api_key_ids: Optional[List[int]] = None) -> Dict[str, Any]:
+        # The server's openBetween days, and the range cache's open day, are UTC
+        from .range_cache import utc_today
+        today = utc_today().isoformat()
+        return self.get_trading_summary(open_between=f"{today},{today}", api_key_ids=api_key_ids, cached=True)
+
+    def get_week_list(self, api_key_id: Optional[List[int]] = None) -> Dict[str, Any]:
+        params = {}
+        if api_key_id:
+            params["api_key_id"] = api_key_id
+        return self._make_request("GET", "/analyzer/week-list", params=params)
+
+    def get_week_records(self, api_key_id: Optional[List[int]] = None) -> List["Week"]:
+        """The week list decoded into Week records (`from` is `week.from_`)."""
+        from .records import Week
+        params = {}
+        if api_key_id:
+            params["api_key_id"] = api_key_id
+        weeks, _ = self._decode_request("GET", "/analyzer/week-list", Week, params=params)
+        return weeks
+
+    def get_week_index(self, api_key_id: Optional[List[int]] = None) -> "WeekIndex":
+        """Week list parsed once for date lookups and multi-week range stats."""
+        from .week_index import WeekIndex
+        return WeekIndex.from_response(self.get_week_list(api_key_id))
+
+
+class DashboardEndpoints(Endpoints):
+    def get_dashboard_stats(self, period: str = "month", timezone: str = "UTC") -> Dict[str, Any]:
+        params = {"period": period, "timezone": timezone}
+        return self._make_request("GET", "/dashboard/stats", params=params)
+
+    def get_dashboard_charts(self, period: str = "month") -> Dict[str, Any]:
+        params = {"period": period}
+        return self._make_request("GET", "/dashboard/charts", params=params)
+
+    def get_notifications(self, page: int = 1, items_per_page: int = 20, unread_only: bool = False) -> Dict[str, Any]:
+        params = {"page": page, "items_per_page": items_per_page, "unread_only": unread_only}
+        return self._make_request("GET", "/dashboard/notifications", params=params)
+
+
+class UsersEndpoints(Endpoints):
+    def get_users(self, page: int = 1, items_per_page: int = 20, **filters) -> Dict[str, Any]:
+        params = {"page": page, "items_per_page": items_per_page}
+
+        for key, value in filters.items():
+            if value is not None:
+                params[key] = value
+
+        return self._make_request("GET", "/users", params=params)
+
+    def get_current_user(self) -> Dict[str, Any]:
+        return self._make_request("GET", "/users/me")
+
+    def get_user_stats(self, user_id: Optional[int] = None, period: str = "month") -> Dict[str, Any]:
+        params = {"period": period}
+        endpoint = f"/users/{user_id}/stats" if user_id else "/users/me/stats"
+        return self._make_request("GET", endpoint, params=params)
+
+
+class ExchangesEndpoints(Endpoints):
+    def get_exchanges(self, active_only: bool = True, with_stats: bool = True) -> Dict[str, Any]:
+        params = {"active_only": active_only, "with_stats": with_stats}
+        return self._make_request("GET", "/exchanges", params=params)
+
+    def get_exchange_symbols(self, exchange_id: int, active_only: bool = True) -> Dict[str, Any]:
+        params = {"active_only": active_only}
+        return self._make_request("GET", f"/exchanges/{exchange_id}/symbols", params=params)
+
+    def stream_exchange_symbols(self, exchange_id: int, active_only: bool = True) -> ItemStream:
+        """Symbols of an exchange, decoded one by one as the body arrives."""
+        params = {"active_only": active_only}
+        return self._stream_request("GET", f"/exchanges/{exchange_id}/symbols", params=params)
+
+    def get_exchange_stats(self, exchange_id: int) -> Dict[str, Any]:
+        return self._make_request("GET", f"/exchanges/{exchange_id}/stats")
@@ -0,0 +1,7 @@
+"""
+Tiger Trade API - Exceptions
+"""
+
+
+class TigerTradeAPIException(Exception):
+    pass
@@ -0,0 +1,122 @@
+"""
+Tiger Trade API - Request Hooks
+
+Every request made through a Transport, including token probes, logins
+and refreshes, emits events to the handlers registered on `transport.hooks`:
+
+- start: before the caches are consulted;
+- retry: a transient failure is about to be retried (error_class, attempt, delay);
+- cache_hit: the response came from the HTTP cache (`cache="http"`,
+  `revalidated` when a 304 confirmed it) or the response cache (`cache="response"`);
+- end: the logical request finished (status or error, elapsed seconds over
+  all attempts, attempts, wire/decoded body bytes). Streamed responses end
+  when the stream is closed;
+- token_refresh: the token manager went to the auth API (reason
+  "missing", "expired" or "rejected" by a 401; elapsed, error).
+
+Handlers get one dict per event with `event`, `id` (shared by the events of
+one request), `request_id` (the UUID sent to the gateway), `span` (its
+OpenTelemetry span or None), `method`, `url` and `template`
+(`/trades/{id}/orders`). They run on the requesting thread, so they should
+be cheap; an exception in a handler is reported and does not fail the
+request.
+"""
+
+import itertools
+import threading
+import time
+from typing import Dict, Any, Callable, List, Optional
+from urllib.parse import urlsplit
+
+from .bandwidth import endpoint_template, response_bytes
+
+EVENTS = ("start", "end", "retry", "cache_hit", "token_refresh")
+
+Handler = Callable[[Dict[str, Any]], None]
+
+
+class Hooks:
+    def __init__(self, base_url: str = ""):
+        # Templates are reported relative to the API base path, as by BandwidthMeter
+        self.base_path = urlsplit(base_url).path
+        self._handlers: Dict[str, List[Handler]] = {event: [] for event in EVENTS}
+        self._lock = threading.Lock()
+        self._ids = itertools.count(1)
+
+    @classmethod
+    def from_config(cls, api_config: Dict[str, Any]) -> "Hooks":
+        return cls(**cls.options_from_config(api_config))
+
+    @staticmethod
+    def options_from_config(api_config: Dict[str, Any]) -> Dict[str, Any]:
+        return {"base_url": api_config.get('base_url', '')}
+
+    def on(self, event: str, handler: Optional[Handler] = None):
+        """Register `handler` for `event`; without a handler, return a decorator."""
+        if event not in self._handlers:
+            raise ValueError(f"Unknown event {event!r}, expected one of {', '.join(EVENTS)}")
+        if handler is None:
+            return lambda func: self.on(event, func)
+        # Lists are replaced, never mutated, so emit() reads them without the lock
+        with self._lock:
+            self._handlers[event] = self._handlers[event] + [handler]
+        return handler
+
+    def off(self, event: str, handler: Handler):
+        with self._lock:
+            self._handlers[event] = [h for h in self._handlers[event] if h != handler]
+
+    def subscribe(self, listener: Any) -> Any:
+        """Register the `on_<event>` methods `listener` defines."""
+        for event in EVENTS:
+            handler = getattr(listener, f"on_{event}", None)
+            if handler is not None:
+                self.on(event, handler)
+        return listener
+
+    def unsubscribe(self, listener: Any):
+        for event in EVENTS:
+            handler = getattr(listener, f"on_{event}", None)
+            if handler is not None:
+                self.off(event, handler)
+
+    def emit(self, event: str, context: Optional[Dict[str, Any]] = None, **fields):
+        handlers = self._handlers[event]
+        if not handlers:
+            return
+        payload = dict(context or {}, event=event, **fields)
+        for handler in handlers:
+            try:
+                handler(payload)
+            except Exception as e:
+                print(f"Warning: {event} hook {handler!r} failed: {e!r}")
+
+    def start(self, method: str, url: str, **fields) -> Dict[str, Any]:
+        """Emit `start` and return the context the request's later events carry (plus `fields`)."""
+        context = {
+            "id": next(self._ids),
+            "method": method.upper(),
+            "url": url,
+            "template": endpoint_template(url, self.base_path),
+            "started": time.perf_counter(),
+            "attempts": 0,
+            **fields,
+        }
+        self.emit("start", context)
+        return context
+
+    def end(self, context: Dict[str, Any], response: Any = None, error: Optional[BaseException] = None,
+            decoded_bytes: Optional[int] = None):
+        """Emit `end` for a request; `decoded_bytes` is required once a stream has been iterated."""
+        if not self._handlers["end"]:
+            return
+        counted = response_bytes(response, decoded_bytes) if response is not None else None
+        self.emit(
+            "end", context,
+            status=getattr(response, 'status_code', None),
+            error=error,
+            elapsed=time.perf_counter() - context["started"],
+            from_cache=getattr(response, 'from_cache', False),
+            wire_bytes=counted[0] if counted else None,
+            decoded_bytes=counted[1] if counted else None,
+        )
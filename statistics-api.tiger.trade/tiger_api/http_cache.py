@@ -0,0 +1,210 @@
+"""
+Tiger Trade API - HTTP Cache
+
+Conditional-request cache for slow-changing GET endpoints (/trades/categories,
+/exchanges, /exchanges/{id}/symbols, /analyzer/week-list). Bodies are kept in
+a DiskCache together with their ETag / Last-Modified validators:
+
+- within the endpoint's TTL the cached body is returned without a request;
+- after that the request carries If-None-Match / If-Modified-Since and a
+  304 is answered from the cached body, so only headers cross the wire.
+
+Entries are scoped by the token subject, so accounts never see each other's
+data, and the directory is kept under `max_bytes`. A week-list TTL of 0
+means "always revalidate": past weeks never change, but the list also
+carries the current week.
+"""
+
+import json
+import re
+import threading
+import time
+from typing import Dict, Any, Callable, Optional
+from urllib.parse import urlsplit
+
+from .claims import jwt_subject
+from .disk_cache import DiskCache, DEFAULT_MAX_BYTES, default_cache_dir
+from .serialization import loads
+
+# Seconds a stored body is served without revalidation; endpoints not listed are not cached
+DEFAULT_TTLS = {
+    "/trades/categories": 300,
+    "/exchanges": 300,
+    "/exchanges/*/symbols": 300,
+    "/analyzer/week-list": 0,
+}
+# Response headers kept with the body, under these spellings
+STORED_HEADERS = ("Content-Type", "ETag", "Last-Modified", "Cache-Control", "Date")
+
+
+def _endpoint_pattern(endpoint: str):
+    # "/exchanges/*/symbols" -> matches the end of the URL path, one segment per "*"
+    segments = [r'[^/]+' if part == '*' else re.escape(part) for part in endpoint.strip('/').split('/')]
+    return re.compile(r'(^|/)' + '/'.join(segments) + r'/?$')
+
+
+def cache_scope(headers: Optional[Dict[str, str]]) -> str:
+    """Account a request is made for: the token subject, else a hash of the token."""
+    authorization = (headers or {}).get('Authorization', '')
+    if not authorization:
+        return "anonymous"
+    token = authorization.split(' ', 1)[-1]
+    import hashlib
+    return jwt_subject(token) or hashlib.sha256(token.encode()).hexdigest()[:16]
+
+
+def request_key(method: str, url: str, params: Any = None, scope: str = "") -> str:
+    """Stable key for a request: params are sorted and None values dropped."""
+    items = params.items() if isinstance(params, dict) else (params or [])
+    normalized = sorted(
+        (str(key), [str(v) for v in value] if isinstance(value, (list, tuple)) else str(value))
+        for key, value in items if value is not None
+    )
+    raw = json.dumps([method.upper(), url, normalized, scope], separators=(',', ':'))
+    import hashlib
+    return hashlib.sha256(raw.encode()).hexdigest()
+
+
+class CachedResponse:
+    """The parts of requests.Response that callers use, rebuilt from a stored body.
+
+    Building one does not import requests, so fully cached runs never load it.
+    """
+
+    from_cache = True
+    request = None
+
+    def __init__(self, url: str, status_code: int, headers: Dict[str, str], content: bytes,
+                 encoding: Optional[str] = None):
+        self.url = url
+        self.status_code = status_code
+        self.headers = headers
+        self.content = content
+        self.encoding = encoding
+
+    @property
+    def ok(self) -> bool:
+        return self.status_code < 400
+
+    @property
+    def text(self) -> str:
+        return self.content.decode(self.encoding or 'utf-8', errors='replace')
+
+    def json(self, **kwargs) -> Any:
+        # Keyword arguments are stdlib json.loads options
+        return json.loads(self.content, **kwargs) if kwargs else loads(self.content)
+
+    def close(self):
+        pass
+
+
+def cached_response(url: str, meta: Dict[str, Any], body: bytes) -> CachedResponse:
+    return CachedResponse(url, meta.get('status', 200), dict(meta.get('headers', {})), body, meta.get('encoding'))
+
+
+class HttpCache:
+    def __init__(self, directory: Optional[str] = None, max_bytes: int = DEFAULT_MAX_BYTES,
+                 ttls: Optional[Dict[str, Optional[float]]] = None,
+                 clock: Callable[[], float] = time.time):
+        self.disk = DiskCache(directory or default_cache_dir('http'), max_bytes, clock=clock)
+        self.clock = clock
+
+        rules = dict(DEFAULT_TTLS)
+        rules.update(ttls or {})
+        # Longest endpoint first; a None TTL switches caching off for that endpoint
+        self.rules = [
+            (_endpoint_pattern(endpoint), ttl)
+            for endpoint, ttl in sorted(rules.items(), key=lambda item: -len(item[0]))
+        ]
+
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.revalidated = 0
+        self.misses = 0
+
+    @classmethod
+    def from_config(cls, api_config: Dict[str, Any]) -> Optional["HttpCache"]:
+        options = cls.options_from_config(api_config)
+        if options is None:
+            return None
+        return cls(**options)
+
+    @staticmethod
+    def options_from_config(api_config: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+        cache_config = api_config.get('http_cache', {})
+        if cache_config is False:
+            return None
+        cache_config = cache_config or {}
+        if cache_config.get('enabled', True) is False:
+            return None
+        return {
+            "directory": cache_config.get('directory'),
+            "max_bytes": cache_config.get('max_bytes', DEFAULT_MAX_BYTES),
+            "ttls": cache_config.get('ttl'),
+        }
+
+    def ttl_for(self, url: str) -> Optional[float]:
+        path = urlsplit(url).path
+        for pattern, ttl in self.rules:
+            if pattern.search(path):
+                return ttl
+        return None
+
+    def request(self, url: str, params: Any, headers: Optional[Dict[str, str]],
+                send: Callable[[Dict[str, str]], Any]) -> Any:
+        """GET `url` through the cache; `send(headers)` performs the real request."""
+        ttl = self.ttl_for(url)
+        if ttl is None:
+            return send(headers)
+
+        key = request_key('GET', url, params, cache_scope(headers))
+        cached = self.disk.get(key)
+        if cached is not None:
+            meta, body = cached
+            if self.clock() - meta['stored_at'] < ttl:
+                self.disk.touch(key)
+                with self._lock:
+                    self.hits += 1
+                return cached_response(url, meta, body)
+
+        request_headers = dict(headers or {})
+        if cached is not None:
+            stored_headers = cached[0].get('headers', {})
+            if stored_headers.get('ETag'):
+                request_headers['If-None-Match'] = stored_headers['ETag']
+            if stored_headers.get('Last-Modified'):
+                request_headers['If-Modified-Since'] = stored_headers['Last-Modified']
+
+        response = send(request_headers)
+
+        if response.status_code == 304 and cached is not None:
+            meta, body = cached
+            for name in STORED_HEADERS:
+                if name in response.headers:
+                    meta.setdefault('headers', {})[name] = response.headers[name]
+            meta['stored_at'] = self.clock()
+            self.disk.set(key, meta, body)
+            with self._lock:
+                self.revalidated += 1
+            return cached_response(url, meta, body)
+
+        with self._lock:
+            self.misses += 1
+        if response.status_code == 200 and 'no-store' not in response.headers.get('Cache-Control', ''):
+            meta = {
+                "url": url,
+                "stored_at": self.clock(),
+                "encoding": response.encoding,
+                "headers": {name: response.headers[name] for name in STORED_HEADERS if name in response.headers},
+            }
+            self.disk.set(key, meta, response.content)
+        return response
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            stats = {"hits": self.hits, "revalidated": self.revalidated, "misses": self.misses}
+        stats.update(self.disk.stats())
+        return stats
+
+    def clear(self):
+        self.disk.clear()
@@ -0,0 +1,32 @@
+"""
+Tiger Trade API - Lazy Imports
+
+Heavy modules (requests, numpy) are bound at import time but only loaded
+when an attribute is first used, so importing a script or the package
+does not pay for them.
+"""
+
+import importlib.util
+import sys
+from types import ModuleType
+from typing import Optional
+
+
+def lazy_import(name: str) -> Optional[ModuleType]:
+    """Module proxy that executes on first attribute access; None if not installed."""
+    module = sys.modules.get(name)
+    if module is not None:
+        return module
+    try:
+        spec = importlib.util.find_spec(name)
+    except ModuleNotFoundError:
+        # "package.module" whose package is not installed
+        return None
+    if spec is None:
+        return None
+    loader = importlib.util.LazyLoader(spec.loader)
+    spec.loader = loader
+    module = importlib.util.module_from_spec(spec)
+    sys.modules[name] = module
+    loader.exec_module(module)
+    return module
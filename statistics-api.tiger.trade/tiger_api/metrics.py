@@ -0,0 +1,224 @@
+"""
+Tiger Trade API - Request Metrics
+
+MetricsCollector listens to a transport's hooks and keeps, per method and
+endpoint template (`GET /trades/{id}/orders`, not raw URLs):
+
+- a latency histogram with HdrHistogram-style log-linear buckets, so
+  p50/p95/p99 are within 1% of the exact value at any scale while memory
+  stays bounded by the number of distinct buckets, not of requests;
+- response counts by status code ("error" when no response arrived);
+- wire and decoded body bytes, retries by error class and cache hits.
+
+stats() returns a JSON-ready dict, to_json() dumps it and to_prometheus()
+renders the Prometheus text exposition format, with latencies as summaries.
+"""
+
+import math
+import threading
+from collections import Counter
+from typing import Dict, Any, Iterable, List, Optional, Tuple
+
+from .serialization import dumps
+
+DEFAULT_QUANTILES = (0.5, 0.95, 0.99)
+# Buckets above 2**8 us span under 1/128 of their values
+SUB_BUCKET_BITS = 8
+PROMETHEUS_PREFIX = "tiger_api"
+
+
+class LatencyHistogram:
+    """Durations in microseconds, bucketed log-linearly like HdrHistogram."""
+
+    def __init__(self, sub_bucket_bits: int = SUB_BUCKET_BITS):
+        self.sub_bucket_bits = sub_bucket_bits
+        self.counts: Counter = Counter()
+        self.count = 0
+        self.total = 0
+        self.min: Optional[int] = None
+        self.max: Optional[int] = None
+
+    def _index(self, value: int) -> int:
+        # Values below 2**bits get one bucket each; above, each power of two is
+        # split into 2**(bits-1) buckets
+        shift = max(0, value.bit_length() - self.sub_bucket_bits)
+        return (shift << self.sub_bucket_bits) + (value >> shift)
+
+    def _highest_equivalent(self, index: int) -> int:
+        shift = index >> self.sub_bucket_bits
+        sub_bucket = index & ((1 << self.sub_bucket_bits) - 1)
+        return ((sub_bucket + 1) << shift) - 1
+
+    def record(self, seconds: float):
+        value = max(0, int(seconds * 1e6))
+        self.counts[self._index(value)] += 1
+        self.count += 1
+        self.total += value
+        self.min = value if self.min is None else min(self.min, value)
+        self.max = value if self.max is None else max(self.max, value)
+
+    def percentile(self, quantile: float) -> Optional[float]:
+        """Seconds at or below which `quantile` of the recorded values fall."""
+        if not self.count:
+            return None
+        rank = max(1, math.ceil(quantile * self.count))
+        seen = 0
+        for index in sorted(self.counts):
+            seen += self.counts[index]
+            if seen >= rank:
+                return min(self._highest_equivalent(index), self.max) / 1e6
+        return self.max / 1e6
+
+    def summary(self, quantiles: Iterable[float] = DEFAULT_QUANTILES) -> Dict[str, Any]:
+        summary = {
+            "count": self.count,
+            "mean": round(self.total / self.count / 1e6, 6) if self.count else None,
+            "min": self.min / 1e6 if self.count else None,
+            "max": self.max / 1e6 if self.count else None,
+        }
+        for quantile in quantiles:
+            summary[_quantile_name(quantile)] = self.percentile(quantile)
+        return summary
+
+
+def _quantile_name(quantile: float) -> str:
+    # 0.5 -> p50, 0.999 -> p99.9
+    return f"p{quantile * 100:g}"
+
+
+class MetricsCollector:
+    def __init__(self, quantiles: Iterable[float] = DEFAULT_QUANTILES):
+        self.quantiles = tuple(quantiles)
+        self._lock = threading.Lock()
+        self._endpoints: Dict[Tuple[str, str], Dict[str, Any]] = {}
+        self._token_refreshes: Counter = Counter()
+
+    @classmethod
+    def from_config(cls, api_config: Dict[str, Any]) -> Optional["MetricsCollector"]:
+        options = cls.options_from_config(api_config)
+        if options is None:
+            return None
+        return cls(**options)
+
+    @staticmethod
+    def options_from_config(api_config: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+        metrics_config = api_config.get('metrics', {})
+        if metrics_config is False:
+            return None
+        metrics_config = metrics_config or {}
+        if metrics_config.get('enabled', True) is False:
+            return None
+        return {"quantiles": tuple(metrics_config.get('quantiles', DEFAULT_QUANTILES))}
+
+    def _endpoint(self, event: Dict[str, Any]) -> Dict[str, Any]:
+        key = (event["method"], event["template"])
+        endpoint = self._endpoints.get(key)
+        if endpoint is None:
+            endpoint = self._endpoints[key] = {
+                "latency": LatencyHistogram(), "statuses": Counter(), "wire_bytes": 0, "decoded_bytes": 0,
+                "retries": Counter(), "cache_hits": Counter()}
+        return endpoint
+
+    def on_end(self, event: Dict[str, Any]):
+        with self._lock:
+            endpoint = self._endpoint(event)
+            endpoint["latency"].record(event["elapsed"])
+            endpoint["statuses"][str(event["status"]) if event["status"] is not None else "error"] += 1
+            if event["wire_bytes"] is not None:
+                endpoint["wire_bytes"] += event["wire_bytes"]
+                endpoint["decoded_bytes"] += event["decoded_bytes"]
+
+    def on_retry(self, event: Dict[str, Any]):
+        with self._lock:
+            self._endpoint(event)["retries"][event["error_class"]] += 1
+
+    def on_cache_hit(self, event: Dict[str, Any]):
+        with self._lock:
+            self._endpoint(event)["cache_hits"]["revalidated" if event["revalidated"] else event["cache"]] += 1
+
+    def on_token_refresh(self, event: Dict[str, Any]):
+        with self._lock:
+            self._token_refreshes[event["reason"] if event["error"] is None else "failed"] += 1
+
+    def stats(self) -> Dict[str, Any]:
+        """{"endpoints": {"GET /trades": {latency, statuses, bytes, retries, cache_hits}}, "token_refreshes"}."""
+        with self._lock:
+            endpoints = {}
+            for (method, template), endpoint in sorted(self._endpoints.items(), key=lambda item: item[0][::-1]):
+                endpoints[f"{method} {template}"] = {
+                    "latency": endpoint["latency"].summary(self.quantiles),
+                    "statuses": dict(endpoint["statuses"]),
+                    "wire_bytes": endpoint["wire_bytes"],
+                    "decoded_bytes": endpoint["decoded_bytes"],
+                    "retries": dict(endpoint["retries"]),
+                    "cache_hits": dict(endpoint["cache_hits"]),
+                }
+            return {"endpoints": endpoints, "token_refreshes": dict(self._token_refreshes)}
+
+    def to_json(self, indent: Optional[int] = 2) -> str:
+        return dumps(self.stats(), indent=indent)
+
+    def to_prometheus(self, prefix: str = PROMETHEUS_PREFIX) -> str:
+        """Prometheus text exposition format (version 0.0.4)."""
+        with self._lock:
+            endpoints = sorted(self._endpoints.items(), key=lambda item: item[0][::-1])
+            lines: List[str] = []
+
+            def family(name: str, kind: str, help_text: str):
+                lines.append(f"# HELP {prefix}_{name} {help_text}")
+                lines.append(f"# TYPE {prefix}_{name} {kind}")
+
+            def sample(name: str, labels: Dict[str, str], value: Any):
+                rendered = ",".join(f'{key}="{_escape_label(str(label))}"' for key, label in labels.items())
+                lines.append(f"{prefix}_{name}{{{rendered}}} {value}" if rendered else f"{prefix}_{name} {value}")
+
+            family("request_duration_seconds", "summary", "Request latency per endpoint template, over all attempts.")
+            for (method, template), endpoint in endpoints:
+                labels = {"method": method, "endpoint": template}
+                histogram = endpoint["latency"]
+                for quantile in self.quantiles:
+                    sample("request_duration_seconds", {**labels, "quantile": f"{quantile:g}"},
+                           _number(histogram.percentile(quantile)))
+                sample("request_duration_seconds_sum", labels, _number(histogram.total / 1e6))
+                sample("request_duration_seconds_count", labels, histogram.count)
+
+            family("responses_total", "counter", "Responses per endpoint template and status code.")
+            for (method, template), endpoint in endpoints:
+                for status, count in sorted(endpoint["statuses"].items()):
+                    sample("responses_total", {"method": method, "endpoint": template, "status": status}, count)
+
+            family("response_bytes_total", "counter", "Response body bytes on the wire and after decoding.")
+            for (method, template), endpoint in endpoints:
+                for kind in ("wire", "decoded"):
+                    sample("response_bytes_total", {"method": method, "endpoint": template, "kind": kind},
+                           endpoint[f"{kind}_bytes"])
+
+            family("retries_total", "counter", "Retried attempts per endpoint template and error class.")
+            for (method, template), endpoint in endpoints:
+                for error_class, count in sorted(endpoint["retries"].items()):
+                    sample("retries_total", {"method": method, "endpoint": template, "error_class": error_class},
+                           count)
+
+            family("cache_hits_total", "counter", "Responses served by the HTTP or response cache.")
+            for (method, template), endpoint in endpoints:
+                for cache, count in sorted(endpoint["cache_hits"].items()):
+                    sample("cache_hits_total", {"method": method, "endpoint": template, "cache": cache}, count)
+
+            family("token_refreshes_total", "counter", "Token refreshes and logins by reason.")
+            for reason, count in sorted(self._token_refreshes.items()):
+                sample("token_refreshes_total", {"reason": reason}, count)
+
+        return "\n".join(lines) + "\n"
+
+    def reset(self):
+        with self._lock:
+            self._endpoints.clear()
+            self._token_refreshes.clear()
+
+
+def _escape_label(value: str) -> str:
+    return value.replace('\\', '\\\\').replace('"', '\\"').replace('\n', '\\n')
+
+
+def _number(value: Optional[float]) -> str:
+    return "NaN" if value is None else repr(value)
@@ -0,0 +1,111 @@
+"""
+Tiger Trade API - Pagination helpers
+
+Paged endpoints return {"data": [...], "total": N}. iter_pages walks the pages
+in order and keeps up to `prefetch` of the next pages in flight on a
+background pool while the caller consumes the current one; only those pages
+are held in memory at any time.
+
+fetch_pages is the eager counterpart: it reads `total` from the first page
+and fetches all remaining pages concurrently.
+
+Both run their page requests under one span (see tracing.py), including
+those made on the pool threads.
+"""
+
+import math
+from collections import deque
+from typing import Dict, Any, Callable, Iterator, List, Optional
+
+from .tracing import bind, span, start_span
+
+
+def page_count(total: Any, items_per_page: int) -> Optional[int]:
+    try:
+        return max(1, math.ceil(int(total) / items_per_page))
+    except (TypeError, ValueError):
+        return None
+
+
+def iter_pages(fetch_page: Callable[[int], Dict[str, Any]], items_per_page: int,
+               start_page: int = 1, prefetch: int = 1) -> Iterator[Dict[str, Any]]:
+    """Yield page results from `start_page` until the last page.
+
+    The last page is taken from `total` on the first page when present,
+    otherwise iteration stops at the first short or empty page.
+    """
+    pages_span = start_span("tiger_api.iter_pages", {"tiger_api.items_per_page": items_per_page,
+                                                      "tiger_api.prefetch": prefetch})
+    fetch_page = bind(fetch_page, pages_span)
+    pages = 1
+    executor = None
+    pending = deque()
+
+    try:
+        first = fetch_page(start_page)
+        yield first
+
+        if not isinstance(first, dict) or len(first.get('data') or []) < items_per_page:
+            return
+
+        last_page = page_count(first.get('total'), items_per_page)
+        next_page = start_page + 1
+        from concurrent.futures import ThreadPoolExecutor
+        executor = ThreadPoolExecutor(max_workers=max(1, prefetch), thread_name_prefix="tiger-api-page")
+
+        while True:
+            while len(pending) < max(1, prefetch) and (last_page is None or next_page <= last_page):
+                pending.append(executor.submit(fetch_page, next_page))
+                next_page += 1
+
+            if not pending:
+                return
+
+            result = pending.popleft().result()
+            pages += 1
+            yield result
+
+            if not isinstance(result, dict) or len(result.get('data') or []) < items_per_page:
+                return
+    finally:
+        if executor is not None:
+            # Pages prefetched past an early stop are dropped (cancel_futures needs 3.9)
+            for future in pending:
+                future.cancel()
+            executor.shutdown(wait=False)
+        if pages_span is not None:
+            pages_span.set_attribute("tiger_api.pages", pages)
+            pages_span.end()
+
+
+def fetch_pages(fetch_page: Callable[[int], Dict[str, Any]], items_per_page: int,
+                workers: int = 4, start_page: int = 1) -> List[Dict[str, Any]]:
+    """Fetch every page, in parallel once `total` is known; results keep page order.
+
+    Without a `total` on the first page this falls back to sequential paging.
+    Rows inserted while the pages are fetched push the tail past the last
+    page `total` announced, so when that page comes back full the following
+    pages are fetched one at a time until a short one.
+    """
+    with span("tiger_api.fetch_pages", {"tiger_api.items_per_page": items_per_page,
+                                        "tiger_api.workers": workers}) as pages_span:
+        first = fetch_page(start_page)
+        if not isinstance(first, dict) or len(first.get('data') or []) < items_per_page:
+            return [first]
+
+        last_page = page_count(first.get('total'), items_per_page)
+        if last_page is None:
+            return [first] + list(iter_pages(fetch_page, items_per_page, start_page=start_page + 1))
+
+        remaining = range(start_page + 1, last_page + 1)
+        from concurrent.futures import ThreadPoolExecutor
+        with ThreadPoolExecutor(max_workers=max(1, workers), thread_name_prefix="tiger-api-page") as executor:
+            pages = [first] + list(executor.map(bind(fetch_page), remaining))
+
+        next_page = start_page + len(pages)
+        while isinstance(pages[-1], dict) and len(pages[-1].get('data') or []) >= items_per_page:
+            pages.append(fetch_page(next_page))
+            next_page += 1
+        if pages_span is not None:
+            pages_span.set_attribute("tiger_api.pages", len(pages))
+        return pages
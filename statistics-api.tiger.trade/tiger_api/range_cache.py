@@ -0,0 +1,229 @@
+"""
+Tiger Trade API - openBetween Range Cache
+
+Splits an /analyzer openBetween range into day buckets (or whole ISO weeks
+plus day edges), fetches only the buckets it has not seen and merges the
+bucket summaries locally. Days are the server's openBetween days, i.e. UTC
+days: those before the current UTC day are closed and cached for good; the
+bucket containing today (and anything later) expires after `today_ttl`
+seconds.
+
+Splitting only pays off when most buckets are already cached. When more
+than `max_fetches` buckets are missing (a cold query over months), the
+range is fetched with one direct query instead and cached as a whole, so
+a cold lookup never costs more requests than the uncached call.
+
+Only successful responses are cached; an error payload is returned as is
+and asked for again on the next call.
+
+Merging is only valid for additive metrics. When a response carries
+anything else the cache falls back to a direct query for the whole range
+and stops splitting from then on.
+"""
+
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from datetime import date, datetime, timedelta, timezone
+from decimal import Decimal, InvalidOperation
+from typing import Dict, Any, Callable, Hashable, List, Optional, Sequence, Tuple
+
+from .local_analyzer import parse_open_between
+
+ADDITIVE_METRICS = {"net_profit", "count", "win_count", "loss_count", "volume"}
+# Recomputed after merging
+DERIVED_METRICS = {"win_rate"}
+# Describe the range rather than the trades in it
+RANGE_FIELDS = {"from", "to", "openBetween", "open_between"}
+
+DEFAULT_TODAY_TTL = 60.0
+DEFAULT_WORKERS = 4
+# More missing buckets than this: one direct query for the whole range
+DEFAULT_MAX_FETCHES = 8
+
+
+def utc_today() -> date:
+    """Current day of the server's openBetween ranges."""
+    return datetime.now(timezone.utc).date()
+
+
+def is_success(result: Any) -> bool:
+    return isinstance(result, dict) and result.get('status', 'success') == 'success' and 'data' in result
+
+
+def _is_integral(value: Any) -> bool:
+    if isinstance(value, bool):
+        return False
+    if isinstance(value, int):
+        return True
+    return isinstance(value, str) and value.lstrip('-').isdigit()
+
+
+def merge_summaries(results: Sequence[Dict[str, Any]], open_between: Optional[str] = None) -> Optional[Dict[str, Any]]:
+    """Sum summary responses whose `data` holds only additive metrics; None otherwise.
+
+    Sums are exact decimals, and values keep their wire type: numeric
+    strings stay strings, integer counts stay integers.
+    """
+    if not results:
+        return None
+
+    totals: Dict[str, Decimal] = {}
+    integral: Dict[str, bool] = {}
+    as_string: Dict[str, bool] = {}
+    for result in results:
+        data = result.get('data') if isinstance(result, dict) else None
+        if not isinstance(data, dict):
+            return None
+        for key, value in data.items():
+            if key in DERIVED_METRICS or key in RANGE_FIELDS:
+                continue
+            if key not in ADDITIVE_METRICS:
+                return None
+            try:
+                totals[key] = totals.get(key, Decimal(0)) + Decimal(str(value))
+            except (TypeError, ValueError, InvalidOperation):
+                return None
+            integral[key] = integral.get(key, True) and _is_integral(value)
+            as_string[key] = as_string.get(key, False) or isinstance(value, str)
+
+    data: Dict[str, Any] = {}
+    for key, total in totals.items():
+        if integral[key]:
+            data[key] = str(int(total)) if as_string[key] else int(total)
+        else:
+            data[key] = str(total) if as_string[key] else float(total)
+
+    template = results[0]
+    if "win_rate" in template['data'] and "count" in totals and "win_count" in totals:
+        data["win_rate"] = float(totals["win_count"] / totals["count"]) * 100 if totals["count"] else 0.0
+    if open_between:
+        start, end = parse_open_between(open_between)
+        if "from" in template['data']:
+            data["from"] = start
+        if "to" in template['data']:
+            data["to"] = end
+
+    merged = {key: value for key, value in template.items() if key != 'data'}
+    merged['data'] = data
+    return merged
+
+
+def split_range(open_between: str, bucket: str = "day") -> List[Tuple[date, date]]:
+    """Inclusive (start, end) buckets covering the range."""
+    start, end = (date.fromisoformat(day) for day in parse_open_between(open_between))
+    buckets = []
+    day = start
+    while day <= end:
+        week_end = day + timedelta(days=6)
+        if bucket == "week" and day.weekday() == 0 and week_end <= end:
+            buckets.append((day, week_end))
+            day = week_end + timedelta(days=1)
+        else:
+            buckets.append((day, day))
+            day += timedelta(days=1)
+    return buckets
+
+
+class RangeCache:
+    def __init__(self, bucket: str = "day", today_ttl: float = DEFAULT_TODAY_TTL, workers: int = DEFAULT_WORKERS,
+                 max_fetches: int = DEFAULT_MAX_FETCHES, clock: Callable[[], float] = time.time,
+                 today: Callable[[], date] = utc_today):
+        self.bucket = bucket
+        self.today_ttl = today_ttl
+        self.workers = workers
+        self.max_fetches = max_fetches
+        self.clock = clock
+        self.today = today
+        self.additive = True
+
+        self._entries: Dict[Tuple[Hashable, date, date], Tuple[Dict[str, Any], float]] = {}
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def _lookup(self, key: Tuple[Hashable, date, date]) -> Optional[Dict[str, Any]]:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            result, expires_at = entry
+            if expires_at is not None and self.clock() >= expires_at:
+                del self._entries[key]
+                return None
+            return result
+
+    def _store(self, key: Tuple[Hashable, date, date], result: Dict[str, Any]):
+        # Days before the current UTC day are closed and never change
+        expires_at = None if key[2] < self.today() else self.clock() + self.today_ttl
+        with self._lock:
+            self._entries[key] = (result, expires_at)
+
+    def get(self, open_between: str, fetch: Callable[[str], Dict[str, Any]],
+            scope: Hashable = None) -> Dict[str, Any]:
+        """Summary for `open_between`; `fetch(open_between)` performs a real query.
+
+        `scope` separates cache entries for different filters (e.g. api_key_id sets).
+        """
+        if not self.additive:
+            return fetch(open_between)
+
+        buckets = split_range(open_between, self.bucket)
+        whole_range = (scope, buckets[0][0], buckets[-1][1])
+        if len(buckets) > 1:
+            cached = self._lookup(whole_range)
+            if cached is not None:
+                with self._lock:
+                    self.hits += 1
+                return cached
+
+        results: Dict[Tuple[date, date], Dict[str, Any]] = {}
+        missing = []
+        for start, end in buckets:
+            cached = self._lookup((scope, start, end))
+            if cached is None:
+                missing.append((start, end))
+            else:
+                results[(start, end)] = cached
+
+        if len(missing) > self.max_fetches:
+            with self._lock:
+                self.misses += 1
+            result = fetch(open_between)
+            if is_success(result):
+                self._store(whole_range, result)
+            return result
+
+        with self._lock:
+            self.hits += len(buckets) - len(missing)
+            self.misses += len(missing)
+
+        def fetch_bucket(bucket: Tuple[date, date]) -> Dict[str, Any]:
+            return fetch(f"{bucket[0].isoformat()},{bucket[1].isoformat()}")
+
+        if missing:
+            with ThreadPoolExecutor(max_workers=max(1, self.workers), thread_name_prefix="tiger-api-range") as executor:
+                for bucket, result in zip(missing, executor.map(fetch_bucket, missing)):
+                    results[bucket] = result
+
+        failed = [bucket for bucket in missing if not is_success(results[bucket])]
+        if failed:
+            # Nothing is stored; a single bucket is the answer, several are asked for directly
+            return results[failed[0]] if len(buckets) == 1 else fetch(open_between)
+
+        if len(buckets) == 1:
+            merged = results[buckets[0]]
+        else:
+            merged = merge_summaries([results[bucket] for bucket in buckets], open_between)
+
+        if merged is None:
+            self.additive = False
+            return fetch(open_between)
+
+        for bucket in missing:
+            self._store((scope, bucket[0], bucket[1]), results[bucket])
+        return merged
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
@@ -0,0 +1,155 @@
+"""
+Tiger Trade API - Client-side Rate Limiter
+
+Token buckets per host and per endpoint prefix, shared by every client that
+uses the same Transport. Rates adapt AIMD-style: a 429 halves the bucket
+rate, every successful response adds back a small fraction of the configured
+rate until it is reached again. Concurrent requests hit a limit together, so
+a bucket is halved at most once per `cooldown` seconds rather than once per
+429 of the burst.
+
+The limiter is opt-in: without an `api.rate_limit` section requests are not
+throttled (429s are still retried by the RetryPolicy, honouring
+Retry-After). Buckets exist only where a rate is configured: `rate` caps
+every host, `hosts` single hosts and `endpoints` URL path prefixes. Size
+rates from the server's published limits; a cap below
+concurrency / latency (10 workers at 50 ms is 200 req/s) makes the limiter,
+not the server, the bottleneck of AsyncAPI and the parallel fetchers.
+
+Clock and sleep are injectable so the limiter can be driven by a fake clock.
+"""
+
+import re
+import threading
+import time
+from typing import Dict, Any, Callable, List, Optional
+from urllib.parse import urlsplit
+
+# Multiplicative decrease on 429, additive increase (fraction of max rate) on success
+DECREASE_FACTOR = 0.5
+INCREASE_STEP = 0.05
+MIN_RATE = 0.2
+# 429s within this many seconds of a decrease belong to the same overload
+DECREASE_COOLDOWN = 1.0
+
+
+class TokenBucket:
+    def __init__(self, rate: float, burst: float, clock: Callable[[], float] = time.monotonic,
+                 cooldown: float = DECREASE_COOLDOWN):
+        self.max_rate = float(rate)
+        self.rate = float(rate)
+        self.burst = float(burst)
+        self.tokens = float(burst)
+        self.clock = clock
+        self.cooldown = cooldown
+        self.updated = clock()
+        self.decreased_at: Optional[float] = None
+
+    def _refill(self):
+        now = self.clock()
+        self.tokens = min(self.burst, self.tokens + (now - self.updated) * self.rate)
+        self.updated = now
+
+    def reserve(self) -> float:
+        """Take one token and return how long the caller must wait for it."""
+        self._refill()
+        self.tokens -= 1
+        if self.tokens >= 0:
+            return 0.0
+        return -self.tokens / self.rate
+
+    def slow_down(self, factor: float = DECREASE_FACTOR, min_rate: float = MIN_RATE):
+        self._refill()
+        if self.decreased_at is not None and self.updated - self.decreased_at < self.cooldown:
+            return
+        self.decreased_at = self.updated
+        self.rate = max(min_rate, self.rate * factor)
+
+    def speed_up(self, step: float = INCREASE_STEP):
+        if self.rate < self.max_rate:
+            self._refill()
+            self.rate = min(self.max_rate, self.rate + self.max_rate * step)
+
+
+class RateLimiter:
+    def __init__(self, rate: Optional[float] = None, burst: Optional[float] = None,
+                 hosts: Optional[Dict[str, Dict[str, float]]] = None,
+                 endpoints: Optional[Dict[str, Dict[str, float]]] = None,
+                 cooldown: float = DECREASE_COOLDOWN,
+                 clock: Callable[[], float] = time.monotonic,
+                 sleep: Callable[[float], None] = time.sleep):
+        # No default rule: only hosts and endpoints with a configured rate get a bucket
+        self.default_rule = {"rate": rate, "burst": burst} if rate is not None else None
+        self.host_rules = hosts or {}
+        # Longest prefix first; a prefix matches at a path-segment boundary anywhere in
+        # the URL path, so "/trades" applies under the gateway's proxy base path too
+        self.endpoint_rules = [
+            (prefix, re.compile(re.escape(prefix.rstrip('/')) + r'(/|$)'), rule)
+            for prefix, rule in sorted((endpoints or {}).items(), key=lambda item: -len(item[0]))
+        ]
+        self.cooldown = cooldown
+        self.clock = clock
+        self.sleep = sleep
+
+        self._buckets: Dict[str, TokenBucket] = {}
+        self._lock = threading.Lock()
+
+    @classmethod
+    def from_config(cls, api_config: Dict[str, Any]) -> Optional["RateLimiter"]:
+        options = cls.options_from_config(api_config)
+        if options is None:
+            return None
+        return cls(**options)
+
+    @staticmethod
+    def options_from_config(api_config: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+        rate_config = api_config.get('rate_limit')
+        if not rate_config or rate_config.get('enabled', True) is False:
+            return None
+        return {
+            "rate": rate_config.get('rate'),
+            "burst": rate_config.get('burst'),
+            "hosts": rate_config.get('hosts'),
+            "endpoints": rate_config.get('endpoints'),
+            "cooldown": rate_config.get('cooldown', DECREASE_COOLDOWN),
+        }
+
+    def _bucket(self, key: str, rule: Dict[str, float]) -> TokenBucket:
+        bucket = self._buckets.get(key)
+        if bucket is None:
+            rate = rule['rate']
+            burst = rule.get('burst') or max(1.0, rate)
+            bucket = self._buckets[key] = TokenBucket(rate, burst, self.clock, self.cooldown)
+        return bucket
+
+    def _buckets_for(self, url: str) -> List[TokenBucket]:
+        parts = urlsplit(url)
+        host = parts.netloc
+        buckets = []
+        host_rule = self.host_rules.get(host, self.default_rule)
+        if host_rule and host_rule.get('rate'):
+            buckets.append(self._bucket(f"host:{host}", host_rule))
+        for prefix, pattern, rule in self.endpoint_rules:
+            if pattern.search(parts.path):
+                if rule.get('rate'):
+                    buckets.append(self._bucket(f"endpoint:{host}{prefix}", rule))
+                break
+        return buckets
+
+    def acquire(self, url: str):
+        with self._lock:
+            wait = max((bucket.reserve() for bucket in self._buckets_for(url)), default=0.0)
+        if wait > 0:
+            self.sleep(wait)
+
+    def on_response(self, url: str, status_code: int):
+        with self._lock:
+            for bucket in self._buckets_for(url):
+                if status_code == 429:
+                    bucket.slow_down()
+                elif status_code < 400:
+                    bucket.speed_up()
+
+    def rates(self) -> Dict[str, float]:
+        with self._lock:
+            return {key: bucket.rate for key, bucket in self._buckets.items()}
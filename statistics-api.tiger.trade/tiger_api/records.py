@@ -0,0 +1,126 @@
+"""
+Tiger Trade API - Typed Records
+
+Trade, Week and Summary records decoded straight from response bodies.
+With msgspec installed they are Structs filled by the parser itself, so
+no intermediate dict is built and fields the API adds are skipped;
+otherwise they are slotted objects built from the parsed dicts. Either way
+attributes carry the wire values unchanged (`pnl` stays a decimal string)
+and as_dict() gives the wire field names back. `from` is exposed as `from_`.
+"""
+
+import json
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+from .exceptions import TigerTradeAPIException
+from .lazy import lazy_import
+from .serialization import loads
+
+msgspec = lazy_import("msgspec")
+
+TRADE_FIELDS = ("id", "api_key_id", "symbol", "side", "status", "pnl", "volume", "open_time", "close_time")
+WEEK_FIELDS = ("from", "to", "net_profit", "volume", "count", "win_count")
+SUMMARY_FIELDS = ("net_profit", "count", "win_count", "loss_count", "volume", "win_rate")
+# Top-level response fields returned next to the records
+ENVELOPE_FIELDS = ("status", "total")
+
+
+class Record:
+    """Slotted record built from a decoded dict (used without msgspec)."""
+
+    __slots__ = ()
+    wire_names: Dict[str, str] = {}
+
+    def __init__(self, **values):
+        for name in self.__slots__:
+            setattr(self, name, values.get(name))
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "Record":
+        record = cls.__new__(cls)
+        for name in cls.__slots__:
+            setattr(record, name, data.get(cls.wire_names.get(name, name)))
+        return record
+
+    def as_dict(self) -> Dict[str, Any]:
+        return {self.wire_names.get(name, name): getattr(self, name) for name in self.__slots__}
+
+    def __eq__(self, other: Any) -> bool:
+        return type(other) is type(self) and self.as_dict() == other.as_dict()
+
+    def __repr__(self) -> str:
+        fields = ", ".join(f"{name}={getattr(self, name)!r}" for name in self.__slots__)
+        return f"{type(self).__name__}({fields})"
+
+
+def _struct_as_dict(self) -> Dict[str, Any]:
+    return {self.wire_names.get(name, name): getattr(self, name) for name in self.__struct_fields__}
+
+
+def _struct_from_dict(cls, data: Dict[str, Any]) -> Any:
+    return cls(**{name: data.get(cls.wire_names.get(name, name)) for name in cls.__struct_fields__})
+
+
+def _record_type(name: str, wire_fields: Iterable[str]) -> type:
+    attributes = [f"{field}_" if field == "from" else field for field in wire_fields]
+    wire_names = {attribute: field for attribute, field in zip(attributes, wire_fields) if attribute != field}
+
+    if msgspec is not None:
+        return msgspec.defstruct(
+            name, [(attribute, Any, None) for attribute in attributes], kw_only=True,
+            rename=wire_names or None, module=__name__,
+            namespace={"wire_names": wire_names, "as_dict": _struct_as_dict,
+                       "from_dict": classmethod(_struct_from_dict)},
+        )
+    return type(name, (Record,), {"__slots__": tuple(attributes), "wire_names": wire_names,
+                                  "__module__": __name__})
+
+
+Trade = _record_type("Trade", TRADE_FIELDS)
+Week = _record_type("Week", WEEK_FIELDS)
+Summary = _record_type("Summary", SUMMARY_FIELDS)
+
+_envelopes: Dict[Tuple[type, bool], type] = {}
+
+
+def _envelope_type(record: type, many: bool) -> type:
+    # Built once per record type; dict assignment is atomic, a racing duplicate is harmless
+    envelope = _envelopes.get((record, many))
+    if envelope is None:
+        data_type = Optional[List[record]] if many else Optional[record]
+        envelope = _envelopes[(record, many)] = msgspec.defstruct(
+            f"{record.__name__}Response",
+            [(field, Any, None) for field in ENVELOPE_FIELDS] + [("data", data_type, None)],
+            kw_only=True, module=__name__,
+        )
+    return envelope
+
+
+def decode_records(body: Any, record: type, many: bool = True) -> Tuple[Any, Dict[str, Any]]:
+    """Decode a {"data": ...} response body into (records, meta).
+
+    `records` is a list of `record` objects when many=True, else one record
+    (None if `data` is missing); `meta` holds the ENVELOPE_FIELDS present.
+    """
+    if msgspec is not None:
+        try:
+            envelope = msgspec.json.decode(body, type=_envelope_type(record, many))
+        except msgspec.DecodeError as e:
+            raise TigerTradeAPIException(f"Invalid {record.__name__} response: {e}")
+        meta = {field: getattr(envelope, field) for field in ENVELOPE_FIELDS
+                if getattr(envelope, field) is not None}
+        if many:
+            return envelope.data or [], meta
+        return envelope.data, meta
+
+    try:
+        document = loads(body)
+    except json.JSONDecodeError as e:
+        raise TigerTradeAPIException(f"Invalid {record.__name__} response: {e}")
+    if not isinstance(document, dict):
+        raise TigerTradeAPIException(f"Invalid {record.__name__} response: expected a JSON object")
+    meta = {field: document[field] for field in ENVELOPE_FIELDS if document.get(field) is not None}
+    data = document.get('data')
+    if many:
+        return [record.from_dict(item) for item in data or [] if isinstance(item, dict)], meta
+    return (record.from_dict(data) if isinstance(data, dict) else None), meta
@@ -0,0 +1,123 @@
+"""
+Tiger Trade API - Response Cache
+
+Record/replay cache for development and backtesting. Successful responses
+are stored compressed on disk, keyed by method, URL, normalized params and
+token subject, and replayed for identical requests (forever by default, or
+for `ttl` seconds). Unlike HttpCache nothing is revalidated, so it is
+opt-in via `api.response_cache`.
+
+In offline mode (`"offline": true` or TIGER_API_OFFLINE=1) requests are
+answered only from the cache: a miss raises TigerTradeAPIException instead
+of touching the network, and TokenManager skips token checks.
+"""
+
+import os
+import re
+import threading
+import time
+from typing import Dict, Any, Callable, Iterable, Optional
+from urllib.parse import urlsplit
+
+from .disk_cache import DiskCache, DEFAULT_MAX_BYTES, default_cache_dir
+from .exceptions import TigerTradeAPIException
+from .http_cache import STORED_HEADERS, cache_scope, cached_response, request_key
+
+OFFLINE_ENV = "TIGER_API_OFFLINE"
+DEFAULT_METHODS = ("GET",)
+
+
+def _offline_from_env() -> bool:
+    return os.environ.get(OFFLINE_ENV, "").lower() in ("1", "true", "yes")
+
+
+class ResponseCache:
+    def __init__(self, directory: Optional[str] = None, max_bytes: int = DEFAULT_MAX_BYTES,
+                 ttl: Optional[float] = None, endpoints: Optional[Iterable[str]] = None,
+                 methods: Iterable[str] = DEFAULT_METHODS, offline: bool = False,
+                 clock: Callable[[], float] = time.time):
+        self.disk = DiskCache(directory or default_cache_dir('responses'), max_bytes, clock=clock)
+        self.ttl = ttl
+        # Endpoint prefixes to record (all when None), matched like rate-limit endpoints
+        self.endpoints = None if endpoints is None else [
+            re.compile(re.escape(prefix.rstrip('/')) + r'(/|$)') for prefix in endpoints
+        ]
+        self.methods = {method.upper() for method in methods}
+        self.offline = offline
+        self.clock = clock
+
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    @classmethod
+    def from_config(cls, api_config: Dict[str, Any]) -> Optional["ResponseCache"]:
+        options = cls.options_from_config(api_config)
+        if options is None:
+            return None
+        return cls(**options)
+
+    @staticmethod
+    def options_from_config(api_config: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+        cache_config = api_config.get('response_cache') or {}
+        offline = cache_config.get('offline', False) or _offline_from_env()
+        if not offline and (not cache_config or cache_config.get('enabled', True) is False):
+            return None
+        return {
+            "directory": cache_config.get('directory'),
+            "max_bytes": cache_config.get('max_bytes', DEFAULT_MAX_BYTES),
+            "ttl": cache_config.get('ttl'),
+            "endpoints": cache_config.get('endpoints'),
+            "methods": cache_config.get('methods', DEFAULT_METHODS),
+            "offline": offline,
+        }
+
+    def matches(self, method: str, url: str) -> bool:
+        if method.upper() not in self.methods:
+            return False
+        if self.endpoints is None:
+            return True
+        path = urlsplit(url).path
+        return any(pattern.search(path) for pattern in self.endpoints)
+
+    def request(self, method: str, url: str, params: Any, headers: Optional[Dict[str, str]],
+                send: Callable[[], Any]) -> Any:
+        """Replay a stored response or, unless offline, `send()` and record it."""
+        if not self.matches(method, url):
+            if self.offline:
+                raise TigerTradeAPIException(f"Offline: {method} {url} is not cached")
+            return send()
+
+        key = request_key(method, url, params, cache_scope(headers))
+        cached = self.disk.get(key)
+        if cached is not None and (self.ttl is None or self.clock() - cached[0]['stored_at'] < self.ttl):
+            self.disk.touch(key)
+            with self._lock:
+                self.hits += 1
+            return cached_response(url, *cached)
+
+        with self._lock:
+            self.misses += 1
+        if self.offline:
+            raise TigerTradeAPIException(f"Offline: no cached response for {method} {url}")
+
+        response = send()
+        if response.status_code == 200:
+            meta = {
+                "url": url,
+                "status": response.status_code,
+                "stored_at": self.clock(),
+                "encoding": response.encoding,
+                "headers": {name: response.headers[name] for name in STORED_HEADERS if name in response.headers},
+            }
+            self.disk.set(key, meta, response.content)
+        return response
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            stats = {"hits": self.hits, "misses": self.misses, "offline": self.offline}
+        stats.update(self.disk.stats())
+        return stats
+
+    def clear(self):
+        self.disk.clear()
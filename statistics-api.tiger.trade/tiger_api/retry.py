@@ -0,0 +1,151 @@
+"""
+Tiger Trade API - Retry Policy
+
+Transient failures are retried with full-jitter exponential backoff. Each
+error class has its own budget, a Retry-After header overrides the computed
+delay, and only idempotent methods are retried unless configured otherwise,
+so POSTs such as close_trade are never replayed.
+
+`max_delay` bounds every sleep: a Retry-After longer than that is not waited
+out, the response is returned to the caller instead.
+"""
+
+import random
+import threading
+import time
+from collections import Counter
+from typing import Dict, Any, Callable, Iterable, Optional
+
+from .lazy import lazy_import
+
+requests = lazy_import("requests")
+
+ERROR_CLASSES = ("rate_limit", "server_error", "timeout", "connection")
+RETRY_STATUSES = {
+    429: "rate_limit",
+    500: "server_error",
+    502: "server_error",
+    503: "server_error",
+    504: "server_error",
+}
+IDEMPOTENT_METHODS = ("GET", "HEAD", "OPTIONS")
+
+DEFAULT_MAX_RETRIES = 3
+DEFAULT_RETRY_DELAY = 1.0
+DEFAULT_MAX_DELAY = 30.0
+
+
+def parse_retry_after(value: Optional[str]) -> Optional[float]:
+    """Parse a Retry-After header given as seconds or as an HTTP date."""
+    if not value:
+        return None
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    # Only reached for HTTP-date values, so keep these off the import path
+    from datetime import datetime, timezone
+    from email.utils import parsedate_to_datetime
+    try:
+        when = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    if when.tzinfo is None:
+        when = when.replace(tzinfo=timezone.utc)
+    return max(0.0, (when - datetime.now(timezone.utc)).total_seconds())
+
+
+class RetryPolicy:
+    def __init__(self, max_retries: int = DEFAULT_MAX_RETRIES, retry_delay: float = DEFAULT_RETRY_DELAY,
+                 max_delay: float = DEFAULT_MAX_DELAY, budgets: Optional[Dict[str, int]] = None,
+                 methods: Iterable[str] = IDEMPOTENT_METHODS,
+                 sleep: Callable[[float], None] = time.sleep,
+                 rand: Callable[[], float] = random.random):
+        self.retry_delay = retry_delay
+        self.max_delay = max_delay
+        self.budgets = {error_class: max_retries for error_class in ERROR_CLASSES}
+        self.budgets.update(budgets or {})
+        self.methods = frozenset(method.upper() for method in methods)
+        self.sleep = sleep
+        self.rand = rand
+
+        self.counters: Counter = Counter()
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def options_from_config(api_config: Dict[str, Any]) -> Dict[str, Any]:
+        return {
+            "max_retries": api_config.get('max_retries', DEFAULT_MAX_RETRIES),
+            "retry_delay": api_config.get('retry_delay', DEFAULT_RETRY_DELAY),
+            "max_delay": api_config.get('retry_max_delay', DEFAULT_MAX_DELAY),
+            "budgets": api_config.get('retry_budgets'),
+            "methods": tuple(api_config.get('retry_methods', IDEMPOTENT_METHODS)),
+        }
+
+    @classmethod
+    def from_config(cls, api_config: Dict[str, Any]) -> "RetryPolicy":
+        return cls(**cls.options_from_config(api_config))
+
+    def classify_response(self, response: "requests.Response") -> Optional[str]:
+        return RETRY_STATUSES.get(response.status_code)
+
+    def classify_exception(self, error: Exception) -> Optional[str]:
+        # ConnectTimeout is both a Timeout and a ConnectionError
+        if isinstance(error, requests.exceptions.Timeout):
+            return "timeout"
+        if isinstance(error, requests.exceptions.ConnectionError):
+            return "connection"
+        return None
+
+    def backoff(self, attempt: int, retry_after: Optional[float] = None) -> float:
+        if retry_after is not None:
+            return min(retry_after, self.max_delay)
+        return self.rand() * min(self.max_delay, self.retry_delay * (2 ** attempt))
+
+    def _record(self, error_class: str):
+        with self._lock:
+            self.counters[error_class] += 1
+
+    def stats(self) -> Dict[str, int]:
+        with self._lock:
+            return dict(self.counters)
+
+    def send(self, method: str, send: Callable[[], "requests.Response"],
+             on_retry: Optional[Callable[[str, int, float], None]] = None) -> "requests.Response":
+        """Call `send` until it succeeds, is not retryable or the budget runs out.
+
+        `on_retry(error_class, attempt, delay)` is called before each backoff sleep.
+        """
+        retryable_method = method.upper() in self.methods
+        attempts: Counter = Counter()
+
+        while True:
+            try:
+                response = send()
+            except requests.exceptions.RequestException as e:
+                error_class = self.classify_exception(e)
+                if not retryable_method or error_class is None or attempts[error_class] >= self.budgets[error_class]:
+                    if error_class is not None and retryable_method:
+                        self._record(f"{error_class}_exhausted")
+                    raise
+                delay = self.backoff(attempts[error_class])
+            else:
+                error_class = self.classify_response(response)
+                if error_class is None or not retryable_method:
+                    return response
+                if attempts[error_class] >= self.budgets[error_class]:
+                    self._record(f"{error_class}_exhausted")
+                    return response
+                retry_after = parse_retry_after(response.headers.get('Retry-After'))
+                # Retrying sooner than the server asked would only be refused again
+                if retry_after is not None and retry_after > self.max_delay:
+                    self._record(f"{error_class}_retry_after_exceeded")
+                    return response
+                delay = self.backoff(attempts[error_class], retry_after)
+                response.close()
+
+            attempts[error_class] += 1
+            self._record(error_class)
+            if on_retry is not None:
+                on_retry(error_class, attempts[error_class], delay)
+            self.sleep(delay)
@@ -0,0 +1,152 @@
+"""
+Tiger Trade API - JSON Serialization
+
+One JSON layer for responses, caches, the trade store, token files and
+script output. The fastest installed backend is picked on first use
+(orjson, msgspec, ujson, then the stdlib json module); TIGER_API_JSON or
+set_backend() pins one. Whatever the backend, loads() accepts bytes or
+str, decode errors are json.JSONDecodeError, and dumps() returns str.
+Values a fast encoder rejects (integers beyond 64 bits, ...) are retried
+with the stdlib encoder instead of failing.
+"""
+
+import json
+import os
+import threading
+from typing import Any, List, Optional, Tuple
+
+from .exceptions import TigerTradeAPIException
+from .lazy import lazy_import
+
+BACKEND_ENV = "TIGER_API_JSON"
+# Preference order when no backend is pinned
+BACKENDS = ("orjson", "msgspec", "ujson", "json")
+
+
+class Backend:
+    """A JSON implementation: `loads`, `dumps` and the errors that mean "retry with the stdlib"."""
+
+    name = "json"
+    encode_errors: Tuple[type, ...] = ()
+    decode_errors: Tuple[type, ...] = ()
+
+    def loads(self, data: Any) -> Any:
+        return json.loads(data)
+
+    def dumps(self, obj: Any, indent: Optional[int] = None, sort_keys: bool = False) -> str:
+        return json.dumps(obj, indent=indent, sort_keys=sort_keys, ensure_ascii=False)
+
+
+class OrjsonBackend(Backend):
+    name = "orjson"
+
+    def __init__(self, module: Any):
+        self.orjson = module
+        self.encode_errors = (TypeError,)
+        # orjson.JSONDecodeError already subclasses json.JSONDecodeError
+
+    def loads(self, data: Any) -> Any:
+        return self.orjson.loads(data)
+
+    def dumps(self, obj: Any, indent: Optional[int] = None, sort_keys: bool = False) -> str:
+        if indent not in (None, 2):
+            return super().dumps(obj, indent, sort_keys)
+        option = self.orjson.OPT_NON_STR_KEYS
+        if indent:
+            option |= self.orjson.OPT_INDENT_2
+        if sort_keys:
+            option |= self.orjson.OPT_SORT_KEYS
+        return self.orjson.dumps(obj, option=option).decode()
+
+
+class MsgspecBackend(Backend):
+    name = "msgspec"
+
+    def __init__(self, module: Any):
+        self.msgspec = module
+        self.encode_errors = (TypeError, module.EncodeError)
+        self.decode_errors = (module.DecodeError,)
+        self._decoder = module.json.Decoder()
+
+    def loads(self, data: Any) -> Any:
+        return self._decoder.decode(data)
+
+    def dumps(self, obj: Any, indent: Optional[int] = None, sort_keys: bool = False) -> str:
+        encoded = self.msgspec.json.encode(obj, order='sorted' if sort_keys else None)
+        if indent:
+            encoded = self.msgspec.json.format(encoded, indent=indent)
+        return encoded.decode()
+
+
+class UjsonBackend(Backend):
+    name = "ujson"
+
+    def __init__(self, module: Any):
+        self.ujson = module
+        self.encode_errors = (TypeError, OverflowError)
+        self.decode_errors = (ValueError,)
+
+    def loads(self, data: Any) -> Any:
+        return self.ujson.loads(data)
+
+    def dumps(self, obj: Any, indent: Optional[int] = None, sort_keys: bool = False) -> str:
+        return self.ujson.dumps(obj, indent=indent or 0, sort_keys=sort_keys, ensure_ascii=False,
+                                escape_forward_slashes=False)
+
+
+_BACKEND_CLASSES = {"orjson": OrjsonBackend, "msgspec": MsgspecBackend, "ujson": UjsonBackend}
+_stdlib = Backend()
+_backend: Optional[Backend] = None
+_backend_lock = threading.Lock()
+
+
+def _load_backend(name: str) -> Optional[Backend]:
+    if name == "json":
+        return _stdlib
+    if name not in _BACKEND_CLASSES:
+        raise TigerTradeAPIException(f"Unknown JSON backend: {name} (choose from {', '.join(BACKENDS)})")
+    module = lazy_import(name)
+    return _BACKEND_CLASSES[name](module) if module is not None else None
+
+
+def available_backends() -> List[str]:
+    return [name for name in BACKENDS if _load_backend(name) is not None]
+
+
+def set_backend(name: Optional[str] = None) -> Backend:
+    """Pin a backend by name; None picks the first installed one in BACKENDS order."""
+    global _backend
+    names = [name] if name else BACKENDS
+    for candidate in names:
+        backend = _load_backend(candidate)
+        if backend is not None:
+            with _backend_lock:
+                _backend = backend
+            return backend
+    raise TigerTradeAPIException(f"JSON backend {name} is not installed: pip install {name}")
+
+
+def get_backend() -> Backend:
+    if _backend is None:
+        set_backend(os.environ.get(BACKEND_ENV) or None)
+    return _backend
+
+
+def loads(data: Any) -> Any:
+    """Parse a JSON document given as bytes or str."""
+    backend = get_backend()
+    try:
+        return backend.loads(data)
+    except backend.decode_errors as e:
+        if isinstance(e, json.JSONDecodeError):
+            raise
+        raise json.JSONDecodeError(str(e), "", 0) from e
+
+
+def dumps(obj: Any, indent: Optional[int] = None, sort_keys: bool = False) -> str:
+    """Serialize to str; non-ASCII is written as is (the stdlib's ensure_ascii=False)."""
+    backend = get_backend()
+    try:
+        return backend.dumps(obj, indent, sort_keys)
+    except backend.encode_errors:
+        return _stdlib.dumps(obj, indent, sort_keys)
@@ -0,0 +1,150 @@
+"""
+Tiger Trade API - Local Trade Store
+
+SQLite copy of the /trades history. sync() walks /trades by id descending
+and stops as soon as it reaches trades already stored, except that it keeps
+going down to the oldest trade still open so status changes are picked up.
+A repeat run therefore costs a page or two instead of the whole history.
+
+The walk commits in batches, but the high watermark it stops at is only
+moved in `meta` once a walk has reached its stop point (or the end of the
+history). A sync that fails partway leaves the previous watermark, so the
+next one walks down again instead of skipping the trades it never got to.
+"""
+
+import sqlite3
+from datetime import datetime, timezone
+from typing import Dict, Any, Iterable, Iterator, List, Optional
+
+from .serialization import dumps, loads
+
+DEFAULT_CLOSED_STATUSES = ("closed",)
+SYNC_BATCH_SIZE = 500
+
+
+class TradeStore:
+    def __init__(self, path: str, closed_statuses: Iterable[str] = DEFAULT_CLOSED_STATUSES):
+        self.path = path
+        self.closed_statuses = {status.lower() for status in closed_statuses}
+        self.conn = sqlite3.connect(path)
+        self.conn.executescript("""
+            CREATE TABLE IF NOT EXISTS trades (
+                id INTEGER PRIMARY KEY,
+                status TEXT,
+                is_open INTEGER NOT NULL,
+                data TEXT NOT NULL
+            );
+            CREATE INDEX IF NOT EXISTS trades_open ON trades (is_open) WHERE is_open = 1;
+            CREATE TABLE IF NOT EXISTS meta (
+                key TEXT PRIMARY KEY,
+                value TEXT
+            );
+        """)
+
+    def close(self):
+        self.conn.close()
+
+    def __enter__(self) -> "TradeStore":
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def _is_open(self, trade: Dict[str, Any]) -> bool:
+        return str(trade.get('status', '')).lower() not in self.closed_statuses
+
+    def upsert(self, trades: Iterable[Dict[str, Any]]) -> int:
+        rows = [
+            (trade['id'], trade.get('status'), int(self._is_open(trade)), dumps(trade))
+            for trade in trades if trade.get('id') is not None
+        ]
+        with self.conn:
+            self.conn.executemany(
+                "INSERT INTO trades (id, status, is_open, data) VALUES (?, ?, ?, ?) "
+                "ON CONFLICT(id) DO UPDATE SET status = excluded.status, "
+                "is_open = excluded.is_open, data = excluded.data",
+                rows,
+            )
+        return len(rows)
+
+    def get_meta(self, key: str) -> Optional[str]:
+        row = self.conn.execute("SELECT value FROM meta WHERE key = ?", (key,)).fetchone()
+        return row[0] if row else None
+
+    def set_meta(self, key: str, value: str):
+        with self.conn:
+            self.conn.execute(
+                "INSERT INTO meta (key, value) VALUES (?, ?) "
+                "ON CONFLICT(key) DO UPDATE SET value = excluded.value",
+                (key, value),
+            )
+
+    def high_watermark(self) -> Optional[int]:
+        """Highest id below which the store is complete; None until a sync finished."""
+        value = self.get_meta('high_watermark')
+        if value is not None:
+            return int(value)
+        # Stores from before the watermark was kept in meta: trust MAX(id) if a sync completed
+        if self.get_meta('synced_at') is not None:
+            return self.max_id()
+        return None
+
+    def max_id(self) -> Optional[int]:
+        return self.conn.execute("SELECT MAX(id) FROM trades").fetchone()[0]
+
+    def last_date_to(self) -> Optional[str]:
+        return self.get_meta('date_to')
+
+    def open_trade_ids(self) -> List[int]:
+        return [row[0] for row in self.conn.execute("SELECT id FROM trades WHERE is_open = 1 ORDER BY id")]
+
+    def count(self) -> int:
+        return self.conn.execute("SELECT COUNT(*) FROM trades").fetchone()[0]
+
+    def iter_trades(self, order: str = "desc") -> Iterator[Dict[str, Any]]:
+        direction = "ASC" if order == "asc" else "DESC"
+        for (data,) in self.conn.execute(f"SELECT data FROM trades ORDER BY id {direction}"):
+            yield loads(data)
+
+    def sync(self, api: Any, page_size: Optional[int] = None) -> Dict[str, Any]:
+        """Bring the store up to date using `api.iter_trades` (a TradesAPI)."""
+        watermark = self.high_watermark()
+        open_ids = self.open_trade_ids()
+        # Recorded for reference only; days are the server's UTC days
+        date_to = datetime.now(timezone.utc).strftime('%Y-%m-%d')
+
+        filters = {"sort_by": "id", "sort_order": "desc"}
+        stop_below = None
+        if watermark is not None:
+            # No date_from narrowing: a late trade can carry a higher id but an
+            # earlier date, and the id walk already stops on the first page
+            stop_below = min([watermark + 1] + open_ids)
+
+        fetched = 0
+        batch = []
+        for trade in api.iter_trades(page_size=page_size, **filters):
+            trade_id = trade.get('id')
+            if stop_below is not None and trade_id is not None and trade_id < stop_below:
+                break
+            batch.append(trade)
+            if len(batch) >= SYNC_BATCH_SIZE:
+                fetched += self.upsert(batch)
+                batch = []
+        fetched += self.upsert(batch)
+
+        # The walk reached its stop point: everything above the old watermark is stored
+        new_watermark = self.max_id()
+        if new_watermark is not None:
+            self.set_meta('high_watermark', str(new_watermark))
+        self.set_meta('date_to', date_to)
+        self.set_meta('synced_at', datetime.now().isoformat(timespec='seconds'))
+
+        return {
+            "fetched": fetched,
+            "previous_high_watermark": watermark,
+            "high_watermark": self.high_watermark(),
+            "rechecked_open": len(open_ids),
+            "open": len(self.open_trade_ids()),
+            "total": self.count(),
+            "date_to": date_to,
+        }
@@ -0,0 +1,205 @@
+"""
+Tiger Trade API - Streaming JSON
+
+Decodes the `data` array of a response item by item while the body is still
+downloading, so large /trades pages and symbol lists are consumed as they
+arrive instead of holding the raw body and the whole object tree at once.
+Bodies that are already buffered (cache hits, or responses a cache had to
+read to store them) are parsed in one pass by the fastest installed JSON
+backend (see serialization).
+"""
+
+import codecs
+import json
+import re
+from typing import Any, Callable, Dict, Iterable, Iterator, Optional
+
+from .exceptions import TigerTradeAPIException
+from .serialization import loads
+
+DEFAULT_CHUNK_SIZE = 64 * 1024
+
+_WHITESPACE = re.compile(r'[ \t\n\r]*')
+_decoder = json.JSONDecoder()
+
+
+class _Scanner:
+    """Incremental reader over decoded text; the consumed prefix is dropped on refill."""
+
+    def __init__(self, chunks: Iterable[bytes]):
+        self.chunks = iter(chunks)
+        self.decoder = codecs.getincrementaldecoder('utf-8')()
+        self.buffer = ''
+        self.pos = 0
+        self.eof = False
+
+    def fill(self) -> bool:
+        """Append the next chunk to the buffer; False at end of body."""
+        if self.eof:
+            return False
+        try:
+            for chunk in self.chunks:
+                text = self.decoder.decode(chunk)
+                if text:
+                    self.buffer = self.buffer[self.pos:] + text
+                    self.pos = 0
+                    return True
+            self.decoder.decode(b'', final=True)
+        except UnicodeDecodeError as e:
+            raise TigerTradeAPIException(f"Invalid JSON stream: {e}")
+        self.eof = True
+        return False
+
+    def peek(self) -> str:
+        """Skip whitespace and return the next character ('' at end of body)."""
+        while True:
+            self.pos = _WHITESPACE.match(self.buffer, self.pos).end()
+            if self.pos < len(self.buffer):
+                return self.buffer[self.pos]
+            if not self.fill():
+                return ''
+
+    def expect(self, chars: str) -> str:
+        char = self.peek()
+        if not char or char not in chars:
+            raise TigerTradeAPIException(f"Invalid JSON stream: expected {' or '.join(chars)}, got {char!r}")
+        self.pos += 1
+        return char
+
+    def value(self) -> Any:
+        """Decode the complete value at the cursor, reading more of the body as needed."""
+        self.peek()
+        while True:
+            try:
+                value, end = _decoder.raw_decode(self.buffer, self.pos)
+            except json.JSONDecodeError as e:
+                if self.fill():
+                    continue
+                raise TigerTradeAPIException(f"Invalid JSON stream: {e}")
+            # A value ending at the buffer edge, or a number cut before its fraction or
+            # exponent ("2." or "2.5e"), may continue in the next chunk
+            if (end == len(self.buffer) or (type(value) in (int, float) and self.buffer[end] in '.eE')) \
+                    and self.fill():
+                continue
+            self.pos = end
+            return value
+
+
+def iter_json_items(chunks: Iterable[bytes], key: str = 'data',
+                    meta: Optional[Dict[str, Any]] = None) -> Iterator[Any]:
+    """Yield the items of the top-level `key` array of a JSON body given as byte chunks.
+
+    Other top-level fields are stored in `meta` as they are passed. A body
+    that is itself an array yields its items directly.
+    """
+    meta = meta if meta is not None else {}
+    scanner = _Scanner(chunks)
+
+    if scanner.expect('{[') == '[':
+        yield from _iter_array(scanner)
+        return
+    if scanner.peek() == '}':
+        scanner.pos += 1
+        return
+
+    while True:
+        name = scanner.value()
+        scanner.expect(':')
+        if name == key and scanner.peek() == '[':
+            scanner.pos += 1
+            yield from _iter_array(scanner)
+        else:
+            meta[name] = scanner.value()
+        if scanner.expect(',}') == '}':
+            return
+
+
+def _iter_array(scanner: _Scanner) -> Iterator[Any]:
+    # Cursor is just past the opening bracket
+    if scanner.peek() == ']':
+        scanner.pos += 1
+        return
+    while True:
+        yield scanner.value()
+        if scanner.expect(',]') == ']':
+            return
+
+
+class ItemStream:
+    """Iterator over the items of one response array, plus the other top-level fields.
+
+    `meta` holds fields such as `total`: those sent before the array are
+    there once the first item is, the rest once iteration finishes. Close
+    the stream (or use it as a context manager) when stopping early so the
+    connection is released.
+    """
+
+    def __init__(self, items: Iterator[Any], meta: Dict[str, Any],
+                 on_close: Optional[Callable[[], None]] = None):
+        self.meta = meta
+        self._items = items
+        self._on_close = on_close
+
+    def __iter__(self) -> "ItemStream":
+        return self
+
+    def __next__(self) -> Any:
+        try:
+            return next(self._items)
+        except BaseException:
+            # Exhausted or failed: either way the body is done with
+            self.close()
+            raise
+
+    def close(self):
+        close = getattr(self._items, 'close', None)
+        if close is not None:
+            close()
+        if self._on_close is not None:
+            on_close, self._on_close = self._on_close, None
+            on_close()
+
+    def __enter__(self) -> "ItemStream":
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+
+def is_buffered(response: Any) -> bool:
+    # requests sets _content_consumed once the body is read; CachedResponse is always buffered
+    return getattr(response, '_content_consumed', True)
+
+
+def stream_items(response: Any, key: str = 'data', chunk_size: int = DEFAULT_CHUNK_SIZE,
+                 chunks: Optional[Iterable[bytes]] = None,
+                 on_close: Optional[Callable[[], None]] = None) -> ItemStream:
+    """ItemStream over a response body: incremental while unread, one fast parse once buffered.
+
+    `chunks` overrides response.iter_content(chunk_size), e.g. to map read errors;
+    `on_close` replaces response.close as the final step.
+    """
+    on_close = on_close or response.close
+    if is_buffered(response):
+        try:
+            document = loads(response.content)
+        except ValueError as e:
+            raise TigerTradeAPIException(f"Invalid JSON: {e}")
+        finally:
+            on_close()
+        if isinstance(document, list):
+            return ItemStream(iter(document), {})
+        if not isinstance(document, dict):
+            raise TigerTradeAPIException(f"Expected a JSON object or array, got {type(document).__name__}")
+        meta = {name: value for name, value in document.items() if name != key}
+        items = document.get(key)
+        if not isinstance(items, list):
+            if key in document:
+                meta[key] = items
+            items = []
+        return ItemStream(iter(items), meta)
+
+    meta = {}
+    if chunks is None:
+        chunks = response.iter_content(chunk_size)
+    return ItemStream(iter_json_items(chunks, key, meta), meta, on_close=on_close)
@@ -0,0 +1,108 @@
+"""
+Tiger Trade API - Token Store
+
+Tokens are persisted separately from config.json so a refresh never rewrites
+the user's configuration. FileTokenStore writes atomically (temp file +
+rename), serialises refreshes across processes with an advisory file lock
+and skips the write when nothing changed.
+"""
+
+import json
+import os
+import tempfile
+import threading
+from contextlib import contextmanager
+from typing import Dict, Optional
+
+from .serialization import dumps, loads
+
+try:
+    import fcntl
+except ImportError:  # Windows: no cross-process locking
+    fcntl = None
+
+TOKEN_FIELDS = ("access_token", "refresh_token")
+
+
+class TokenStore:
+    """Backend interface used by TokenManager."""
+
+    def load(self) -> Dict[str, Optional[str]]:
+        raise NotImplementedError
+
+    def save(self, tokens: Dict[str, Optional[str]]) -> bool:
+        """Persist tokens; return False when they were already stored."""
+        raise NotImplementedError
+
+    @contextmanager
+    def lock(self):
+        yield
+
+
+class MemoryTokenStore(TokenStore):
+    def __init__(self, tokens: Optional[Dict[str, Optional[str]]] = None):
+        self._tokens = dict(tokens or {})
+        self._lock = threading.RLock()
+
+    def load(self) -> Dict[str, Optional[str]]:
+        return dict(self._tokens)
+
+    def save(self, tokens: Dict[str, Optional[str]]) -> bool:
+        if tokens == self._tokens:
+            return False
+        self._tokens = dict(tokens)
+        return True
+
+    @contextmanager
+    def lock(self):
+        with self._lock:
+            yield
+
+
+class FileTokenStore(TokenStore):
+    def __init__(self, path: str):
+        self.path = path
+        self.lock_path = f"{path}.lock"
+
+    def load(self) -> Dict[str, Optional[str]]:
+        try:
+            with open(self.path, 'rb') as f:
+                data = loads(f.read())
+        except (FileNotFoundError, json.JSONDecodeError):
+            return {}
+        return {field: data.get(field) for field in TOKEN_FIELDS if data.get(field)}
+
+    def save(self, tokens: Dict[str, Optional[str]]) -> bool:
+        tokens = {field: tokens.get(field) for field in TOKEN_FIELDS if tokens.get(field)}
+        if tokens == self.load():
+            return False
+
+        directory = os.path.dirname(os.path.abspath(self.path))
+        fd, tmp_path = tempfile.mkstemp(prefix='.tokens-', suffix='.tmp', dir=directory)
+        try:
+            with os.fdopen(fd, 'w', encoding='utf-8') as f:
+                f.write(dumps(tokens))
+                f.flush()
+                os.fsync(f.fileno())
+            os.chmod(tmp_path, 0o600)
+            os.replace(tmp_path, self.path)
+        except BaseException:
+            try:
+                os.unlink(tmp_path)
+            except OSError:
+                pass
+            raise
+        return True
+
+    @contextmanager
+    def lock(self):
+        if fcntl is None:
+            yield
+            return
+
+        with open(self.lock_path, 'a') as f:
+            fcntl.flock(f.fileno(), fcntl.LOCK_EX)
+            try:
+                yield
+            finally:
+                fcntl.flock(f.fileno(), fcntl.LOCK_UN)
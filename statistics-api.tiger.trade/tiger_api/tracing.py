@@ -0,0 +1,117 @@
+"""
+Tiger Trade API - Request IDs and Tracing
+
+Every request gets its own UUID in the X-Request-Id and Trace-Request-Id
+headers (`api.request_id_headers`), so gateway log lines can be matched to a
+single call; retries of a call reuse its id. The id is also on the call's
+hook events as `request_id`.
+
+With opentelemetry-api installed, calls are traced through the global
+TracerProvider: one CLIENT span per request (retries are span events, cache
+hits an attribute) and INTERNAL spans around token refreshes, pagination
+and fan-out, whose worker threads inherit the caller's context. The W3C
+`traceparent` of the request span goes out on the request headers. Without
+an SDK configured the API is a no-op, and without opentelemetry every
+function here returns immediately.
+"""
+
+from contextlib import contextmanager
+from typing import Dict, Any, Callable, Iterator, Optional
+
+from .lazy import lazy_import
+
+trace = lazy_import("opentelemetry.trace")
+otel_context = lazy_import("opentelemetry.context")
+propagate = lazy_import("opentelemetry.propagate")
+
+REQUEST_ID_HEADERS = ("X-Request-Id", "Trace-Request-Id")
+TRACER_NAME = "tiger_api"
+
+
+def new_request_id() -> str:
+    import uuid
+    return str(uuid.uuid4())
+
+
+def request_headers(headers: Optional[Dict[str, str]], request_id: Optional[str],
+                    id_headers: Any = REQUEST_ID_HEADERS) -> Optional[Dict[str, str]]:
+    """`headers` plus the request id and the current trace context; caller-set values win."""
+    if request_id is None and trace is None:
+        return headers
+    outgoing = {name: request_id for name in id_headers} if request_id is not None else {}
+    if trace is not None:
+        propagate.inject(outgoing)
+    outgoing.update(headers or {})
+    return outgoing
+
+
+def get_tracer() -> Any:
+    return trace.get_tracer(TRACER_NAME) if trace is not None else None
+
+
+def start_request_span(method: str, url: str, template: str, request_id: Optional[str]) -> Any:
+    """CLIENT span for one request, not yet current; None without opentelemetry."""
+    if trace is None:
+        return None
+    attributes = {"http.request.method": method, "url.full": url, "url.template": template}
+    if request_id is not None:
+        attributes["tiger_api.request_id"] = request_id
+    return get_tracer().start_span(f"{method} {template}", kind=trace.SpanKind.CLIENT, attributes=attributes)
+
+
+def end_request_span(span: Any, response: Any = None, error: Optional[BaseException] = None, attempts: int = 1):
+    if span is None:
+        return
+    if attempts > 1:
+        span.set_attribute("http.request.resend_count", attempts - 1)
+    if response is not None:
+        span.set_attribute("http.response.status_code", response.status_code)
+        if response.status_code >= 400:
+            span.set_attribute("error.type", str(response.status_code))
+            span.set_status(trace.Status(trace.StatusCode.ERROR))
+    if error is not None:
+        span.record_exception(error)
+        span.set_attribute("error.type", type(error).__qualname__)
+        span.set_status(trace.Status(trace.StatusCode.ERROR, str(error)))
+    span.end()
+
+
+@contextmanager
+def use_span(span: Any) -> Iterator[Any]:
+    """Make `span` current without ending it on exit."""
+    if span is None:
+        yield None
+        return
+    with trace.use_span(span, end_on_exit=False, record_exception=False, set_status_on_exception=False):
+        yield span
+
+
+@contextmanager
+def span(name: str, attributes: Optional[Dict[str, Any]] = None) -> Iterator[Any]:
+    """Current INTERNAL span around a block; yields None without opentelemetry."""
+    if trace is None:
+        yield None
+        return
+    with get_tracer().start_as_current_span(name, attributes=attributes) as current:
+        yield current
+
+
+def start_span(name: str, attributes: Optional[Dict[str, Any]] = None) -> Any:
+    """INTERNAL span that is not made current, for work spread over generator steps."""
+    return get_tracer().start_span(name, attributes=attributes) if trace is not None else None
+
+
+def bind(func: Callable, parent: Any = None) -> Callable:
+    """`func` running under `parent` (default: the caller's current span) on any thread."""
+    if trace is None:
+        return func
+    context = trace.set_span_in_context(parent) if parent is not None else otel_context.get_current()
+
+    def bound(*args, **kwargs):
+        token = otel_context.attach(context)
+        try:
+            return func(*args, **kwargs)
+        finally:
+            otel_context.detach(token)
+
+    return bound
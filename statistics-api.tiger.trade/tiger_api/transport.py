@@ -0,0 +1,222 @@
+"""
+Tiger Trade API - Transport
+
+Every HTTP call (data endpoints, token probe, login and refresh) goes through
+one shared requests.Session. Its adapter keeps a connection pool per host, so
+x-api, auth-api and the statistics gateway each reuse their TCP+TLS
+connections instead of opening one per call. The session asks for
+compressed bodies, and the BandwidthMeter counts their wire and decoded
+sizes. Each attempt first takes a token from the shared RateLimiter, and
+transient failures are retried according to the shared RetryPolicy. GETs
+to slow-changing endpoints go through the HttpCache first, so fresh or
+revalidated bodies skip both, and an optional ResponseCache in front of
+everything records and replays whole responses (offline mode never reaches
+the network). Each request emits start/retry/cache_hit/end events to
+`transport.hooks`, which the MetricsCollector turns into per-endpoint
+latency, status and byte metrics, and carries its own request id and,
+with OpenTelemetry, its own span (see tracing.py).
+"""
+
+import json
+import threading
+from typing import Dict, Any, Iterable, List, Optional, Union
+
+from .bandwidth import BandwidthMeter, accept_encoding
+from .exceptions import TigerTradeAPIException
+from .hooks import Hooks
+from .http_cache import HttpCache
+from .lazy import lazy_import
+from .metrics import MetricsCollector
+from .ratelimit import RateLimiter
+from .response_cache import ResponseCache
+from .retry import RetryPolicy
+from .tracing import (REQUEST_ID_HEADERS, end_request_span, new_request_id, request_headers,
+                      start_request_span, use_span)
+
+requests = lazy_import("requests")
+
+# Number of per-host pools kept alive
+DEFAULT_POOL_CONNECTIONS = 10
+# Connections kept per host
+DEFAULT_POOL_MAXSIZE = 10
+
+
+class Transport:
+    def __init__(self, pool_connections: int = DEFAULT_POOL_CONNECTIONS,
+                 pool_maxsize: int = DEFAULT_POOL_MAXSIZE, keep_alive: bool = True,
+                 encodings: Union[List[str], bool, None] = None,
+                 request_id_headers: Iterable[str] = REQUEST_ID_HEADERS,
+                 retry_policy: Optional[RetryPolicy] = None,
+                 rate_limiter: Optional[RateLimiter] = None,
+                 http_cache: Optional[HttpCache] = None,
+                 response_cache: Optional[ResponseCache] = None,
+                 bandwidth: Optional[BandwidthMeter] = None,
+                 hooks: Optional[Hooks] = None,
+                 metrics: Optional[MetricsCollector] = None):
+        self.pool_connections = pool_connections
+        self.pool_maxsize = pool_maxsize
+        self.keep_alive = keep_alive
+        # Content encodings to ask for (None: every one that decodes here, False: none)
+        self.encodings = encodings
+        # Headers carrying each request's UUID (empty: send none)
+        self.request_id_headers = tuple(request_id_headers)
+        self.retry_policy = retry_policy
+        self.rate_limiter = rate_limiter
+        self.http_cache = http_cache
+        self.response_cache = response_cache
+        self.bandwidth = bandwidth
+        self.hooks = hooks if hooks is not None else Hooks()
+        self.metrics = metrics
+        if metrics is not None:
+            self.hooks.subscribe(metrics)
+
+        self._session = None
+        self._session_lock = threading.Lock()
+
+    @property
+    def session(self) -> "requests.Session":
+        # Created on first network use, so cache hits never load requests
+        if self._session is None:
+            with self._session_lock:
+                if self._session is None:
+                    from requests.adapters import HTTPAdapter
+                    session = requests.Session()
+                    adapter = HTTPAdapter(pool_connections=self.pool_connections, pool_maxsize=self.pool_maxsize)
+                    session.mount('https://', adapter)
+                    session.mount('http://', adapter)
+                    if not self.keep_alive:
+                        session.headers['Connection'] = 'close'
+                    session.headers['Accept-Encoding'] = accept_encoding(self.encodings)
+                    self._session = session
+        return self._session
+
+    @classmethod
+    def from_config(cls, api_config: Dict[str, Any]) -> "Transport":
+        return cls(**_transport_options(api_config),
+                   retry_policy=RetryPolicy.from_config(api_config),
+                   rate_limiter=RateLimiter.from_config(api_config),
+                   http_cache=HttpCache.from_config(api_config),
+                   response_cache=ResponseCache.from_config(api_config),
+                   bandwidth=BandwidthMeter.from_config(api_config),
+                   hooks=Hooks.from_config(api_config),
+                   metrics=MetricsCollector.from_config(api_config))
+
+    @property
+    def offline(self) -> bool:
+        return self.response_cache is not None and self.response_cache.offline
+
+    def request(self, method: str, url: str, retry: bool = True, cache: bool = True,
+                **kwargs) -> "requests.Response":
+        request_id = new_request_id() if self.request_id_headers else None
+        context = self.hooks.start(method, url, request_id=request_id)
+        context["span"] = start_request_span(context["method"], url, context["template"], request_id)
+        # Which cache answered, if the response turns out to be cached
+        served_by = "response"
+
+        def send() -> "requests.Response":
+            nonlocal served_by
+            served_by = "http"
+            if cache and self.http_cache is not None and method.upper() == 'GET':
+                def send_conditional(headers: Dict[str, str]) -> "requests.Response":
+                    return self._send(method, url, retry, context, **dict(kwargs, headers=headers))
+                return self.http_cache.request(url, kwargs.get('params'), kwargs.get('headers'), send_conditional)
+            return self._send(method, url, retry, context, **kwargs)
+
+        try:
+            with use_span(context["span"]):
+                kwargs['headers'] = request_headers(kwargs.get('headers'), request_id, self.request_id_headers)
+                if self.response_cache is not None and cache:
+                    response = self.response_cache.request(
+                        method, url, kwargs.get('params'), kwargs.get('headers'), send)
+                elif self.response_cache is not None and self.response_cache.offline:
+                    raise TigerTradeAPIException(f"Offline: {method} {url} bypasses the cache")
+                else:
+                    response = send()
+        except Exception as e:
+            self._end(context, error=e)
+            raise
+
+        if getattr(response, 'from_cache', False):
+            if context["span"] is not None:
+                context["span"].set_attribute("tiger_api.cache", served_by)
+            self.hooks.emit("cache_hit", context, cache=served_by, revalidated=context["attempts"] > 0)
+        elif kwargs.get('stream'):
+            # Ended by finish_stream() once the body has been read
+            response.hook_context = context
+            return response
+        self._end(context, response)
+        return response
+
+    def finish_stream(self, response: "requests.Response", decoded_bytes: Optional[int] = None):
+        """Account a streamed response after its body was read (`decoded_bytes` of it) or abandoned."""
+        if self.bandwidth is not None:
+            self.bandwidth.record_response(response, decoded_bytes)
+        context = getattr(response, 'hook_context', None)
+        if context is not None:
+            del response.hook_context
+            self._end(context, response, decoded_bytes=decoded_bytes)
+
+    def _end(self, context: Dict[str, Any], response: Any = None, error: Optional[BaseException] = None,
+             decoded_bytes: Optional[int] = None):
+        end_request_span(context["span"], response, error, context["attempts"])
+        self.hooks.end(context, response, error, decoded_bytes)
+
+    def _send(self, method: str, url: str, retry: bool, context: Dict[str, Any],
+              **kwargs) -> "requests.Response":
+        def send() -> "requests.Response":
+            context["attempts"] += 1
+            if self.rate_limiter is not None:
+                self.rate_limiter.acquire(url)
+            response = self.session.request(method=method, url=url, **kwargs)
+            if self.rate_limiter is not None:
+                self.rate_limiter.on_response(url, response.status_code)
+            # Streamed bodies are counted by finish_stream()
+            if self.bandwidth is not None and not kwargs.get('stream'):
+                self.bandwidth.record_response(response)
+            return response
+
+        def on_retry(error_class: str, attempt: int, delay: float):
+            if context["span"] is not None:
+                context["span"].add_event("retry", {"error_class": error_class, "attempt": attempt, "delay": delay})
+            self.hooks.emit("retry", context, error_class=error_class, attempt=attempt, delay=delay)
+
+        if retry and self.retry_policy is not None:
+            return self.retry_policy.send(method, send, on_retry)
+        return send()
+
+    def close(self):
+        if self._session is not None:
+            self._session.close()
+
+
+def _transport_options(api_config: Dict[str, Any]) -> Dict[str, Any]:
+    return {
+        "pool_connections": api_config.get('pool_connections', DEFAULT_POOL_CONNECTIONS),
+        "pool_maxsize": api_config.get('pool_maxsize', DEFAULT_POOL_MAXSIZE),
+        "keep_alive": api_config.get('keep_alive', True),
+        "encodings": api_config.get('accept_encoding'),
+        "request_id_headers": list(api_config.get('request_id_headers', REQUEST_ID_HEADERS)),
+    }
+
+
+_transports: Dict[str, Transport] = {}
+_transports_lock = threading.Lock()
+
+
+def get_transport(api_config: Dict[str, Any]) -> Transport:
+    """Return the process-wide transport for these pool, retry, rate, cache and metrics settings."""
+    key = json.dumps([
+        _transport_options(api_config),
+        RetryPolicy.options_from_config(api_config),
+        RateLimiter.options_from_config(api_config),
+        HttpCache.options_from_config(api_config),
+        ResponseCache.options_from_config(api_config),
+        BandwidthMeter.options_from_config(api_config),
+        Hooks.options_from_config(api_config),
+        MetricsCollector.options_from_config(api_config),
+    ], sort_keys=True)
+    with _transports_lock:
+        transport = _transports.get(key)
+        if transport is None:
+            transport = _transports[key] = Transport.from_config(api_config)
+        return transport
@@ -0,0 +1,112 @@
+"""
+Tiger Trade API - Week Index
+
+Parsed view of an /analyzer/week-list response. Weeks are sorted by their
+`from` date into parallel interval arrays, so finding the week of a date is a
+bisect, and net_profit/count/win_count/volume are converted once into typed
+columns with prefix sums, so aggregating any run of weeks is O(log n)
+without re-fetching or re-parsing the list.
+"""
+
+from array import array
+from bisect import bisect_left, bisect_right
+from datetime import date
+from typing import Dict, Any, Iterable, List, Optional, Union
+
+from .local_analyzer import summary_metrics
+
+DateLike = Union[str, date]
+
+
+def _day(value: DateLike) -> str:
+    # ISO dates compare correctly as strings
+    return value.isoformat() if isinstance(value, date) else str(value)
+
+
+def _float(value: Any) -> float:
+    try:
+        return float(value)
+    except (TypeError, ValueError):
+        return 0.0
+
+
+def _int(value: Any) -> int:
+    try:
+        return int(value)
+    except (TypeError, ValueError):
+        return 0
+
+
+class WeekIndex:
+    def __init__(self, weeks: Iterable[Dict[str, Any]]):
+        self.weeks: List[Dict[str, Any]] = sorted(
+            (week for week in weeks if isinstance(week, dict) and week.get('from') and week.get('to')),
+            key=lambda week: week['from'],
+        )
+        self.starts = [week['from'] for week in self.weeks]
+        self.ends = [week['to'] for week in self.weeks]
+
+        self.net_profit = array('d', (_float(week.get('net_profit')) for week in self.weeks))
+        self.volume = array('d', (_float(week.get('volume')) for week in self.weeks))
+        self.count = array('q', (_int(week.get('count')) for week in self.weeks))
+        self.win_count = array('q', (_int(week.get('win_count')) for week in self.weeks))
+
+        # Prefix sums with a leading 0: sum(column[i:j]) == prefix[j] - prefix[i]
+        self._prefix = {
+            name: self._cumulative(getattr(self, name))
+            for name in ('net_profit', 'volume', 'count', 'win_count')
+        }
+
+    @staticmethod
+    def _cumulative(column: array) -> array:
+        prefix = array(column.typecode, [0])
+        total = 0
+        for value in column:
+            total += value
+            prefix.append(total)
+        return prefix
+
+    @classmethod
+    def from_response(cls, result: Dict[str, Any]) -> "WeekIndex":
+        data = result.get('data', []) if isinstance(result, dict) else []
+        return cls(data if isinstance(data, list) else [])
+
+    def __len__(self) -> int:
+        return len(self.weeks)
+
+    def find(self, day: DateLike) -> Optional[int]:
+        """Position of the week containing `day`, or None."""
+        day = _day(day)
+        i = bisect_right(self.starts, day) - 1
+        if i >= 0 and day <= self.ends[i]:
+            return i
+        return None
+
+    def week(self, day: DateLike) -> Optional[Dict[str, Any]]:
+        i = self.find(day)
+        return None if i is None else self.weeks[i]
+
+    def stats(self, i: int) -> Dict[str, Any]:
+        return self._stats(i, i + 1)
+
+    def week_stats(self, day: DateLike) -> Optional[Dict[str, Any]]:
+        i = self.find(day)
+        return None if i is None else self.stats(i)
+
+    def range_stats(self, date_from: DateLike, date_to: DateLike) -> Dict[str, Any]:
+        """Aggregate every week overlapping [date_from, date_to]."""
+        date_from, date_to = _day(date_from), _day(date_to)
+        # Weeks are disjoint and sorted, so their ends are sorted too
+        lo = bisect_left(self.ends, date_from)
+        hi = bisect_right(self.starts, date_to)
+        return self._stats(lo, max(lo, hi))
+
+    def _stats(self, lo: int, hi: int) -> Dict[str, Any]:
+        totals = {name: prefix[hi] - prefix[lo] for name, prefix in self._prefix.items()}
+        stats: Dict[str, Any] = {
+            "from": self.starts[lo] if hi > lo else None,
+            "to": self.ends[hi - 1] if hi > lo else None,
+            "weeks": hi - lo,
+        }
+        stats.update(summary_metrics(totals['net_profit'], totals['count'], totals['win_count'], totals['volume']))
+        return stats
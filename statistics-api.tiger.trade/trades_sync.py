@@ -0,0 +1,47 @@
+#!/usr/bin/env python3
+"""
+Tiger Trade API - Trades Sync (/trades -> local SQLite store)
+"""
+
+import os
+import sys
+
+from tiger_api import TigerTradeAPIException, TradeStore
+from tiger_api.serialization import dumps
+from trades import TradesAPI, CLOSED_TRADE_STATUSES
+
+# Store location; defaults to trades.sqlite3 next to config.json
+STORE_PATH = None
+
+
+def default_store_path() -> str:
+    script_dir = os.path.dirname(os.path.abspath(__file__))
+    return os.path.join(os.path.dirname(script_dir), "trades.sqlite3")
+
+
+def main():
+    print("Tiger Trade Trades Sync - /trades endpoint")
+    print("-" * 42)
+    
+    store_path = sys.argv[1] if len(sys.argv) > 1 else (STORE_PATH or default_store_path())
+    
+    try:
+        api = TradesAPI()
+        
+        with TradeStore(store_path, closed_statuses=CLOSED_TRADE_STATUSES) as store:
+            print(f"Store: {store_path}")
+            print(f"High watermark: {store.high_watermark()}")
+            print(f"Last date_to: {store.last_date_to()}")
+            
+            stats = store.sync(api)
+        
+        print(dumps(stats, indent=2))
+        
+    except TigerTradeAPIException as e:
+        print(f"API Error: {e}")
+    except Exception as e:
+        print(f"Error: {e}")
+
+
+if __name__ == "__main__":
+    main()